@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Log parser throughput benchmark.
+
+Generates a synthetic log archive (one file per day, in the checker's log format)
+and compares a line-by-line parser with the memory-mapped finditer fast path, a
+process pool and the parse cache (cold, then warm).
+
+    python3 benchmarks/bench_log_parser.py --size-mb 2048
+"""
+
+import argparse
+import contextlib
+import datetime
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from libs.plotter.log_parser import SUMMARY_PATTERN, _find_log_files, _parse_summary_file, _parse_files_in_pool  # noqa: E402
+from libs.plotter.parse_cache import LogParseCache, get_parse_cache_path  # noqa: E402
+
+
+WEBSITES = ['https://github.com', 'https://google.com', 'https://apple.com', 'https://reddit.com']
+
+
+def format_round(timestamp, wifi_network, success_count):
+    """Format one round the way the checker writes it."""
+    lines = [f"{timestamp:%Y-%m-%d %H:%M:%S} - WiFi: {wifi_network} - Internet: {success_count}/4 sites accessible\n"]
+    for i, url in enumerate(WEBSITES):
+        status = 'SUCCESS' if i < success_count else 'FAILED: <urlopen error timed out>'
+        lines.append(f"  (0.{i + 1}2s) - {url}: {status} [dns=0.012 connect=0.020 tls=0.045 ttfb=0.110]\n")
+    lines.append("Hostname: bench-host\n\n")
+    return ''.join(lines)
+
+
+def generate_archive(logs_dir, size_bytes):
+    """Write one-round-per-minute day files until the archive reaches size_bytes."""
+    host_dir = os.path.join(logs_dir, 'bench-host')
+    os.makedirs(host_dir)
+    day = datetime.datetime(2020, 1, 1)
+    written = 0
+    while written < size_bytes:
+        rounds = []
+        for minute in range(24 * 60):
+            wifi_network = 'GoTitansFC' if minute % 10 else 'OtherNetwork'
+            rounds.append(format_round(day + datetime.timedelta(minutes=minute), wifi_network, minute % 5))
+        content = ''.join(rounds).encode('utf-8')
+        with open(os.path.join(host_dir, f"connectivity_log_{day:%Y%m%d}.txt"), 'wb') as f:
+            f.write(content)
+        written += len(content)
+        day += datetime.timedelta(days=1)
+    return written
+
+
+def time_parser(name, parse_file, log_files, total_bytes):
+    """Call parse_file for every entry of log_files and print throughput."""
+    data = []
+    start_time = time.perf_counter()
+    for log_file in log_files:
+        parse_file(log_file, 'GoTitansFC', data)
+    elapsed = time.perf_counter() - start_time
+    print(f"{name:<12} {elapsed:8.2f}s {total_bytes / elapsed / 1e6:9.1f} MB/s {len(data):>12,} points")
+    return data, elapsed
+
+
+def parse_lines(log_file, wifi_filter, data):
+    """Reference parser: read line by line and match each line with SUMMARY_PATTERN."""
+    with open(log_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            match = SUMMARY_PATTERN.match(line.strip())
+            if match and match.group(2).strip() == wifi_filter:
+                timestamp = datetime.datetime.strptime(match.group(1), '%Y-%m-%d %H:%M:%S')
+                total_sites = int(match.group(4))
+                data.append((timestamp, int(match.group(3)) / total_sites if total_sites > 0 else 0))
+
+
+def parse_with_cache(cache, last_file):
+    """Adapt _parse_summary_file with a LogParseCache to time_parser, saving the cache after the last file."""
+    def parse(log_file, wifi_filter, data):
+        _parse_summary_file(log_file, wifi_filter, data, cache)
+        if log_file == last_file:
+            cache.save()
+    return parse
+
+
+def parse_in_pool(jobs):
+    """Adapt _parse_files_in_pool (which takes all files at once) to time_parser."""
+    def parse(log_files, wifi_filter, data):
+        # Silence the per-file progress lines
+        with contextlib.redirect_stdout(io.StringIO()):
+            _parse_files_in_pool(log_files, wifi_filter, data, None, jobs)
+    return parse
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark log parsing throughput')
+    parser.add_argument('--size-mb', type=int, default=256, help='Synthetic archive size in MB (default: 256)')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count(),
+                        help='Processes for the process-pool run (default: CPU count)')
+    parser.add_argument('--keep', action='store_true', help='Keep the generated archive')
+    args = parser.parse_args()
+
+    logs_dir = tempfile.mkdtemp(prefix='bench_logs_')
+    try:
+        total_bytes = generate_archive(logs_dir, args.size_mb * 1000 * 1000)
+        log_files = _find_log_files(logs_dir, 'bench-host')
+        print(f"Archive: {len(log_files)} files, {total_bytes / 1e6:.0f} MB in {logs_dir}")
+
+        baseline, baseline_time = time_parser('line-by-line', parse_lines, log_files, total_bytes)
+        fast, fast_time = time_parser('mmap', _parse_summary_file, log_files, total_bytes)
+
+        pooled, pooled_time = time_parser(f'pool x{args.jobs}', parse_in_pool(args.jobs), [log_files], total_bytes)
+
+        # Cold: every file is scanned into a new cache; warm: a fresh LogParseCache loads the saved file and reads no log file
+        cache_path = get_parse_cache_path(logs_dir, 'bench-host')
+        cold, cold_time = time_parser('cache cold', parse_with_cache(LogParseCache(cache_path), log_files[-1]),
+                                      log_files, total_bytes)
+        start_time = time.perf_counter()
+        warm_cache = LogParseCache(cache_path)
+        load_time = time.perf_counter() - start_time
+        warm, warm_time = time_parser('cache warm', parse_with_cache(warm_cache, log_files[-1]), log_files, total_bytes)
+        print(f"{'cache load':<12} {load_time:8.2f}s")
+
+        if not (fast == baseline == pooled == cold == warm):
+            print("ERROR: parsers returned different results")
+            sys.exit(1)
+        print(f"Speedup: mmap {baseline_time / fast_time:.1f}x, pool {baseline_time / pooled_time:.1f}x, "
+              f"warm cache {baseline_time / (load_time + warm_time):.1f}x")
+    finally:
+        if args.keep:
+            print(f"Kept archive in {logs_dir}")
+        else:
+            shutil.rmtree(logs_dir)
+
+
+if __name__ == '__main__':
+    main()
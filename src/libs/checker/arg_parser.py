@@ -0,0 +1,24 @@
+import argparse
+from .daemon import DEFAULT_PROBE_INTERVAL, DEFAULT_GIT_INTERVAL
+from .site_checker import ENGINES
+from .sqlite_sink import DEFAULT_DB_PATH
+
+
+def create_checker_argument_parser():
+    """Create and configure argument parser for the connectivity checker."""
+    parser = argparse.ArgumentParser(description='Check internet connectivity and log the results')
+    parser.add_argument('--daemon', action='store_true',
+                       help='Keep running and probe on an internal schedule instead of exiting after one round')
+    parser.add_argument('--interval', type=int, default=DEFAULT_PROBE_INTERVAL,
+                       help=f'Seconds between probe rounds in daemon mode (default: {DEFAULT_PROBE_INTERVAL})')
+    parser.add_argument('--git-interval', type=int, default=DEFAULT_GIT_INTERVAL,
+                       help=f'Seconds between git log pushes in daemon mode (default: {DEFAULT_GIT_INTERVAL})')
+    parser.add_argument('--engine', choices=ENGINES, default='threads',
+                       help='Probe engine: one thread per site, a single asyncio event loop, or keep-alive connections '
+                            'reused between daemon rounds (default: threads)')
+    parser.add_argument('--sqlite', nargs='?', const=DEFAULT_DB_PATH, metavar='PATH',
+                       help=f'Also record results in a SQLite database (default path: {DEFAULT_DB_PATH})')
+    # Internal: used by the detached process that pushes logs to git in the background
+    parser.add_argument('--git-sync-worker', action='store_true', help=argparse.SUPPRESS)
+    
+    return parser
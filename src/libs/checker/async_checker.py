@@ -0,0 +1,175 @@
+import asyncio
+import socket
+import ssl
+import sys
+import urllib.parse
+from .probe_timing import PhaseTimer, get_ssl_context
+
+
+# Match the urllib engine's per-site timeout and redirect behaviour so both engines log the same statuses
+DEFAULT_TIMEOUT = 5
+MAX_REDIRECTS = 10
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+USER_AGENT = f"Python-urllib/{sys.version_info[0]}.{sys.version_info[1]}"
+
+
+def status_from_code(code, reason):
+    """Convert an HTTP status code into the status string the urllib engine would log."""
+    if code == 200:
+        return 'SUCCESS'
+    if code >= 400:
+        # urllib raises HTTPError (a URLError) for these, which check_single_site logs as a failure
+        return f'FAILED: HTTP Error {code}: {reason}'
+    return f'HTTP_{code}'
+
+
+async def _read_headers(reader):
+    """Read response headers up to the blank line and return them as a lowercase-keyed dict."""
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            return headers
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+
+
+async def _open_timed_connection(host, port, ssl_context, server_hostname, timer):
+    """Open a stream connection, recording dns, connect and tls phases."""
+    loop = asyncio.get_running_loop()
+
+    start_time = timer.clock()
+    addresses = await loop.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    timer.add('dns', start_time)
+
+    start_time = timer.clock()
+    last_error = OSError(f"No addresses found for {host}")
+    for family, socktype, proto, _, address in addresses:
+        sock = socket.socket(family, socktype, proto)
+        sock.setblocking(False)
+        try:
+            await loop.sock_connect(sock, address)
+            break
+        except OSError as e:
+            sock.close()
+            last_error = e
+        except BaseException:
+            sock.close()
+            raise
+    else:
+        timer.add('connect', start_time)
+        raise last_error
+    timer.add('connect', start_time)
+
+    if ssl_context is None:
+        return await asyncio.open_connection(sock=sock)
+
+    start_time = timer.clock()
+    try:
+        return await asyncio.open_connection(sock=sock, ssl=ssl_context, server_hostname=server_hostname)
+    except BaseException:
+        sock.close()
+        raise
+    finally:
+        timer.add('tls', start_time)
+
+
+async def _request_status(url, ssl_context, timer):
+    """Send one GET request over a new connection and return (code, reason, headers)."""
+    parts = urllib.parse.urlsplit(url)
+    is_https = parts.scheme == 'https'
+    host = parts.hostname
+    port = parts.port or (443 if is_https else 80)
+    path = parts.path or '/'
+    if parts.query:
+        path = f"{path}?{parts.query}"
+
+    reader, writer = await _open_timed_connection(
+        host, port, ssl_context if is_https else None, host, timer
+    )
+    try:
+        request = (
+            f"GET {path} HTTP/1.1\r\n"
+            f"Host: {parts.netloc}\r\n"
+            f"User-Agent: {USER_AGENT}\r\n"
+            f"Accept-Encoding: identity\r\n"
+            f"Connection: close\r\n\r\n"
+        )
+        writer.write(request.encode('ascii'))
+        await writer.drain()
+
+        start_time = timer.clock()
+        try:
+            status_line = await reader.readline()
+        finally:
+            timer.add('ttfb', start_time)
+        fields = status_line.decode('latin-1').split(None, 2)
+        if len(fields) < 2 or not fields[1].isdigit():
+            raise ConnectionError(f"Bad status line: {status_line!r}")
+        code = int(fields[1])
+        reason = fields[2].strip() if len(fields) > 2 else ''
+        headers = await _read_headers(reader)
+        return code, reason, headers
+    finally:
+        writer.close()
+
+
+async def check_single_site_async(url, ssl_context, timer):
+    """Check connectivity to a single website without blocking the event loop."""
+    start_time = timer.clock()
+    try:
+        current_url = url
+        for _ in range(MAX_REDIRECTS + 1):
+            code, reason, headers = await _request_status(current_url, ssl_context, timer)
+            if code not in REDIRECT_CODES or 'location' not in headers:
+                break
+            current_url = urllib.parse.urljoin(current_url, headers['location'])
+        else:
+            raise ConnectionError("Too many redirects")
+        status = status_from_code(code, reason)
+    except (OSError, ssl.SSLError) as e:
+        status = f'FAILED: <urlopen error {e}>'
+    except Exception as e:
+        status = f'FAILED: {str(e)}'
+
+    return {
+        'url': url,
+        'status': status,
+        'duration': timer.clock() - start_time,
+        'phases': timer.phases
+    }
+
+
+async def _check_sites(websites, timeout):
+    """Probe all websites concurrently under one shared deadline."""
+    loop = asyncio.get_running_loop()
+    ssl_context = get_ssl_context()
+    start_time = loop.time()
+
+    timers = [PhaseTimer() for _ in websites]
+    tasks = [asyncio.ensure_future(check_single_site_async(url, ssl_context, timer))
+             for url, timer in zip(websites, timers)]
+    done, pending = await asyncio.wait(tasks, timeout=timeout)
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.wait(pending)
+
+    checks = []
+    for url, task, timer in zip(websites, tasks, timers):
+        if task in done and task.exception() is None:
+            checks.append(task.result())
+        else:
+            # Keep whatever phases completed before the deadline hit
+            checks.append({
+                'url': url,
+                'status': 'FAILED: timed out',
+                'duration': loop.time() - start_time,
+                'phases': timer.phases
+            })
+    return checks
+
+
+def check_sites_async(websites, timeout=DEFAULT_TIMEOUT):
+    """Check all websites on one asyncio event loop and return check dicts in website order."""
+    return asyncio.run(_check_sites(websites, timeout))
@@ -0,0 +1,139 @@
+import http.client
+import threading
+import time
+import urllib.parse
+from .async_checker import status_from_code, MAX_REDIRECTS, REDIRECT_CODES, USER_AGENT, DEFAULT_TIMEOUT
+from .probe_timing import PhaseTimer, TimedHTTPConnection, TimedHTTPSConnection, get_ssl_context
+
+
+# Errors that mean the server dropped an idle keep-alive connection, not that the site is down
+STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+
+class ProbeConnectionPool:
+    """Keep one keep-alive connection per target host and probe request round-trips over it.
+
+    TLS sessions are cached per host so that reconnecting after the server closes
+    an idle connection resumes the session instead of doing a full handshake.
+    """
+
+    def __init__(self, timeout=DEFAULT_TIMEOUT):
+        self.timeout = timeout
+        self._connections = {}
+        self._tls_sessions = {}
+        self._locks = {}
+        self._pool_lock = threading.Lock()
+
+    def _lock_for(self, key):
+        """Get the lock serializing requests on one pooled connection."""
+        with self._pool_lock:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def _get_connection(self, key, timer):
+        """Get the pooled connection for key, creating it if needed."""
+        scheme, host, port = key
+        conn = self._connections.get(key)
+        if conn is None:
+            if scheme == 'https':
+                conn = TimedHTTPSConnection(host, port, timeout=self.timeout, context=get_ssl_context(),
+                                            phase_timer=timer, tls_session=self._tls_sessions.get(key))
+            else:
+                conn = TimedHTTPConnection(host, port, timeout=self.timeout, phase_timer=timer)
+            self._connections[key] = conn
+        conn.phase_timer = timer
+        return conn
+
+    def _save_tls_session(self, key, conn):
+        """Remember the connection's current TLS session for resuming later connections.
+
+        Under TLS 1.3 the session ticket arrives after the handshake, so the session
+        is read from the socket once a response has been received rather than at connect.
+        """
+        session = getattr(getattr(conn, 'sock', None), 'session', None) or getattr(conn, 'tls_session', None)
+        if session is not None:
+            conn.tls_session = session
+            self._tls_sessions[key] = session
+
+    def _discard(self, key):
+        """Close and forget the pooled connection for key, keeping its TLS session."""
+        conn = self._connections.pop(key, None)
+        if conn is not None:
+            self._save_tls_session(key, conn)
+            conn.close()
+
+    def _request(self, url, timer):
+        """Send a GET request (like the other engines) over the pooled connection and return (code, reason, location, reused)."""
+        parts = urllib.parse.urlsplit(url)
+        port = parts.port or (443 if parts.scheme == 'https' else 80)
+        key = (parts.scheme, parts.hostname, port)
+        path = parts.path or '/'
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        headers = {'User-Agent': USER_AGENT, 'Accept-Encoding': 'identity', 'Connection': 'keep-alive'}
+
+        with self._lock_for(key):
+            for attempt in range(2):
+                conn = self._get_connection(key, timer)
+                reused = conn.sock is not None
+                try:
+                    conn.request('GET', path, headers=headers)
+                    response = conn.getresponse()
+                    # The body must be consumed before the connection can carry the next request
+                    response.read()
+                except STALE_CONNECTION_ERRORS:
+                    self._discard(key)
+                    if reused and attempt == 0:
+                        # Server closed the idle connection - retry once on a fresh one
+                        continue
+                    raise
+                except Exception:
+                    self._discard(key)
+                    raise
+
+                if response.will_close:
+                    self._discard(key)
+                else:
+                    self._save_tls_session(key, conn)
+                return response.status, response.reason, response.getheader('Location'), reused
+
+    def check(self, url):
+        """Check connectivity to a single website over its pooled connection."""
+        timer = PhaseTimer()
+        start_time = time.monotonic()
+        reused = False
+        try:
+            current_url = url
+            for hop in range(MAX_REDIRECTS + 1):
+                code, reason, location, hop_reused = self._request(current_url, timer)
+                if hop == 0:
+                    reused = hop_reused
+                if code not in REDIRECT_CODES or not location:
+                    break
+                current_url = urllib.parse.urljoin(current_url, location)
+            else:
+                raise ConnectionError("Too many redirects")
+            status = status_from_code(code, reason)
+        except OSError as e:
+            status = f'FAILED: <urlopen error {e}>'
+        except Exception as e:
+            status = f'FAILED: {str(e)}'
+
+        return {
+            'url': url,
+            'status': status,
+            'duration': time.monotonic() - start_time,
+            'phases': timer.phases,
+            'reused': reused
+        }
+
+    def close(self):
+        """Close every pooled connection."""
+        with self._pool_lock:
+            for key in list(self._connections):
+                self._discard(key)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
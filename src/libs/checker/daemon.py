@@ -0,0 +1,165 @@
+import datetime
+import signal
+import sqlite3
+import sys
+import threading
+import time
+from .site_checker import check_connectivity
+from .connection_pool import ProbeConnectionPool
+from .wifi import WifiNetworkCache
+from .logging import get_log_file_path, write_log_entry, print_summary
+from .sqlite_sink import ResultsDatabase
+from .git_sync import start_git_sync_thread
+from .outages import OutageDetector
+
+
+# Default cadences for daemon mode (seconds)
+DEFAULT_PROBE_INTERVAL = 60
+DEFAULT_GIT_INTERVAL = 3600
+
+
+class DailyLogWriter:
+    """Keep today's log file open between rounds, reopening it when the date rolls over."""
+
+    def __init__(self):
+        self._path = None
+        self._file = None
+
+    def write(self, results):
+        """Append one round of results and flush it to disk."""
+        path = get_log_file_path()
+        if path != self._path:
+            self.close()
+            self._file = open(path, 'a')
+            self._path = path
+
+        write_log_entry(self._file, results)
+        self._file.flush()
+
+    def close(self):
+        """Close the currently open log file, if any."""
+        if self._file is not None:
+            self._file.close()
+        self._file = None
+        self._path = None
+
+
+def next_deadline(previous_deadline, interval, now):
+    """Get the next fixed-rate deadline after now, skipping rounds that were missed."""
+    deadline = previous_deadline + interval
+    if deadline <= now:
+        # We overran (e.g. laptop was asleep) - realign instead of firing a burst of rounds
+        missed = int((now - deadline) // interval) + 1
+        deadline += missed * interval
+    return deadline
+
+
+class CheckerDaemon:
+    """Long-running checker that probes on an internal schedule and syncs git on a slower cadence."""
+
+    def __init__(self, probe_interval=DEFAULT_PROBE_INTERVAL, git_interval=DEFAULT_GIT_INTERVAL,
+                 websites=None, engine='threads', sqlite_path=None, clock=time.monotonic):
+        self.probe_interval = probe_interval
+        self.git_interval = git_interval
+        self.websites = websites
+        self.engine = engine
+        self.clock = clock
+        # Keep-alive connections (and TLS sessions) survive between rounds in pooled mode
+        self.connection_pool = ProbeConnectionPool() if engine == 'pooled' else None
+        self.wifi_cache = WifiNetworkCache()
+        self._git_thread = None
+        self.log_writer = DailyLogWriter()
+        # Optional SQLite sink written alongside the text log
+        self.results_db = ResultsDatabase(sqlite_path) if sqlite_path else None
+        # Follows outages across rounds without re-reading the logs
+        self.outage_detector = OutageDetector()
+        self.last_results = None
+        self.rounds = 0
+        self._stop_event = threading.Event()
+
+    def run_round(self):
+        """Run one probe round and record its results."""
+        results = check_connectivity(self.websites, engine=self.engine, pool=self.connection_pool,
+                                     wifi_provider=self.wifi_cache.get)
+        self.log_writer.write(results)
+        if self.results_db is not None:
+            try:
+                self.results_db.write(results)
+            except (OSError, sqlite3.Error) as e:
+                print(f"DEBUG: Could not write results to {self.results_db.db_path}: {e}")
+        print_summary(results)
+        self.track_outages(results)
+        sys.stdout.flush()
+
+        self.last_results = results
+        self.rounds += 1
+        return results
+
+    def track_outages(self, results):
+        """Feed a round to the outage detector and report outages as they start and end."""
+        checks = results['checks']
+        failed_sites = [check['url'] for check in checks if check['status'] != 'SUCCESS']
+        success_rate = (len(checks) - len(failed_sites)) / len(checks) if checks else 0
+        timestamp = datetime.datetime.strptime(results['timestamp'], '%Y-%m-%d %H:%M:%S')
+
+        was_in_outage = self.outage_detector.in_outage
+        episode = self.outage_detector.update(timestamp, success_rate, failed_sites)
+        if episode is not None:
+            print(f"Outage ended: {episode.start} to {episode.end} ({episode.duration}), "
+                  f"up to {episode.severity:.0%} of sites down")
+        elif self.outage_detector.in_outage and not was_in_outage:
+            print(f"Outage started at {self.outage_detector.current_start}")
+
+    def sync_git(self):
+        """Start a background git sync unless the previous one is still running."""
+        if self._git_thread is not None and self._git_thread.is_alive():
+            print("DEBUG: Previous git sync still running - skipping")
+            return
+        self._git_thread = start_git_sync_thread()
+
+    def stop(self):
+        """Ask the run loop to exit after the current step."""
+        self._stop_event.set()
+
+    def run(self, max_rounds=None):
+        """Run probe rounds until stopped (or until max_rounds have completed)."""
+        next_probe = self.clock()
+        next_git = next_probe + self.git_interval
+
+        try:
+            while not self._stop_event.is_set():
+                if self.clock() >= next_probe:
+                    self.run_round()
+                    next_probe = next_deadline(next_probe, self.probe_interval, self.clock())
+                    if max_rounds is not None and self.rounds >= max_rounds:
+                        break
+
+                if self.clock() >= next_git:
+                    self.sync_git()
+                    next_git = next_deadline(next_git, self.git_interval, self.clock())
+
+                self._stop_event.wait(max(0.0, min(next_probe, next_git) - self.clock()))
+        finally:
+            self.log_writer.close()
+            if self.results_db is not None:
+                self.results_db.close()
+            if self.connection_pool is not None:
+                self.connection_pool.close()
+
+
+def run_daemon(probe_interval=DEFAULT_PROBE_INTERVAL, git_interval=DEFAULT_GIT_INTERVAL, websites=None, engine='threads',
+               sqlite_path=None):
+    """Run the checker as a single long-lived process until interrupted or terminated."""
+    daemon = CheckerDaemon(probe_interval, git_interval, websites, engine, sqlite_path)
+
+    # launchd stops jobs with SIGTERM - exit the loop cleanly so the log file gets closed
+    signal.signal(signal.SIGTERM, lambda signum, frame: daemon.stop())
+
+    print(f"Starting checker daemon: probe every {probe_interval}s ({engine} engine), git sync every {git_interval}s")
+    sys.stdout.flush()
+    try:
+        daemon.run()
+    except KeyboardInterrupt:
+        pass
+    print("Checker daemon stopped")
+    return daemon
@@ -1,12 +1,40 @@
+import hashlib
+import os
 import subprocess
 import socket
 import datetime
+from .state import get_state_path, load_state, save_state
+
+
+# Network git commands (pull/push) give up after this many seconds instead of hanging offline
+GIT_NETWORK_TIMEOUT = 120
+
+# Fingerprint of past-day log files as of the last successful push
+PUSH_STATE_FILE = 'git_push.json'
+
+
+def _get_log_fingerprint(hostname, today_file):
+    """Fingerprint past-day log files in logs/{hostname}/ from their names, sizes and mtimes."""
+    log_dir = f'logs/{hostname}'
+    try:
+        entries = sorted(os.scandir(log_dir), key=lambda entry: entry.name)
+    except OSError:
+        return None
+    
+    parts = []
+    for entry in entries:
+        file_path = f'{log_dir}/{entry.name}'
+        if (entry.name.startswith('connectivity_log_') and entry.name.endswith('.txt')
+                and file_path != today_file):
+            stat = entry.stat()
+            parts.append(f"{entry.name}:{stat.st_size}:{stat.st_mtime_ns}")
+    return hashlib.sha1('\n'.join(parts).encode()).hexdigest()
 
 
 def _get_git_status(hostname):
-    """Get git status for hostname log directory."""
+    """Get git status (with branch tracking info) for hostname log directory."""
     try:
-        result = subprocess.run(['git', 'status', '--porcelain', f'logs/{hostname}/'], 
+        result = subprocess.run(['git', 'status', '--porcelain', '--branch', '--', f'logs/{hostname}/'], 
                               check=True, capture_output=True, text=True)
         return result.stdout.strip()
     except subprocess.CalledProcessError as e:
@@ -40,10 +68,11 @@ def _find_past_day_log_files(git_status_output, hostname, today_file):
 
 
 def _add_files_to_git(files_to_add):
-    """Add files to git staging area."""
+    """Add files to git staging area with a single git invocation."""
+    if not files_to_add:
+        return True
     try:
-        for file_path in files_to_add:
-            subprocess.run(['git', 'add', file_path], check=True, capture_output=True)
+        subprocess.run(['git', 'add', '--', *files_to_add], check=True, capture_output=True)
         return True
     except subprocess.CalledProcessError as e:
         print(f"DEBUG: Git add failed: {e}")
@@ -61,6 +90,17 @@ def _commit_files(hostname):
         return False
 
 
+def _has_unpushed_commits(git_status_output):
+    """Check the '## branch...upstream [ahead N]' header of git status --branch for unpushed commits (on any path)."""
+    header = git_status_output.split('\n', 1)[0]
+    if not header.startswith('## '):
+        return True
+    if '...' not in header or '[gone]' in header:
+        # No upstream to compare against - assume there might be unpushed commits
+        return True
+    return '[ahead ' in header
+
+
 def _check_unpushed_commits(hostname):
     """Check if there are unpushed commits that affect logs/{hostname}."""
     try:
@@ -74,71 +114,85 @@ def _check_unpushed_commits(hostname):
         return True
 
 
+def _has_unpushed_log_commits(git_status_output, hostname):
+    """Check for unpushed commits that affect logs/{hostname}.
+    
+    The branch header already in the git status output rules out the common case
+    (nothing ahead) without another git call; only then is the path-scoped log run.
+    """
+    if not _has_unpushed_commits(git_status_output):
+        return False
+    return _check_unpushed_commits(hostname)
+
+
 def _pull_and_push(files_count):
     """Pull with rebase and push to remote."""
     # Pull with rebase to avoid merge conflicts
     try:
-        subprocess.run(['git', 'pull', '--rebase'], check=True, capture_output=True)
-    except subprocess.CalledProcessError as e:
+        subprocess.run(['git', 'pull', '--rebase'], check=True, capture_output=True, timeout=GIT_NETWORK_TIMEOUT)
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
         print(f"DEBUG: Git pull failed (possibly network issue): {e}")
         # Continue anyway - we'll try to push
     
     # Push to remote
     try:
-        subprocess.run(['git', 'push'], check=True, capture_output=True)
-        print(f"DEBUG: Successfully pushed {files_count} past day log files")
+        subprocess.run(['git', 'push'], check=True, capture_output=True, timeout=GIT_NETWORK_TIMEOUT)
+        if files_count:
+            print(f"DEBUG: Successfully pushed {files_count} past day log files")
+        else:
+            print("DEBUG: Successfully pushed existing commits")
         return True
-    except subprocess.CalledProcessError as e:
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
         print(f"DEBUG: Git push failed (possibly network issue): {e}")
         return False
 
 
 def push_logs_to_git():
-    """Push log changes to remote repository for past days only (not today's file)."""
+    """Push log changes to remote repository for past days only (not today's file).
+    
+    Git is skipped entirely when the past-day log files are unchanged since the last
+    successful push. Returns False if git failed (e.g. offline), True otherwise.
+    """
     try:
         hostname = socket.gethostname()
         today_date = datetime.datetime.now().strftime('%Y%m%d')
         today_file = f"logs/{hostname}/connectivity_log_{today_date}.txt"
         
-        # First, check if there are any unpushed commits for this hostname
-        if _check_unpushed_commits(hostname):
-            print(f"DEBUG: Found unpushed commits for {hostname}, attempting to push...")
-            try:
-                subprocess.run(['git', 'pull', '--rebase'], check=True, capture_output=True)
-            except subprocess.CalledProcessError as e:
-                print(f"DEBUG: Git pull failed (possibly network issue): {e}")
-            
-            try:
-                subprocess.run(['git', 'push'], check=True, capture_output=True)
-                print(f"DEBUG: Successfully pushed existing commits for {hostname}")
-            except subprocess.CalledProcessError as e:
-                print(f"DEBUG: Git push failed (possibly network issue): {e}")
-                # Continue with normal flow to handle new changes
+        state_path = get_state_path(PUSH_STATE_FILE)
+        fingerprint = _get_log_fingerprint(hostname, today_file)
+        if fingerprint is not None and load_state(state_path).get('fingerprint') == fingerprint:
+            return True
         
-        # Get git status for hostname log directory
+        # One git call gives both the changed files and whether the branch is ahead of its upstream
         git_status_output = _get_git_status(hostname)
-        if not git_status_output:
-            return
+        if git_status_output is None:
+            return False
+        has_unpushed = _has_unpushed_log_commits(git_status_output, hostname)
         
         # Find past day log files with changes
         files_to_add = _find_past_day_log_files(git_status_output, hostname, today_file)
-        if not files_to_add:
-            return
-        
-        print(f"DEBUG: Found {len(files_to_add)} past day log files to push: {files_to_add}")
-        
-        # Add files to git
-        if not _add_files_to_git(files_to_add):
-            return
-        
-        # Commit files
-        if not _commit_files(hostname):
-            return
+        if files_to_add:
+            print(f"DEBUG: Found {len(files_to_add)} past day log files to push: {files_to_add}")
+            
+            if not _add_files_to_git(files_to_add):
+                return False
+            if not _commit_files(hostname):
+                return False
+            has_unpushed = True
         
         # Pull and push
-        _pull_and_push(len(files_to_add))
+        if has_unpushed:
+            if not files_to_add:
+                print(f"DEBUG: Found unpushed commits for {hostname}, attempting to push...")
+            if not _pull_and_push(len(files_to_add)):
+                return False
+        
+        if fingerprint is not None:
+            save_state(state_path, {'fingerprint': fingerprint})
+        return True
         
     except Exception as e:
         # Catch any other unexpected errors
         print(f"DEBUG: Unexpected error in push_logs_to_git(): {e}")
-        # Never let this function crash the main script
\ No newline at end of file
+        # Never let this function crash the main script
+        return False
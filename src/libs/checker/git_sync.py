@@ -0,0 +1,113 @@
+import fcntl
+import os
+import subprocess
+import sys
+import threading
+import time
+from .git import push_logs_to_git
+from .state import get_state_path, load_state, save_state
+
+
+# Never push more often than this, even when every sync succeeds (seconds)
+MIN_PUSH_INTERVAL = 900
+
+# While pushes keep failing (offline), wait 60s, 120s, 240s, ... up to an hour between attempts
+INITIAL_BACKOFF = 60
+MAX_BACKOFF = 3600
+
+SYNC_STATE_FILE = 'git_sync.json'
+SYNC_LOCK_FILE = 'git_sync.lock'
+
+
+def is_sync_due(state, now):
+    """Check whether the minimum interval or current backoff has elapsed."""
+    return now >= state.get('next_attempt_at', 0)
+
+
+def record_sync_result(state, success, now, min_interval=MIN_PUSH_INTERVAL):
+    """Update sync state after an attempt, scheduling the next one."""
+    state = dict(state)
+    state['last_attempt_at'] = now
+    if success:
+        state['failures'] = 0
+        state['last_success_at'] = now
+        state['next_attempt_at'] = now + min_interval
+    else:
+        state['failures'] = state.get('failures', 0) + 1
+        backoff = min(MAX_BACKOFF, INITIAL_BACKOFF * 2 ** (state['failures'] - 1))
+        state['next_attempt_at'] = now + max(backoff, 0)
+    return state
+
+
+def acquire_sync_lock(lock_path):
+    """Take the sync lock without blocking; return the open lock file, or None if another worker holds it."""
+    try:
+        os.makedirs(os.path.dirname(lock_path) or '.', exist_ok=True)
+        lock_file = open(lock_path, 'a+')
+    except OSError as e:
+        print(f"DEBUG: Could not open git sync lock {lock_path}: {e}")
+        return None
+
+    try:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        return None
+
+    lock_file.seek(0)
+    lock_file.truncate()
+    lock_file.write(f"{os.getpid()}\n")
+    lock_file.flush()
+    return lock_file
+
+
+def release_sync_lock(lock_file):
+    """Release a lock taken with acquire_sync_lock()."""
+    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+    lock_file.close()
+
+
+def run_git_sync(min_interval=MIN_PUSH_INTERVAL, clock=time.time):
+    """Push logs if due, holding the sync lock; returns True/False for the push, None if skipped."""
+    lock_file = acquire_sync_lock(get_state_path(SYNC_LOCK_FILE))
+    if lock_file is None:
+        print("DEBUG: Another git sync is already running - skipping")
+        return None
+
+    try:
+        state_path = get_state_path(SYNC_STATE_FILE)
+        state = load_state(state_path)
+        if not is_sync_due(state, clock()):
+            return None
+
+        success = push_logs_to_git()
+        state = record_sync_result(state, success, clock(), min_interval)
+        save_state(state_path, state)
+        if not success:
+            print(f"DEBUG: Git sync failed {state['failures']} time(s) in a row - "
+                  f"next attempt in {int(state['next_attempt_at'] - state['last_attempt_at'])}s")
+        return success
+    finally:
+        release_sync_lock(lock_file)
+
+
+def spawn_git_sync_worker(script_path, clock=time.time):
+    """Start a detached git sync process if a sync is due; returns True if one was started."""
+    # Cheap pre-check so we don't even spawn a process while backing off
+    if not is_sync_due(load_state(get_state_path(SYNC_STATE_FILE)), clock()):
+        return False
+
+    try:
+        subprocess.Popen([sys.executable, script_path, '--git-sync-worker'],
+                         stdin=subprocess.DEVNULL, start_new_session=True)
+        return True
+    except OSError as e:
+        print(f"DEBUG: Could not start git sync worker: {e}")
+        return False
+
+
+def start_git_sync_thread(min_interval=MIN_PUSH_INTERVAL):
+    """Run a git sync on a background thread (for the long-running daemon); returns the thread."""
+    thread = threading.Thread(target=run_git_sync, args=(min_interval,), name='git-sync', daemon=True)
+    thread.start()
+    return thread
@@ -3,31 +3,52 @@ import socket
 import os
 
 
+def get_log_file_path():
+    """Get today's log file path for this hostname, creating its directory if needed."""
+    hostname = socket.gethostname()
+    date_str = datetime.datetime.now().strftime('%Y%m%d')
+    log_dir = f'logs/{hostname}'
+    
+    # Create hostname directory if it doesn't exist
+    os.makedirs(log_dir, exist_ok=True)
+    
+    return f'{log_dir}/connectivity_log_{date_str}.txt'
+
+
+def format_phases(phases):
+    """Format per-phase timings as a log suffix like ' [dns=0.012 connect=0.020 tls=0.045 ttfb=0.110]'."""
+    if not phases:
+        return ''
+    parts = [f"{phase}={seconds:.3f}" for phase, seconds in phases.items() if seconds is not None]
+    if not parts:
+        return ''
+    return f" [{' '.join(parts)}]"
+
+
+def write_log_entry(f, results):
+    """Write one round of results to an already open log file."""
+    f.write(f"{results['timestamp']} - ")
+    success_count = sum(1 for check in results['checks'] if check['status'] == 'SUCCESS')
+    total_count = len(results['checks'])
+    f.write(f"WiFi: {results['wifi_network']} - Internet: {success_count}/{total_count} sites accessible\n")
+    
+    for check in results['checks']:
+        duration_str = f"({check['duration']:.2f}s)"
+        phases_str = format_phases(check.get('phases'))
+        f.write(f"  {duration_str} - {check['url']}: {check['status']}{phases_str}\n")
+    
+    # Add hostname at the end
+    hostname = socket.gethostname()
+    f.write(f"Hostname: {hostname}\n\n")
+
+
 def log_to_file(results, log_file=None):
     """Append results to log file."""
     if log_file is None:
-        hostname = socket.gethostname()
-        date_str = datetime.datetime.now().strftime('%Y%m%d')
-        log_dir = f'logs/{hostname}'
-        
-        # Create hostname directory if it doesn't exist
-        os.makedirs(log_dir, exist_ok=True)
-        
-        log_file = f'{log_dir}/connectivity_log_{date_str}.txt'
+        log_file = get_log_file_path()
     
     with open(log_file, 'a') as f:
-        f.write(f"{results['timestamp']} - ")
-        success_count = sum(1 for check in results['checks'] if check['status'] == 'SUCCESS')
-        total_count = len(results['checks'])
-        f.write(f"WiFi: {results['wifi_network']} - Internet: {success_count}/{total_count} sites accessible\n")
-        
-        for check in results['checks']:
-            duration_str = f"({check['duration']:.2f}s)"
-            f.write(f"  {duration_str} - {check['url']}: {check['status']}\n")
-        
-        # Add hostname at the end
-        hostname = socket.gethostname()
-        f.write(f"Hostname: {hostname}\n\n")
+        write_log_entry(f, results)
 
 
 def print_summary(results):
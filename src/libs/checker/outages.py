@@ -0,0 +1,213 @@
+"""
+Outage episode detection.
+
+Turns a sequence of probe rounds into outage episodes with run-length logic:
+an outage starts once min_failed_rounds consecutive rounds fail and ends once
+min_recovered_rounds consecutive rounds succeed again. The detector keeps a few
+counters (plus the sites affected by the current episode), so it can follow the
+checker daemon round by round or scan years of history in one pass.
+"""
+
+import datetime
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+
+# A round fails when fewer than this share of sites is accessible
+DEFAULT_MIN_SUCCESS_RATE = 0.5
+
+# Consecutive failed rounds that open an episode, and successful rounds that close it
+DEFAULT_MIN_FAILED_ROUNDS = 2
+DEFAULT_MIN_RECOVERED_ROUNDS = 2
+
+# Longer gaps between rounds (e.g. the laptop was asleep) count as neither up nor down time
+DEFAULT_MAX_GAP = datetime.timedelta(minutes=10)
+
+
+class OutageEpisode(NamedTuple):
+    """One outage: from its first failed round to its first recovered round."""
+    start: datetime.datetime
+    end: datetime.datetime
+    failed_rounds: int
+    severity: float
+    affected_sites: Tuple[str, ...]
+    ongoing: bool = False
+
+    @property
+    def duration(self) -> datetime.timedelta:
+        return self.end - self.start
+
+
+class OutageStats(NamedTuple):
+    """Summary of the rounds seen by an OutageDetector."""
+    episodes: int
+    uptime: datetime.timedelta
+    downtime: datetime.timedelta
+    longest: Optional[datetime.timedelta]
+    mttr: Optional[datetime.timedelta]
+    mtbf: Optional[datetime.timedelta]
+    availability: Optional[float]
+
+
+class OutageDetector:
+    """Single-pass outage episode detector with constant state."""
+
+    def __init__(self, min_success_rate: float = DEFAULT_MIN_SUCCESS_RATE,
+                 min_failed_rounds: int = DEFAULT_MIN_FAILED_ROUNDS,
+                 min_recovered_rounds: int = DEFAULT_MIN_RECOVERED_ROUNDS,
+                 max_gap: datetime.timedelta = DEFAULT_MAX_GAP):
+        self.min_success_rate = min_success_rate
+        self.min_failed_rounds = min_failed_rounds
+        self.min_recovered_rounds = min_recovered_rounds
+        self.max_gap = max_gap
+
+        self.in_outage = False
+        self._previous_time = None
+        self._previous_failed = False
+        # The current run of rounds that disagree with in_outage (a possible state change)
+        self._run_start = None
+        self._run_rounds = 0
+        self._run_time = datetime.timedelta(0)
+        # The current (or candidate) episode
+        self._episode_start = None
+        self._failed_rounds = 0
+        self._worst_success_rate = 1.0
+        self._affected_sites = set()
+
+        self.uptime = datetime.timedelta(0)
+        self.downtime = datetime.timedelta(0)
+        self.episodes = 0
+        self.total_repair_time = datetime.timedelta(0)
+        self.longest = None
+
+    @property
+    def current_start(self) -> Optional[datetime.datetime]:
+        """Start of the ongoing outage, or None."""
+        return self._episode_start if self.in_outage else None
+
+    def _reset_run(self):
+        self._run_start = None
+        self._run_rounds = 0
+        self._run_time = datetime.timedelta(0)
+
+    def _count_failure(self, success_rate: float, failed_sites: Iterable[str]):
+        self._failed_rounds += 1
+        self._worst_success_rate = min(self._worst_success_rate, success_rate)
+        self._affected_sites.update(failed_sites)
+
+    def _reset_episode(self):
+        self._episode_start = None
+        self._failed_rounds = 0
+        self._worst_success_rate = 1.0
+        self._affected_sites = set()
+
+    def _episode(self, end: datetime.datetime, ongoing: bool) -> OutageEpisode:
+        return OutageEpisode(self._episode_start, end, self._failed_rounds, 1.0 - self._worst_success_rate,
+                             tuple(sorted(self._affected_sites)), ongoing)
+
+    def update(self, timestamp: datetime.datetime, success_rate: float,
+               failed_sites: Iterable[str] = ()) -> Optional[OutageEpisode]:
+        """Add one round (in time order); returns the episode it ended, if any."""
+        failed = success_rate < self.min_success_rate
+
+        # The time since the previous round belongs to that round's state
+        if self._previous_time is not None:
+            elapsed = timestamp - self._previous_time
+            if datetime.timedelta(0) <= elapsed <= self.max_gap:
+                if self._previous_failed != self.in_outage:
+                    self._run_time += elapsed
+                elif self.in_outage:
+                    self.downtime += elapsed
+                else:
+                    self.uptime += elapsed
+        self._previous_time = timestamp
+        self._previous_failed = failed
+
+        finished = None
+        if not self.in_outage:
+            if failed:
+                if self._run_rounds == 0:
+                    self._run_start = timestamp
+                    self._reset_episode()
+                    self._episode_start = timestamp
+                self._run_rounds += 1
+                self._count_failure(success_rate, failed_sites)
+                if self._run_rounds >= self.min_failed_rounds:
+                    self.in_outage = True
+                    self.downtime += self._run_time
+                    self._reset_run()
+            elif self._run_rounds:
+                # Too short to be an outage
+                self.uptime += self._run_time
+                self._reset_run()
+                self._reset_episode()
+        else:
+            if not failed:
+                if self._run_rounds == 0:
+                    self._run_start = timestamp
+                self._run_rounds += 1
+                if self._run_rounds >= self.min_recovered_rounds:
+                    finished = self._episode(self._run_start, ongoing=False)
+                    self.in_outage = False
+                    self.uptime += self._run_time
+                    self._reset_run()
+                    self._reset_episode()
+                    self.episodes += 1
+                    self.total_repair_time += finished.duration
+                    if self.longest is None or finished.duration > self.longest:
+                        self.longest = finished.duration
+            else:
+                if self._run_rounds:
+                    # Recovery didn't hold
+                    self.downtime += self._run_time
+                    self._reset_run()
+                self._count_failure(success_rate, failed_sites)
+        return finished
+
+    def ongoing_episode(self) -> Optional[OutageEpisode]:
+        """The outage still in progress at the last round, if any."""
+        if not self.in_outage:
+            return None
+        return self._episode(self._previous_time, ongoing=True)
+
+    def stats(self) -> OutageStats:
+        """Compute MTTR, MTBF and availability from the rounds seen so far.
+
+        An ongoing outage counts as an episode and as downtime, but not towards MTTR.
+        """
+        # Time in an undecided run counts towards the current state
+        uptime = self.uptime + (self._run_time if not self.in_outage else datetime.timedelta(0))
+        downtime = self.downtime + (self._run_time if self.in_outage else datetime.timedelta(0))
+
+        ongoing = self.ongoing_episode()
+        episodes = self.episodes + (1 if ongoing else 0)
+        longest = self.longest
+        if ongoing is not None and (longest is None or ongoing.duration > longest):
+            longest = ongoing.duration
+
+        observed = uptime + downtime
+        return OutageStats(
+            episodes=episodes,
+            uptime=uptime,
+            downtime=downtime,
+            longest=longest,
+            mttr=self.total_repair_time / self.episodes if self.episodes else None,
+            mtbf=uptime / episodes if episodes else None,
+            availability=uptime / observed if observed else None
+        )
+
+
+def detect_outages(rounds: Iterable[Tuple[datetime.datetime, float]], **thresholds) -> Tuple[List[OutageEpisode], OutageStats]:
+    """Run an OutageDetector over (timestamp, success rate) rounds, e.g. from parse_log_files.
+
+    Returns the episodes (the last one possibly ongoing) and the resulting statistics.
+    """
+    detector = OutageDetector(**thresholds)
+    episodes = []
+    for timestamp, success_rate in rounds:
+        episode = detector.update(timestamp, success_rate)
+        if episode is not None:
+            episodes.append(episode)
+    ongoing = detector.ongoing_episode()
+    if ongoing is not None:
+        episodes.append(ongoing)
+    return episodes, detector.stats()
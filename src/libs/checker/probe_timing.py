@@ -0,0 +1,148 @@
+import http.client
+import socket
+import ssl
+import time
+import urllib.request
+
+
+# Probe phases in the order they happen on a connection
+PHASES = ('dns', 'connect', 'tls', 'ttfb')
+
+_ssl_context = None
+
+
+def get_ssl_context():
+    """Get the SSL context shared by all probes (loading CA certificates once per process)."""
+    global _ssl_context
+    if _ssl_context is None:
+        _ssl_context = ssl.create_default_context()
+    return _ssl_context
+
+
+class PhaseTimer:
+    """Accumulate per-phase durations (monotonic seconds) for one probe, across redirects."""
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self.phases = {phase: None for phase in PHASES}
+
+    def add(self, phase, start_time):
+        """Add the time elapsed since start_time to the given phase."""
+        elapsed = self.clock() - start_time
+        self.phases[phase] = (self.phases[phase] or 0.0) + elapsed
+
+
+def _connect_timed(conn, timer):
+    """Resolve and connect conn's socket, recording dns and connect phases."""
+    start_time = timer.clock()
+    addresses = socket.getaddrinfo(conn.host, conn.port, 0, socket.SOCK_STREAM)
+    timer.add('dns', start_time)
+
+    start_time = timer.clock()
+    last_error = OSError(f"No addresses found for {conn.host}")
+    for family, socktype, proto, _, address in addresses:
+        sock = socket.socket(family, socktype, proto)
+        try:
+            if conn.timeout is not socket._GLOBAL_DEFAULT_TIMEOUT:
+                sock.settimeout(conn.timeout)
+            if conn.source_address:
+                sock.bind(conn.source_address)
+            sock.connect(address)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            conn.sock = sock
+            break
+        except OSError as e:
+            sock.close()
+            last_error = e
+    else:
+        timer.add('connect', start_time)
+        raise last_error
+    timer.add('connect', start_time)
+
+    if conn._tunnel_host:
+        conn._tunnel()
+
+
+class TimedHTTPConnection(http.client.HTTPConnection):
+    """HTTPConnection that records dns, connect and ttfb phases."""
+
+    def __init__(self, *args, phase_timer, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.phase_timer = phase_timer
+
+    def connect(self):
+        _connect_timed(self, self.phase_timer)
+
+    def getresponse(self):
+        # The request has been sent by now; getresponse() blocks until the status line arrives
+        start_time = self.phase_timer.clock()
+        try:
+            return super().getresponse()
+        finally:
+            self.phase_timer.add('ttfb', start_time)
+
+
+class TimedHTTPSConnection(http.client.HTTPSConnection):
+    """HTTPSConnection that records dns, connect, tls and ttfb phases.
+
+    Pass tls_session to resume an earlier TLS session on connect; the session
+    negotiated on connect is kept in tls_session for the next connection.
+    """
+
+    def __init__(self, *args, phase_timer, tls_session=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.phase_timer = phase_timer
+        self.tls_session = tls_session
+
+    def connect(self):
+        _connect_timed(self, self.phase_timer)
+
+        server_hostname = self._tunnel_host or self.host
+        start_time = self.phase_timer.clock()
+        try:
+            self.sock = self._context.wrap_socket(self.sock, server_hostname=server_hostname,
+                                                  session=self.tls_session)
+        finally:
+            self.phase_timer.add('tls', start_time)
+        self.tls_session = self.sock.session
+
+    def getresponse(self):
+        start_time = self.phase_timer.clock()
+        try:
+            return super().getresponse()
+        finally:
+            self.phase_timer.add('ttfb', start_time)
+
+
+class TimedHTTPHandler(urllib.request.HTTPHandler):
+    """urllib handler that opens http:// URLs over TimedHTTPConnection."""
+
+    def __init__(self, phase_timer):
+        super().__init__()
+        self.phase_timer = phase_timer
+
+    def http_open(self, req):
+        return self.do_open(self._connection, req)
+
+    def _connection(self, *args, **kwargs):
+        return TimedHTTPConnection(*args, phase_timer=self.phase_timer, **kwargs)
+
+
+class TimedHTTPSHandler(urllib.request.HTTPSHandler):
+    """urllib handler that opens https:// URLs over TimedHTTPSConnection."""
+
+    def __init__(self, phase_timer, context=None):
+        super().__init__()
+        self.phase_timer = phase_timer
+        self.ssl_context = context or get_ssl_context()
+
+    def https_open(self, req):
+        return self.do_open(self._connection, req, context=self.ssl_context)
+
+    def _connection(self, *args, **kwargs):
+        return TimedHTTPSConnection(*args, phase_timer=self.phase_timer, **kwargs)
+
+
+def build_timed_opener(phase_timer):
+    """Build a urllib opener (redirects, proxies and errors as urlopen) that records probe phases."""
+    return urllib.request.build_opener(TimedHTTPHandler(phase_timer), TimedHTTPSHandler(phase_timer))
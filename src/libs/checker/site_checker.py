@@ -1,9 +1,12 @@
-import urllib.request
 import urllib.error
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor
 from .wifi import get_wifi_network
 from .timestamp import get_timestamp_info
+from .async_checker import check_sites_async
+from .probe_timing import PhaseTimer, build_timed_opener
+from .connection_pool import ProbeConnectionPool
 
 
 # Default websites to check for connectivity
@@ -14,61 +17,115 @@ DEFAULT_WEBSITES = [
     'https://reddit.com'
 ]
 
+# Available probe engines for check_connectivity()
+ENGINES = ('threads', 'async', 'pooled')
+
 
 def check_single_site(url):
-    """Check connectivity to a single website."""
-    start_time = time.time()
+    """Check connectivity to a single website, timing each phase of the request."""
+    timer = PhaseTimer()
+    opener = build_timed_opener(timer)
+    start_time = time.monotonic()
     try:
-        response = urllib.request.urlopen(url, timeout=5)
-        duration = time.time() - start_time
-        status = 'SUCCESS' if response.getcode() == 200 else f'HTTP_{response.getcode()}'
+        response = opener.open(url, timeout=5)
+        try:
+            duration = time.monotonic() - start_time
+            status = 'SUCCESS' if response.getcode() == 200 else f'HTTP_{response.getcode()}'
+        finally:
+            response.close()
     except urllib.error.URLError as e:
-        duration = time.time() - start_time
+        duration = time.monotonic() - start_time
         status = f'FAILED: {str(e)}'
     except Exception as e:
-        duration = time.time() - start_time
+        duration = time.monotonic() - start_time
         status = f'FAILED: {str(e)}'
     
     return {
         'url': url,
         'status': status,
-        'duration': duration
+        'duration': duration,
+        'phases': timer.phases
     }
 
 
-def check_connectivity(websites=None):
-    """Check internet connectivity by testing multiple well-known websites."""
-    if websites is None:
-        websites = DEFAULT_WEBSITES
+def run_in_background(func):
+    """Run func on a daemon thread and return a Future for its result."""
+    future = Future()
     
-    # Get timestamp and timezone info
-    timestamp_info = get_timestamp_info()
+    def run():
+        try:
+            future.set_result(func())
+        except Exception as e:
+            future.set_exception(e)
     
-    results = {
-        'timestamp': timestamp_info['timestamp_local'],
-        'timestamp_utc': timestamp_info['timestamp_utc'],
-        'timezone_local': timestamp_info['timezone_local'],
-        'wifi_network': get_wifi_network(),
-        'checks': []
-    }
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
+
+def check_sites_with_threads(websites, check_site=check_single_site):
+    """Check all websites in parallel with one worker thread per website."""
+    checks = []
     
     # Use ThreadPoolExecutor to check all websites in parallel
     with ThreadPoolExecutor(max_workers=len(websites)) as executor:
-        future_to_url = {executor.submit(check_single_site, url): url for url in websites}
+        future_to_url = {executor.submit(check_site, url): url for url in websites}
         
         for future in future_to_url:
             try:
                 check_result = future.result()
-                results['checks'].append(check_result)
+                checks.append(check_result)
             except Exception as e:
                 # Handle any unexpected errors from the thread
                 url = future_to_url[future]
-                results['checks'].append({
+                checks.append({
                     'url': url,
                     'status': f'FAILED: {str(e)}',
                     'duration': 0.0
                 })
     
+    return checks
+
+
+def check_connectivity(websites=None, engine='threads', pool=None, wifi_provider=None):
+    """Check internet connectivity by testing multiple well-known websites.
+    
+    The 'pooled' engine probes over keep-alive connections held by pool; without a
+    pool (e.g. a one-shot run) a temporary one is used and closed afterwards.
+    The WiFi network name comes from wifi_provider (default: get_wifi_network) and
+    is looked up concurrently with the site checks.
+    """
+    if websites is None:
+        websites = DEFAULT_WEBSITES
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown probe engine: {engine} (expected one of {', '.join(ENGINES)})")
+    
+    # Get timestamp and timezone info
+    timestamp_info = get_timestamp_info()
+    
+    # Look up the WiFi network while the probes run instead of before them
+    wifi_future = run_in_background(wifi_provider or get_wifi_network)
+    
+    results = {
+        'timestamp': timestamp_info['timestamp_local'],
+        'timestamp_utc': timestamp_info['timestamp_utc'],
+        'timezone_local': timestamp_info['timezone_local'],
+        'wifi_network': None,
+        'checks': []
+    }
+    
+    if engine == 'async':
+        results['checks'] = check_sites_async(websites)
+    elif engine == 'pooled':
+        if pool is None:
+            with ProbeConnectionPool() as temporary_pool:
+                results['checks'] = check_sites_with_threads(websites, temporary_pool.check)
+        else:
+            results['checks'] = check_sites_with_threads(websites, pool.check)
+    else:
+        results['checks'] = check_sites_with_threads(websites)
+    
+    results['wifi_network'] = wifi_future.result()
+    
     # Sort results by original URL order to maintain consistency
     url_order = {url: i for i, url in enumerate(websites)}
     results['checks'].sort(key=lambda x: url_order[x['url']])
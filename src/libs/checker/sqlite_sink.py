@@ -0,0 +1,102 @@
+import os
+import socket
+import sqlite3
+from .probe_timing import PHASES
+
+
+# Local, untracked results database (see .gitignore); relative to the project directory like logs/{hostname}
+DEFAULT_DB_PATH = 'logs/connectivity.db'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS rounds (
+    id INTEGER PRIMARY KEY,
+    timestamp TEXT NOT NULL,
+    timestamp_utc TEXT NOT NULL,
+    timezone_local TEXT,
+    hostname TEXT NOT NULL,
+    wifi_network TEXT,
+    success_count INTEGER NOT NULL,
+    total_count INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS checks (
+    round_id INTEGER NOT NULL REFERENCES rounds(id),
+    url TEXT NOT NULL,
+    status TEXT NOT NULL,
+    duration REAL NOT NULL,
+    dns REAL,
+    connect REAL,
+    tls REAL,
+    ttfb REAL
+);
+CREATE INDEX IF NOT EXISTS idx_rounds_timestamp_utc ON rounds (timestamp_utc);
+CREATE INDEX IF NOT EXISTS idx_rounds_host_wifi_time ON rounds (hostname, wifi_network, timestamp_utc);
+CREATE INDEX IF NOT EXISTS idx_checks_round ON checks (round_id);
+"""
+
+
+def open_results_database(db_path=DEFAULT_DB_PATH):
+    """Open (creating if needed) the results database and make sure its tables and indexes exist."""
+    os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+    connection = sqlite3.connect(db_path)
+    # WAL lets the plotter read while the checker is writing
+    connection.execute('PRAGMA journal_mode=WAL')
+    connection.executescript(SCHEMA)
+    return connection
+
+
+def write_round(connection, results, hostname=None):
+    """Insert one round of results (and its per-site checks) and return the round id."""
+    if hostname is None:
+        hostname = socket.gethostname()
+    success_count = sum(1 for check in results['checks'] if check['status'] == 'SUCCESS')
+
+    with connection:
+        cursor = connection.execute(
+            'INSERT INTO rounds (timestamp, timestamp_utc, timezone_local, hostname, wifi_network, '
+            'success_count, total_count) VALUES (?, ?, ?, ?, ?, ?, ?)',
+            (results['timestamp'], results['timestamp_utc'], results.get('timezone_local'), hostname,
+             results['wifi_network'], success_count, len(results['checks']))
+        )
+        round_id = cursor.lastrowid
+        connection.executemany(
+            'INSERT INTO checks (round_id, url, status, duration, dns, connect, tls, ttfb) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            [(round_id, check['url'], check['status'], check['duration'],
+              *((check.get('phases') or {}).get(phase) for phase in PHASES))
+             for check in results['checks']]
+        )
+    return round_id
+
+
+class ResultsDatabase:
+    """Keep the results database open between rounds (for the daemon)."""
+
+    def __init__(self, db_path=DEFAULT_DB_PATH):
+        self.db_path = db_path
+        self._connection = None
+
+    def write(self, results):
+        """Insert one round of results, opening the database on first use."""
+        if self._connection is None:
+            self._connection = open_results_database(self.db_path)
+        return write_round(self._connection, results)
+
+    def close(self):
+        """Close the database connection, if open."""
+        if self._connection is not None:
+            self._connection.close()
+        self._connection = None
+
+
+def log_to_sqlite(results, db_path=DEFAULT_DB_PATH):
+    """Append results to the SQLite database; returns False (without raising) if it can't be written."""
+    try:
+        connection = open_results_database(db_path)
+        try:
+            write_round(connection, results)
+        finally:
+            connection.close()
+        return True
+    except (OSError, sqlite3.Error) as e:
+        print(f"DEBUG: Could not write results to {db_path}: {e}")
+        return False
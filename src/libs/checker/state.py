@@ -0,0 +1,35 @@
+import json
+import os
+
+
+# Local, untracked directory for checker state files (see .gitignore)
+STATE_DIR = 'logs/.cache'
+
+
+def get_state_path(name):
+    """Get the path of a named state file in the state directory."""
+    return os.path.join(STATE_DIR, name)
+
+
+def load_state(path):
+    """Load a JSON state file, returning an empty dict if it is missing or unreadable."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        return state if isinstance(state, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def save_state(path, state):
+    """Atomically write a JSON state file, creating its directory if needed."""
+    try:
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp_path = f"{path}.tmp.{os.getpid()}"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(tmp_path, path)
+        return True
+    except OSError as e:
+        print(f"DEBUG: Could not save state file {path}: {e}")
+        return False
@@ -1,4 +1,24 @@
+import array
+import fcntl
+import os
+import socket
+import struct
 import subprocess
+import sys
+import time
+from .state import load_state, save_state
+
+
+NOT_CONNECTED = "Not connected to WiFi"
+
+# Wireless extensions ioctls to read an interface's ESSID and access point address (linux/wireless.h)
+SIOCGIWESSID = 0x8B1B
+SIOCGIWAP = 0x8B15
+IW_ESSID_MAX_SIZE = 32
+
+# Re-query the SSID at least this often even if the interface state looks unchanged; on macOS
+# this bounds how long a switch between networks that keep the same address goes unnoticed
+DEFAULT_WIFI_CACHE_TTL = 300
 
 
 def get_wifi_network_via_networksetup():
@@ -34,8 +54,83 @@ def get_wifi_network_via_system_profiler():
     return None
 
 
+def get_linux_wireless_interfaces():
+    """Get wireless interface names from /proc/net/wireless, falling back to sysfs."""
+    interfaces = []
+    try:
+        with open('/proc/net/wireless', 'r') as f:
+            # Two header lines, then "wlan0: 0000   70.  -40.  -256 ..."
+            for line in f.readlines()[2:]:
+                name = line.split(':', 1)[0].strip()
+                if name:
+                    interfaces.append(name)
+    except OSError:
+        pass
+    
+    if not interfaces:
+        try:
+            interfaces = sorted(name for name in os.listdir('/sys/class/net')
+                                if os.path.isdir(f'/sys/class/net/{name}/wireless'))
+        except OSError:
+            pass
+    return interfaces
+
+
+def get_ssid_via_ioctl(interface):
+    """Get the SSID of a Linux wireless interface with the SIOCGIWESSID ioctl (no subprocess)."""
+    try:
+        essid = array.array('B', bytes(IW_ESSID_MAX_SIZE + 1))
+        address, _ = essid.buffer_info()
+        request = struct.pack('16sPHH', interface.encode()[:15], address, IW_ESSID_MAX_SIZE + 1, 0)
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            response = fcntl.ioctl(sock.fileno(), SIOCGIWESSID, request)
+        length = struct.unpack('16sPHH', response)[2]
+        ssid = essid.tobytes()[:length].rstrip(b'\0').decode('utf-8', errors='replace')
+        return ssid or None
+    except (OSError, struct.error):
+        return None
+
+
+def get_bssid_via_ioctl(interface):
+    """Get the BSSID (access point MAC address) of a Linux wireless interface with the SIOCGIWAP ioctl."""
+    try:
+        request = struct.pack('16s16s', interface.encode()[:15], bytes(16))
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            response = fcntl.ioctl(sock.fileno(), SIOCGIWAP, request)
+        # The union holds a struct sockaddr: 2 bytes of family, then the MAC address
+        return ':'.join(f'{byte:02x}' for byte in response[18:24])
+    except (OSError, struct.error):
+        return None
+
+
+def get_ssid_via_iw(interface):
+    """Get the SSID of a Linux wireless interface using the iw command."""
+    try:
+        result = subprocess.run(['iw', 'dev', interface, 'link'],
+                              capture_output=True, text=True, check=True)
+        for line in result.stdout.split('\n'):
+            line = line.strip()
+            if line.startswith('SSID:'):
+                return line[len('SSID:'):].strip() or None
+    except:
+        pass
+    return None
+
+
+def get_wifi_network_via_linux():
+    """Get WiFi network name on Linux (ioctl first, iw only if the kernel lacks wireless extensions)."""
+    for interface in get_linux_wireless_interfaces():
+        network_name = get_ssid_via_ioctl(interface) or get_ssid_via_iw(interface)
+        if network_name:
+            return network_name
+    return None
+
+
 def get_wifi_network():
     """Get the currently connected WiFi network name."""
+    if sys.platform.startswith('linux'):
+        return get_wifi_network_via_linux() or NOT_CONNECTED
+    
     # Try method 1: networksetup (works for regular WiFi)
     network_name = get_wifi_network_via_networksetup()
     if network_name:
@@ -46,4 +141,71 @@ def get_wifi_network():
     if network_name:
         return network_name
     
-    return "Not connected to WiFi"
\ No newline at end of file
+    return NOT_CONNECTED
+
+
+def get_default_route_address():
+    """Get the local address used for the default route (a connect() on UDP sends no packets)."""
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            sock.connect(('192.0.2.1', 53))  # TEST-NET-1, never actually contacted
+            return sock.getsockname()[0]
+    except OSError:
+        return None
+
+
+def get_interface_fingerprint():
+    """Get a cheap fingerprint of network interface state, without spawning any processes.
+    
+    Joining or leaving a network changes the interface list, link state, access
+    point (BSSID, on Linux) or the address picked for the default route, so the
+    cached SSID is re-queried. macOS has no way to read the BSSID without spawning
+    a process, so there a switch between networks that keep the interface up and
+    hand out the same address is only noticed once the cache TTL expires.
+    """
+    try:
+        interfaces = sorted(name for _, name in socket.if_nameindex())
+    except OSError:
+        interfaces = []
+    
+    link_states = []
+    for interface in get_linux_wireless_interfaces() if sys.platform.startswith('linux') else []:
+        try:
+            with open(f'/sys/class/net/{interface}/operstate', 'r') as f:
+                link_states.append(f"{interface}={f.read().strip()}@{get_bssid_via_ioctl(interface) or ''}")
+        except OSError:
+            pass
+    
+    return '|'.join([','.join(interfaces), ','.join(link_states), get_default_route_address() or ''])
+
+
+class WifiNetworkCache:
+    """Cache the WiFi network name until the interface state changes or the TTL expires.
+    
+    With a state_file the cache also survives between processes, so one-shot runs
+    started by launchd skip the slow lookup too.
+    """
+    
+    def __init__(self, ttl=DEFAULT_WIFI_CACHE_TTL, state_file=None, lookup=get_wifi_network,
+                 fingerprint=get_interface_fingerprint, clock=time.time):
+        self.ttl = ttl
+        self.state_file = state_file
+        self.lookup = lookup
+        self.fingerprint = fingerprint
+        self.clock = clock
+        self._state = load_state(state_file) if state_file else {}
+    
+    def get(self):
+        """Get the current WiFi network name, re-querying only when needed."""
+        fingerprint = self.fingerprint()
+        now = self.clock()
+        state = self._state
+        if (state.get('network_name') and state.get('fingerprint') == fingerprint
+                and 0 <= now - state.get('queried_at', 0) < self.ttl):
+            return state['network_name']
+        
+        network_name = self.lookup()
+        self._state = {'network_name': network_name, 'fingerprint': fingerprint, 'queried_at': now}
+        if self.state_file:
+            save_state(self.state_file, self._state)
+        return network_name
@@ -3,10 +3,59 @@ Argument parsing functionality for plotting scripts.
 """
 
 import argparse
+import datetime
 import os
+from typing import Dict
 from .system_utils import get_hostname
 
 
+def parse_datetime_argument(value: str) -> datetime.datetime:
+    """Parse a local date/time argument like '2025-07-10' or '2025-07-10 18:30'."""
+    try:
+        return datetime.datetime.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date/time: '{value}' (expected YYYY-MM-DD or 'YYYY-MM-DD HH:MM')")
+
+
+def positive_int_argument(value: str) -> int:
+    """Parse a positive integer argument."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: '{value}'")
+    return number
+
+
+INTERVAL_UNITS = {'m': 1, 'h': 60, 'd': 1440}
+
+
+def interval_argument(value: str) -> int:
+    """Parse an aggregation interval like '15', '7m', '2h' or '1d' into minutes."""
+    unit = value[-1:].lower()
+    multiplier = INTERVAL_UNITS.get(unit)
+    number = value[:-1] if multiplier else value
+    try:
+        minutes = int(number) * (multiplier or 1)
+    except ValueError:
+        minutes = 0
+    if minutes < 1:
+        raise argparse.ArgumentTypeError(f"invalid interval: '{value}' (expected minutes, or e.g. 7m, 2h, 1d)")
+    return minutes
+
+
+def parse_chart_argument(value: str) -> Dict[str, object]:
+    """Parse a --chart argument like 'wifi_network=Home,time_range=168,interval=1h' into a batch chart entry."""
+    entry = {}
+    for item in value.split(','):
+        name, separator, field_value = item.partition('=')
+        if not separator or not name.strip():
+            raise argparse.ArgumentTypeError(f"invalid chart: '{value}' (expected name=value pairs separated by commas)")
+        entry[name.strip().replace('-', '_')] = field_value.strip()
+    return entry
+
+
 def create_plot_argument_parser():
     """Create and configure argument parser for plotting scripts."""
     parser = argparse.ArgumentParser(description='Generate connectivity success rate plots')
@@ -16,11 +65,37 @@ def create_plot_argument_parser():
                        help='WiFi network to filter by (default: GoTitansFC)')
     parser.add_argument('--time-range', type=int, default=72,
                        help='Time range in hours to plot (default: 72)')
-    parser.add_argument('--interval', type=int, default=15,
-                       help='Aggregation interval in minutes (default: 15)')
+    parser.add_argument('--interval', type=interval_argument, default=15,
+                       help='Aggregation interval in minutes, or with a unit like 7m, 2h or 1d (default: 15)')
     parser.add_argument('--output-dir', default=os.path.expanduser('~/Desktop'),
-                       help='Output directory for PNG files (default: ~/Desktop)')
+                       help='Output directory for plot files (default: ~/Desktop)')
     parser.add_argument('--output', help='Specific output file path (overrides --output-dir)')
+    parser.add_argument('--format', choices=['png', 'svg', 'html'],
+                       help='Output format; svg and html are drawn without matplotlib '
+                            '(default: from the --output extension, else png)')
+    parser.add_argument('--since', type=parse_datetime_argument,
+                       help='Plot data from this local time on, e.g. "2025-07-10 06:00" (overrides --time-range)')
+    parser.add_argument('--until', type=parse_datetime_argument,
+                       help='Plot data up to this local time; without --since, --time-range hours before it')
+    parser.add_argument('--jobs', type=positive_int_argument, default=1,
+                       help='Number of processes used to parse log files (default: 1)')
+    parser.add_argument('--columnar', action='store_true',
+                       help='Parse into compact NumPy columns and aggregate them vectorized (requires numpy)')
+    parser.add_argument('--rollups', action='store_true',
+                       help='Aggregate from incrementally updated 1m/15m/1h/1d rollups in logs/.cache '
+                            '(fast for long time ranges)')
+    parser.add_argument('--sqlite', nargs='?', const='', metavar='PATH',
+                       help='Read data from the checker\'s SQLite database instead of the log files '
+                            '(default path: logs/connectivity.db)')
+    parser.add_argument('--stats', action='store_true',
+                       help='Print availability, outages and failed checks per site instead of plotting')
+    parser.add_argument('--json', action='store_true',
+                       help='Like --stats, but print the numbers as JSON (progress messages go to stderr)')
+    parser.add_argument('--batch', metavar='SPEC_FILE',
+                       help='Render every chart listed in a JSON spec file, parsing each host\'s logs once')
+    parser.add_argument('--chart', action='append', type=parse_chart_argument, metavar='NAME=VALUE,...',
+                       help='Render this chart too, e.g. "wifi_network=Office,interval=1h" '
+                            '(repeatable; unset fields come from the other options)')
     
     return parser
 
@@ -0,0 +1,203 @@
+"""
+Batch chart generation.
+
+Renders many charts in one process: each host's log files are parsed once into
+ConnectivityColumns covering every requested network and time window, each
+chart is aggregated from those columns, and the charts that aren't in the
+render cache are rendered on a process pool.
+"""
+
+import argparse
+import datetime
+import itertools
+import json
+import os
+from typing import Dict, List, NamedTuple, Optional
+from .arg_parser import interval_argument, parse_datetime_argument
+from .columnar import parse_log_columns
+from .data_aggregator import aggregate_by_interval
+from .dependencies import use_headless_backend
+from .log_parser import find_latest_timestamp
+from .path_utils import check_output_format, generate_output_filename, get_output_format
+from .render_cache import RenderCache, copy_cached_render, get_render_cache_dir, render_cache_key
+from .svg_chart import SVG_FORMATS, plot_success_rates_svg
+
+
+class ChartSpec(NamedTuple):
+    """One chart to render."""
+    hostname: str
+    wifi_network: str
+    time_range: int
+    interval: int
+    since: Optional[datetime.datetime] = None
+    until: Optional[datetime.datetime] = None
+    output: Optional[str] = None
+    format: Optional[str] = None
+
+
+def output_format_argument(value: str) -> str:
+    """Check a chart's format field."""
+    if value not in ('png',) + SVG_FORMATS:
+        raise ValueError(f"'{value}' (expected png, svg or html)")
+    return value
+
+
+CHART_FIELDS = {
+    'hostname': str,
+    'wifi_network': str,
+    'time_range': int,
+    'interval': lambda value: interval_argument(str(value)),
+    'since': parse_datetime_argument,
+    'until': parse_datetime_argument,
+    'output': str,
+    'format': output_format_argument
+}
+
+
+def expand_chart_specs(entry: Dict, defaults: Dict) -> List[ChartSpec]:
+    """Expand one spec entry into charts; a list value fans out over each of its items.
+
+    e.g. {"wifi_network": ["Home", "Office"], "interval": ["15m", "1h"]} is four charts.
+    """
+    if not isinstance(entry, dict):
+        raise ValueError(f"chart entry is not an object: {entry!r}")
+    unknown = set(entry) - set(CHART_FIELDS)
+    if unknown:
+        raise ValueError(f"unknown chart field(s): {', '.join(sorted(unknown))}")
+
+    fields = {**defaults, **entry}
+    choices = []
+    for name, convert in CHART_FIELDS.items():
+        values = fields.get(name)
+        values = values if isinstance(values, list) else [values]
+        try:
+            choices.append([None if value is None else convert(value) for value in values])
+        except (argparse.ArgumentTypeError, TypeError, ValueError) as e:
+            raise ValueError(f"invalid {name}: {e}")
+
+    specs = [ChartSpec(*combination) for combination in itertools.product(*choices)]
+    if len(specs) > 1 and any(spec.output for spec in specs):
+        raise ValueError("'output' can only be set for an entry that is a single chart")
+    for spec in specs:
+        check_output_format(spec.format, spec.output)
+    return specs
+
+
+def load_batch_spec(spec_file: str, defaults: Dict) -> List[ChartSpec]:
+    """Load charts from a JSON spec file: {"defaults": {...}, "charts": [{...}, ...]}."""
+    with open(spec_file, 'r', encoding='utf-8') as f:
+        spec = json.load(f)
+    if isinstance(spec, list):
+        spec = {'charts': spec}
+    defaults = {**defaults, **spec.get('defaults', {})}
+    return [chart for entry in spec.get('charts', []) for chart in expand_chart_specs(entry, defaults)]
+
+
+def _get_parse_window(logs_dir: str, specs: List[ChartSpec]):
+    """Get the since/until bounds that cover every chart of one host (None for unbounded).
+
+    Relative charts end at their own network's newest round, as in parse_log_files,
+    so a newer log file holding only other networks' rounds doesn't narrow them.
+    """
+    starts = []
+    ends = []
+    latest_timestamps = {}
+    for spec in specs:
+        if spec.since is not None:
+            starts.append(spec.since)
+        elif spec.until is not None:
+            starts.append(spec.until - datetime.timedelta(hours=spec.time_range))
+        else:
+            if spec.wifi_network not in latest_timestamps:
+                latest_timestamps[spec.wifi_network] = find_latest_timestamp(logs_dir, spec.hostname, spec.wifi_network)
+            latest_time = latest_timestamps[spec.wifi_network]
+            if latest_time is None:
+                # No rounds on this network, so the chart is empty whatever is parsed
+                continue
+            starts.append(latest_time - datetime.timedelta(hours=spec.time_range))
+        ends.append(spec.until)
+
+    since = None if not starts else min(starts)
+    until = None if None in ends or not ends else max(ends)
+    return since, until
+
+
+def _render_chart(job):
+    """Render one chart (runs in a worker process)."""
+    use_headless_backend()
+    from .chart_generator import plot_success_rates
+    aggregated_data, spec, output_file = job
+    return plot_success_rates(aggregated_data, spec.hostname, spec.wifi_network, spec.interval, output_file)
+
+
+def run_batch(specs: List[ChartSpec], logs_dir: str, output_dir: str, jobs: int = 1) -> List[str]:
+    """Render every chart, parsing each host's logs once; returns the saved files."""
+    render_cache = RenderCache(get_render_cache_dir(logs_dir))
+    saved_files = []
+    render_jobs = []
+    cache_keys = []
+    output_files = set()
+    cached_count = 0
+    svg_count = 0
+
+    for hostname, host_specs in itertools.groupby(sorted(specs, key=lambda spec: spec.hostname),
+                                                  key=lambda spec: spec.hostname):
+        host_specs = list(host_specs)
+        since, until = _get_parse_window(logs_dir, host_specs)
+        columns = parse_log_columns(logs_dir, hostname, since, until)
+
+        for spec in host_specs:
+            chart_columns = columns.select_network(spec.wifi_network).select_window(spec.time_range, spec.since, spec.until)
+            aggregated_data = aggregate_by_interval(chart_columns, spec.interval)
+            if not aggregated_data:
+                print(f"No data found to plot for {spec.hostname} ({spec.wifi_network})")
+                continue
+
+            output_format = get_output_format(spec.format, spec.output)
+            output_file = spec.output or generate_output_filename(
+                spec.hostname, spec.wifi_network, spec.time_range, spec.interval, output_dir, output_format)
+            # Charts that differ only in since/until would get the same automatic name
+            base, extension = os.path.splitext(output_file)
+            for number in itertools.count(2):
+                if output_file not in output_files:
+                    break
+                output_file = f"{base}_{number}{extension}"
+            output_files.add(output_file)
+
+            if output_format in SVG_FORMATS:
+                # Drawn in this process without matplotlib; cheaper than a cache lookup
+                saved_file = plot_success_rates_svg(aggregated_data, spec.hostname, spec.wifi_network,
+                                                    spec.interval, output_file, output_format)
+                if saved_file:
+                    saved_files.append(saved_file)
+                    svg_count += 1
+                continue
+
+            cache_key = render_cache_key(aggregated_data, spec.hostname, spec.wifi_network, spec.interval)
+            cached_file = render_cache.get(cache_key)
+            if cached_file:
+                saved_file = copy_cached_render(cached_file, output_file)
+                if saved_file:
+                    saved_files.append(saved_file)
+                    cached_count += 1
+            else:
+                render_jobs.append((aggregated_data, spec, output_file))
+                cache_keys.append(cache_key)
+
+    if jobs > 1 and len(render_jobs) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=min(jobs, len(render_jobs))) as executor:
+            rendered_files = list(executor.map(_render_chart, render_jobs))
+    else:
+        rendered_files = [_render_chart(job) for job in render_jobs]
+
+    for cache_key, saved_file in zip(cache_keys, rendered_files):
+        if saved_file and os.path.exists(saved_file):
+            render_cache.put(cache_key, saved_file)
+            saved_files.append(saved_file)
+
+    rendered_count = len(saved_files) - cached_count - svg_count
+    svg_summary = f", {svg_count} as SVG/HTML" if svg_count else ""
+    print(f"Saved {len(saved_files)} of {len(specs)} charts ({rendered_count} rendered, "
+          f"{cached_count} from the render cache{svg_summary})")
+    return saved_files
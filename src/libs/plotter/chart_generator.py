@@ -3,13 +3,69 @@ Chart generation functionality for connectivity data visualization.
 """
 
 import datetime
+import math
 from typing import List, Tuple
+import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
+from matplotlib.collections import PolyCollection
+from matplotlib.ticker import Formatter
+from .data_aggregator import aggregate_by_interval
+from .columnar import ConnectivityColumns
+
+
+class EdgeDateFormatter(Formatter):
+    """Show the date for 00:00, leftmost and rightmost tick labels; only the time for others."""
+
+    def format_ticks(self, values):
+        # All tick locations are known here, so the rightmost tick doesn't need another locator pass
+        return [self(value, pos, last=(pos == len(values) - 1)) for pos, value in enumerate(values)]
+
+    def __call__(self, x, pos=None, last=False):
+        date = mdates.num2date(x)
+        is_leftmost = (pos == 0)
+        is_midnight = (date.hour == 0 and date.minute == 0)
+
+        if is_leftmost or last or is_midnight:
+            return date.strftime('%m/%d %H:%M')
+        else:
+            return date.strftime('%H:%M')
+
+
+# Most x-axis ticks before switching to a coarser tick spacing
+MAX_TIME_TICKS = 32
+
+
+def get_time_locator(first_time: datetime.datetime, last_time: datetime.datetime):
+    """Get an x-axis locator: every 3 hours, or coarser when that would exceed MAX_TIME_TICKS ticks."""
+    span_hours = (last_time - first_time) / datetime.timedelta(hours=1)
+    for hours in (3, 6, 12):
+        if span_hours / hours <= MAX_TIME_TICKS:
+            return mdates.HourLocator(byhour=range(0, 24, hours))
+    return mdates.DayLocator(interval=math.ceil(span_hours / 24 / MAX_TIME_TICKS))
+
+
+def bar_vertices(timestamps: List[datetime.datetime], heights: List[float], width: datetime.timedelta,
+                 bottoms: List[float] = None) -> np.ndarray:
+    """Get the corners of bars centered on timestamps (like plt.bar) as an array of shape (bars, 4, 2)."""
+    centers = mdates.date2num(timestamps)
+    half_width = width / datetime.timedelta(days=1) / 2
+    bottoms = np.zeros(len(centers)) if bottoms is None else np.asarray(bottoms, dtype=float)
+    tops = bottoms + np.asarray(heights, dtype=float)
+    left = centers - half_width
+    right = centers + half_width
+    return np.stack([np.column_stack([left, bottoms]), np.column_stack([left, tops]),
+                     np.column_stack([right, tops]), np.column_stack([right, bottoms])], axis=1)
 
 
 def plot_success_rates(data: List[Tuple[datetime.datetime, float, str]], hostname: str, wifi_network: str, interval_minutes: int = 15, output_file: str = None):
-    """Plot success rates as a dot line graph."""
+    """Plot success rates as a dot line graph.
+    
+    data is the output of aggregate_by_interval, or ConnectivityColumns to be aggregated here.
+    """
+    if isinstance(data, ConnectivityColumns):
+        data = aggregate_by_interval(data, interval_minutes)
+    
     if not data:
         print("No data to plot")
         return None
@@ -19,12 +75,15 @@ def plot_success_rates(data: List[Tuple[datetime.datetime, float, str]], hostnam
     missing_data = [(item[0], item[1]) for item in data if item[2] == "missing"]
     
     # Create the plot
-    plt.figure(figsize=(12, 6))
+    figure = plt.figure(figsize=(12, 6))
+    ax = plt.gca()
+    ax.xaxis_date()
     
     # Calculate bar width based on interval
     bar_width = datetime.timedelta(minutes=interval_minutes * 0.8)  # 80% of interval for spacing
     
-    # Plot measured data with normal colors
+    # Plot measured data with normal colors; each series is one PolyCollection rather than
+    # one Rectangle artist per bar, so render time doesn't grow with the number of intervals
     if measured_data:
         timestamps = [item[0] for item in measured_data]
         success_rates = [item[1] * 100 for item in measured_data]  # Convert to percentage
@@ -32,11 +91,13 @@ def plot_success_rates(data: List[Tuple[datetime.datetime, float, str]], hostnam
         
         # Create stacked bar chart for measured data
         # Bottom bars (failure) in orange-red (colorblind friendly)
-        plt.bar(timestamps, failure_rates, width=bar_width, color='#FF6B35', alpha=0.8, 
-               edgecolor='black', linewidth=0.5, label='Connection Failed')
+        ax.add_collection(PolyCollection(
+            bar_vertices(timestamps, failure_rates, bar_width), facecolors='#FF6B35', alpha=0.8,
+            edgecolors='black', linewidths=0.5, label='Connection Failed'))
         # Top bars (success) in light green with tiny blue tone (colorblind friendly)
-        plt.bar(timestamps, success_rates, width=bar_width, color='#66D9A6', alpha=0.8,
-               bottom=failure_rates, edgecolor='black', linewidth=0.5, label='Connection Success')
+        ax.add_collection(PolyCollection(
+            bar_vertices(timestamps, success_rates, bar_width, bottoms=failure_rates), facecolors='#66D9A6', alpha=0.8,
+            edgecolors='black', linewidths=0.5, label='Connection Success'))
     
     # Plot missing data with distinctive styling
     if missing_data:
@@ -44,9 +105,12 @@ def plot_success_rates(data: List[Tuple[datetime.datetime, float, str]], hostnam
         missing_heights = [100 for _ in missing_data]  # Full height bars
         
         # Create bars for missing data with dotted border and no fill
-        plt.bar(missing_timestamps, missing_heights, width=bar_width, 
-               color='none', edgecolor='black', linewidth=0.5, 
-               linestyle=':', label='No Data Recorded')
+        ax.add_collection(PolyCollection(
+            bar_vertices(missing_timestamps, missing_heights, bar_width), facecolors='none',
+            edgecolors='black', linewidths=0.5, linestyles=':', label='No Data Recorded'))
+    
+    # Collections don't update the view limits by themselves
+    ax.autoscale_view()
     
     # Set labels and title
     plt.title(f'Internet Connectivity Success/Failure Rate - {hostname} ({wifi_network})\n{interval_minutes}-minute intervals')
@@ -60,24 +124,9 @@ def plot_success_rates(data: List[Tuple[datetime.datetime, float, str]], hostnam
     plt.ylim(0, 105)
     
     # Custom x-axis formatting: show date for 00:00, leftmost, rightmost labels; only time for others
-    ax = plt.gca()
-    ax.xaxis.set_major_locator(mdates.HourLocator(byhour=range(0, 24, 3)))
-    
-    # Custom formatter function
-    def custom_date_formatter(x, pos):
-        date = mdates.num2date(x)
-        # Get all tick locations to determine leftmost and rightmost
-        tick_locs = ax.get_xticks()
-        is_leftmost = (pos == 0)
-        is_rightmost = (pos == len(tick_locs) - 1)
-        is_midnight = (date.hour == 0 and date.minute == 0)
-        
-        if is_leftmost or is_rightmost or is_midnight:
-            return date.strftime('%m/%d %H:%M')
-        else:
-            return date.strftime('%H:%M')
+    ax.xaxis.set_major_locator(get_time_locator(data[0][0], data[-1][0]))
     
-    ax.xaxis.set_major_formatter(plt.FuncFormatter(custom_date_formatter))
+    ax.xaxis.set_major_formatter(EdgeDateFormatter())
     plt.xticks(rotation=45)
     
     # Add grid
@@ -88,9 +137,10 @@ def plot_success_rates(data: List[Tuple[datetime.datetime, float, str]], hostnam
     
     # Save the plot
     if output_file:
-        plt.savefig(output_file, dpi=300, bbox_inches='tight')
+        # Figure.savefig, unlike plt.savefig, doesn't redraw the figure after saving it
+        figure.savefig(output_file, dpi=300, bbox_inches='tight')
         print(f"Plot saved to: {output_file}")
-        plt.close()  # Close the figure to free memory
+        plt.close(figure)  # Close the figure to free memory
         return output_file
     else:
         plt.show()
@@ -0,0 +1,227 @@
+"""
+Columnar (NumPy) representation of parsed connectivity data.
+
+Summary lines are kept as parallel arrays instead of (datetime, float) tuples:
+int64 timestamps (seconds since COLUMN_EPOCH, local wall-clock time), uint16
+success and total site counts, and a uint16 code into a list of WiFi network
+names. That is 14 bytes per round instead of about 136 for a (datetime, float)
+tuple in a list, so a year of per-minute rounds takes about 7 MB per host.
+"""
+
+import datetime
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy as np
+from .log_parser import (
+    COLUMN_EPOCH, _find_log_files, _map_log_file, iter_summary_matches, log_file_may_overlap
+)
+
+
+EPOCH_ORDINAL = COLUMN_EPOCH.toordinal()
+
+# Largest site count (and network code) an array('H') column can hold
+UINT16_MAX = 0xFFFF
+
+
+def to_epoch_seconds(timestamp: datetime.datetime) -> int:
+    """Convert a naive local datetime to seconds since COLUMN_EPOCH."""
+    return (timestamp - COLUMN_EPOCH) // datetime.timedelta(seconds=1)
+
+
+def from_epoch_seconds(seconds: int) -> datetime.datetime:
+    """Convert seconds since COLUMN_EPOCH back to a naive local datetime."""
+    return COLUMN_EPOCH + datetime.timedelta(seconds=int(seconds))
+
+
+def _as_column(values, dtype) -> np.ndarray:
+    """Convert values to a 1-D array of dtype, without copying array.array buffers."""
+    if isinstance(values, array):
+        return np.frombuffer(values, dtype=dtype) if len(values) else np.empty(0, dtype=dtype)
+    return np.asarray(values, dtype=dtype)
+
+
+class ConnectivityColumns:
+    """Summary data points for one or more WiFi networks, stored as NumPy columns."""
+
+    def __init__(self, timestamps, success_counts, total_counts, network_codes, networks: List[str]):
+        self.timestamps = _as_column(timestamps, np.int64)
+        self.success_counts = _as_column(success_counts, np.uint16)
+        self.total_counts = _as_column(total_counts, np.uint16)
+        self.network_codes = _as_column(network_codes, np.uint16)
+        self.networks = list(networks)
+
+    @classmethod
+    def empty(cls) -> 'ConnectivityColumns':
+        return cls([], [], [], [], [])
+
+    @classmethod
+    def concatenate(cls, chunks: Iterable['ConnectivityColumns']) -> 'ConnectivityColumns':
+        """Join chunks (e.g. one per log file), merging their network dictionaries."""
+        chunks = list(chunks)
+        if not chunks:
+            return cls.empty()
+
+        network_index = {}
+        codes = []
+        for chunk in chunks:
+            mapping = np.array([network_index.setdefault(name, len(network_index)) for name in chunk.networks],
+                               dtype=np.uint16)
+            codes.append(mapping[chunk.network_codes] if len(chunk) else chunk.network_codes)
+        return cls(np.concatenate([chunk.timestamps for chunk in chunks]),
+                   np.concatenate([chunk.success_counts for chunk in chunks]),
+                   np.concatenate([chunk.total_counts for chunk in chunks]),
+                   np.concatenate(codes), list(network_index))
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the column arrays."""
+        return (self.timestamps.nbytes + self.success_counts.nbytes + self.total_counts.nbytes
+                + self.network_codes.nbytes)
+
+    @property
+    def success_rates(self) -> np.ndarray:
+        """Success rate of each round (0 where no sites were checked)."""
+        totals = self.total_counts.astype(np.float64)
+        return np.divide(self.success_counts, totals, out=np.zeros(len(self)), where=totals > 0)
+
+    def _take(self, selector) -> 'ConnectivityColumns':
+        return ConnectivityColumns(self.timestamps[selector], self.success_counts[selector],
+                                   self.total_counts[selector], self.network_codes[selector], self.networks)
+
+    def select_network(self, wifi_network: str) -> 'ConnectivityColumns':
+        """Keep only rounds on one WiFi network."""
+        if wifi_network not in self.networks:
+            return ConnectivityColumns.empty()
+        return self._take(self.network_codes == self.networks.index(wifi_network))
+
+    def select_time(self, since: Optional[datetime.datetime] = None,
+                    until: Optional[datetime.datetime] = None) -> 'ConnectivityColumns':
+        """Keep only rounds between since and until (inclusive)."""
+        mask = np.ones(len(self), dtype=bool)
+        if since is not None:
+            mask &= self.timestamps >= to_epoch_seconds(since)
+        if until is not None:
+            mask &= self.timestamps <= to_epoch_seconds(until)
+        return self._take(mask)
+
+    def select_last_hours(self, time_range_hours: int) -> 'ConnectivityColumns':
+        """Keep only the time_range_hours before the newest round (as parse_log_files does)."""
+        if not len(self):
+            return self
+        return self._take(self.timestamps >= self.timestamps.max() - time_range_hours * 3600)
+
+    def select_window(self, time_range_hours: int, since: Optional[datetime.datetime] = None,
+                      until: Optional[datetime.datetime] = None) -> 'ConnectivityColumns':
+        """Apply the plot window the way parse_log_files does (until alone means time_range_hours before it)."""
+        if since is None and until is None:
+            return self.select_last_hours(time_range_hours)
+        if since is None:
+            since = until - datetime.timedelta(hours=time_range_hours)
+        return self.select_time(since, until)
+
+    def sorted(self) -> 'ConnectivityColumns':
+        """Sort rounds by timestamp (stable, so same-second rounds keep log order)."""
+        return self._take(np.argsort(self.timestamps, kind='stable'))
+
+    def to_records(self) -> List[Tuple[datetime.datetime, float]]:
+        """Convert to the (timestamp, success rate) list used by the rest of the plotter."""
+        return [(from_epoch_seconds(seconds), float(rate))
+                for seconds, rate in zip(self.timestamps.tolist(), self.success_rates.tolist())]
+
+
+def bin_by_interval(timestamps: np.ndarray, values: np.ndarray, interval_minutes: int = 15) -> List[Tuple[datetime.datetime, float, str]]:
+    """Average values per interval of epoch seconds, as (interval end, average, "measured"/"missing") tuples.
+
+    Intervals are aligned to COLUMN_EPOCH, so any length works (7 minutes, 2 hours,
+    1 day); every interval from the first to the last one with data is returned.
+    """
+    if not len(timestamps):
+        return []
+
+    step = int(interval_minutes * 60)
+    bins = np.asarray(timestamps, dtype=np.int64) // step
+    first_bin = int(bins.min())
+    # Offsets from the first bin index straight into the gap-free grid
+    offsets = bins - first_bin
+    counts = np.bincount(offsets)
+    sums = np.bincount(offsets, weights=np.asarray(values, dtype=np.float64), minlength=len(counts))
+
+    measured = counts > 0
+    averages = np.divide(sums, counts, out=np.zeros(len(counts)), where=measured)
+    interval_ends = (first_bin + 1 + np.arange(len(counts), dtype=np.int64)) * step
+
+    return [(from_epoch_seconds(end), average, "measured" if is_measured else "missing")
+            for end, average, is_measured in zip(interval_ends.tolist(), averages.tolist(), measured.tolist())]
+
+
+def aggregate_columns(columns: ConnectivityColumns, interval_minutes: int = 15) -> List[Tuple[datetime.datetime, float, str]]:
+    """Vectorized aggregate_by_interval for ConnectivityColumns (same intervals, averages and gaps)."""
+    return bin_by_interval(columns.timestamps, columns.success_rates, interval_minutes)
+
+
+def scan_summary_columns(buffer, timestamps: array, success_counts: array, total_counts: array,
+                         network_codes: array, network_index: Dict[bytes, int]):
+    """Append every summary line in a bytes-like buffer to the column arrays (all WiFi networks)."""
+    ordinals = {}
+    for ts, match in iter_summary_matches(buffer):
+        # Rounds in a file share a handful of dates - convert each date once
+        date = ts[0:10]
+        day_seconds = ordinals.get(date)
+        if day_seconds is None:
+            ordinal = datetime.date(int(ts[0:4]), int(ts[5:7]), int(ts[8:10])).toordinal()
+            day_seconds = ordinals[date] = (ordinal - EPOCH_ORDINAL) * 86400
+        success_count = int(match.group(2))
+        total_count = int(match.group(3))
+        if success_count > UINT16_MAX or total_count > UINT16_MAX:
+            # Would overflow array('H') partway through a row and leave the columns misaligned
+            continue
+        network = match.group(1).strip()
+        code = network_index.get(network)
+        if code is None:
+            if len(network_index) > UINT16_MAX:
+                continue
+            code = network_index[network] = len(network_index)
+        timestamps.append(day_seconds + int(ts[11:13]) * 3600 + int(ts[14:16]) * 60 + int(ts[17:19]))
+        success_counts.append(success_count)
+        total_counts.append(total_count)
+        network_codes.append(code)
+
+
+def parse_log_columns(logs_dir: str, hostname: str, since: Optional[datetime.datetime] = None,
+                      until: Optional[datetime.datetime] = None) -> ConnectivityColumns:
+    """Parse a host's log files into sorted ConnectivityColumns for all WiFi networks.
+
+    Files outside since/until are skipped by name; use select_network() and
+    select_time()/select_last_hours() to narrow the result.
+    """
+    timestamps = array('q')
+    success_counts = array('H')
+    total_counts = array('H')
+    network_codes = array('H')
+    network_index = {}
+
+    for log_file in _find_log_files(logs_dir, hostname):
+        if not log_file_may_overlap(log_file, since, until):
+            continue
+        try:
+            buffer = _map_log_file(log_file)
+            if buffer is None:
+                with open(log_file, 'rb') as f:
+                    buffer = f.read()
+                scan_summary_columns(buffer, timestamps, success_counts, total_counts, network_codes, network_index)
+            else:
+                with buffer:
+                    scan_summary_columns(buffer, timestamps, success_counts, total_counts, network_codes, network_index)
+        except Exception as e:
+            print(f"Error parsing {log_file}: {e}")
+
+    networks = [name.decode('utf-8', errors='replace') for name in network_index]
+    columns = ConnectivityColumns(timestamps, success_counts, total_counts, network_codes, networks)
+    columns = columns.sorted()
+    if since is not None or until is not None:
+        columns = columns.select_time(since, until)
+    print(f"Parsed {len(columns)} rounds on {len(networks)} WiFi networks into {columns.nbytes} bytes of columns")
+    return columns
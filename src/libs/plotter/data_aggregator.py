@@ -3,55 +3,129 @@ Data aggregation functionality for time-series connectivity data.
 """
 
 import datetime
-from typing import List, Tuple
+import sys
+from typing import Dict, Iterable, List, Sequence, Tuple, Union
 
+from .latency_sketch import DEFAULT_PERCENTILES, LatencyHistogram
+from .log_parser import COLUMN_EPOCH, RESPONSE_CLASSES, SiteRecord
+from .rollups import RollupWindow
 
-def aggregate_by_interval(data: List[Tuple[datetime.datetime, float]], interval_minutes: int = 15) -> List[Tuple[datetime.datetime, float, str]]:
-    """Aggregate data into specified minute intervals with data status."""
-    if not data:
-        return []
+
+ONE_SECOND = datetime.timedelta(seconds=1)
+
+# Shorter lists are aggregated in pure Python unless NumPy is already loaded: importing it
+# takes about as long as the vectorized binning saves on this many rounds
+VECTORIZE_MIN_ROUNDS = 250000
+
+
+def _loaded_columnar():
+    """Get the columnar module if it has been imported (only then can data be ConnectivityColumns)."""
+    return sys.modules.get(f"{__package__}.columnar")
+
+
+def _import_columnar():
+    """Import the NumPy-backed columnar module on first use; None if NumPy is not installed."""
+    try:
+        from . import columnar
+    except ImportError:  # NumPy is optional; without it only lists/iterables of tuples are supported
+        return None
+    return columnar
+
+
+def _epoch_seconds(timestamp: datetime.datetime) -> int:
+    """Seconds since COLUMN_EPOCH of a naive local timestamp."""
+    return (timestamp - COLUMN_EPOCH) // ONE_SECOND
+
+
+def aggregate_by_interval(data: Iterable[Tuple[datetime.datetime, float]], interval_minutes: int = 15) -> List[Tuple[datetime.datetime, float, str]]:
+    """Aggregate data into specified minute intervals with data status.
     
-    # Group data by specified intervals
-    intervals = {}
+    Intervals are aligned to COLUMN_EPOCH, so any length works (e.g. 7, 120 or 1440
+    minutes). ConnectivityColumns, and lists of VECTORIZE_MIN_ROUNDS or more when
+    NumPy is installed, are binned with vectorized NumPy operations; a RollupWindow
+    is served from its materialized rollups. Shorter lists (unless NumPy is already
+    loaded) and any other iterable (e.g. the stream from stream_log_files) are
+    aggregated in pure Python with a running sum and count per interval: a stream
+    would have to be collected into arrays first, which costs the memory streaming
+    saves, and for short lists importing NumPy costs more than it saves.
+    """
+    columnar = _loaded_columnar()
+    if isinstance(data, list) and (len(data) >= VECTORIZE_MIN_ROUNDS or 'numpy' in sys.modules):
+        columnar = _import_columnar()
     
+    if isinstance(data, RollupWindow):
+        aggregated_data = _fill_intervals(data.interval_totals(interval_minutes), interval_minutes)
+    elif columnar is not None and isinstance(data, columnar.ConnectivityColumns):
+        aggregated_data = columnar.aggregate_columns(data, interval_minutes)
+    elif columnar is not None and isinstance(data, list):
+        np = columnar.np
+        timestamps = np.fromiter((_epoch_seconds(timestamp) for timestamp, _ in data), dtype=np.int64, count=len(data))
+        success_rates = np.fromiter((success_rate for _, success_rate in data), dtype=np.float64, count=len(data))
+        aggregated_data = columnar.bin_by_interval(timestamps, success_rates, interval_minutes)
+    else:
+        aggregated_data = _aggregate_stream(data, interval_minutes)
+
+    if aggregated_data:
+        print(f"Aggregated into {len(aggregated_data)} {interval_minutes}-minute intervals")
+    return aggregated_data
+
+
+def _aggregate_stream(data: Iterable[Tuple[datetime.datetime, float]], interval_minutes: int) -> List[Tuple[datetime.datetime, float, str]]:
+    """Pure-Python aggregate_by_interval for iterables, with the same epoch-aligned intervals."""
+    step = interval_minutes * 60
+
+    # Group data by interval index (epoch seconds // step): index -> [sum of success rates, count]
+    intervals = {}
     for timestamp, success_rate in data:
-        # Calculate the interval boundary (round down to nearest interval mark)
-        minutes_since_hour = timestamp.minute
-        interval_start_minute = (minutes_since_hour // interval_minutes) * interval_minutes
-        interval_start = timestamp.replace(minute=interval_start_minute, second=0, microsecond=0)
-        
-        # The interval end is interval_minutes later
-        interval_end = interval_start + datetime.timedelta(minutes=interval_minutes)
-        
-        # Use interval_end as the key (the dot position)
-        if interval_end not in intervals:
-            intervals[interval_end] = []
-        
-        intervals[interval_end].append(success_rate)
-    
-    # Fill in missing intervals and calculate average success rate
+        totals = intervals.setdefault(_epoch_seconds(timestamp) // step, [0.0, 0])
+        totals[0] += success_rate
+        totals[1] += 1
+
+    return _fill_intervals(intervals, interval_minutes)
+
+
+def _fill_intervals(intervals: Dict[int, List[float]], interval_minutes: int) -> List[Tuple[datetime.datetime, float, str]]:
+    """Turn [sum, count] per interval index into averages, marking intervals without data as missing."""
     if not intervals:
         return []
-    
-    # Get the full time range
-    first_time = min(intervals.keys())
-    last_time = max(intervals.keys())
-    
-    # Generate all expected intervals
+
+    step = interval_minutes * 60
+
+    # Every interval from the first to the last, marking those without data as missing;
+    # the dot of each interval is at its end
     aggregated_data = []
-    current_time = first_time
-    
-    while current_time <= last_time:
-        if current_time in intervals:
-            # Data available - calculate average
-            success_rates = intervals[current_time]
-            avg_success_rate = sum(success_rates) / len(success_rates)
-            aggregated_data.append((current_time, avg_success_rate, "measured"))
+    for index in range(min(intervals), max(intervals) + 1):
+        interval_end = COLUMN_EPOCH + datetime.timedelta(seconds=(index + 1) * step)
+        totals = intervals.get(index)
+        if totals is None:
+            aggregated_data.append((interval_end, 0.0, "missing"))
         else:
-            # No data available - mark as missing
-            aggregated_data.append((current_time, 0.0, "missing"))
-        
-        current_time += datetime.timedelta(minutes=interval_minutes)
+            aggregated_data.append((interval_end, totals[0] / totals[1], "measured"))
+    return aggregated_data
+
+
+def aggregate_latency_by_interval(site_records: Union[Iterable[SiteRecord], RollupWindow], interval_minutes: int = 15,
+                                  percentiles: Sequence[int] = DEFAULT_PERCENTILES) -> Dict[str, List[Tuple[datetime.datetime, Dict[int, float], int]]]:
+    """Get latency percentiles per site and interval, as {url: [(interval end, {percentile: seconds}, checks)]}.
+    
+    Only checks that got a response (see RESPONSE_CLASSES) count, and only intervals
+    with such checks are listed. site_records may be SiteRecords (e.g. from
+    parse_log_entries) or a RollupWindow, whose latency histograms are merged
+    without reading the raw durations.
+    """
+    if isinstance(site_records, RollupWindow):
+        histograms = site_records.latency_histograms(interval_minutes)
+    else:
+        step = interval_minutes * 60
+        histograms = {}
+        for record in site_records:
+            if record.status_class in RESPONSE_CLASSES:
+                index = _epoch_seconds(record.timestamp) // step
+                histograms.setdefault(record.url, {}).setdefault(index, LatencyHistogram()).add(record.duration)
     
-    print(f"Aggregated into {len(aggregated_data)} {interval_minutes}-minute intervals")
-    return aggregated_data
\ No newline at end of file
+    latencies = {}
+    for url, intervals in histograms.items():
+        latencies[url] = [(COLUMN_EPOCH + datetime.timedelta(seconds=(index + 1) * interval_minutes * 60),
+                           intervals[index].percentiles(percentiles), intervals[index].count)
+                          for index in sorted(intervals)]
+    return latencies
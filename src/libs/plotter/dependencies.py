@@ -2,21 +2,33 @@
 Dependency checking functionality for plotting scripts.
 """
 
+import importlib.util
 import sys
 
 
-def check_required_dependencies():
-    """Check that all required packages are installed."""
-    try:
-        import matplotlib.pyplot
-        return True
-    except ImportError as e:
-        print(f"Error: Required packages not installed. Please install: {e}")
-        print("Try: pip install matplotlib")
+REQUIRED_PACKAGES = ('matplotlib', 'numpy')
+
+
+def check_required_dependencies(packages=REQUIRED_PACKAGES):
+    """Check that all required packages (or just the given ones) are installed, without importing them."""
+    missing = [package for package in packages if importlib.util.find_spec(package) is None]
+    if missing:
+        print(f"Error: Required packages not installed. Please install: {', '.join(missing)}")
+        print(f"Try: pip install {' '.join(missing)}")
         return False
+    return True
 
 
 def exit_if_dependencies_missing():
     """Check dependencies and exit if any are missing."""
     if not check_required_dependencies():
-        sys.exit(1)
\ No newline at end of file
+        sys.exit(1)
+
+
+def use_headless_backend():
+    """Select matplotlib's non-interactive Agg backend before pyplot is imported.
+
+    Plots are written to files, so this skips loading a GUI toolkit (and needs no display).
+    """
+    import matplotlib
+    matplotlib.use('Agg')
@@ -0,0 +1,86 @@
+"""
+Mergeable latency histograms for percentile aggregation.
+
+Durations are counted in logarithmic buckets with a fixed relative accuracy
+(the DDSketch scheme), so a histogram is just {bucket index: count}. Two
+histograms merge by adding counts, which lets percentiles be combined across
+intervals, sites and rollup levels without keeping the raw durations.
+"""
+
+import math
+from typing import Dict, Iterable, Optional
+
+
+# Percentiles are within this relative error of the exact value
+RELATIVE_ACCURACY = 0.01
+
+GAMMA = (1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY)
+LOG_GAMMA = math.log(GAMMA)
+
+# Shorter durations (the log has 10 ms resolution) are counted as this
+MIN_DURATION = 0.0001
+
+DEFAULT_PERCENTILES = (50, 95, 99)
+
+
+def bucket_index(seconds: float) -> int:
+    """Get the histogram bucket of a duration."""
+    return math.ceil(math.log(max(seconds, MIN_DURATION)) / LOG_GAMMA)
+
+
+def bucket_value(index: int) -> float:
+    """Get the representative duration of a bucket (within RELATIVE_ACCURACY of every duration in it)."""
+    return 2 * GAMMA ** index / (GAMMA + 1)
+
+
+class LatencyHistogram:
+    """Counts of durations per logarithmic bucket."""
+
+    def __init__(self, buckets: Optional[Dict[int, int]] = None):
+        self.buckets = dict(buckets) if buckets else {}
+
+    @classmethod
+    def from_durations(cls, durations: Iterable[float]) -> 'LatencyHistogram':
+        histogram = cls()
+        for seconds in durations:
+            histogram.add(seconds)
+        return histogram
+
+    def add(self, seconds: float, count: int = 1):
+        index = bucket_index(seconds)
+        self.buckets[index] = self.buckets.get(index, 0) + count
+
+    def merge(self, other: 'LatencyHistogram') -> 'LatencyHistogram':
+        """Add the counts of another histogram to this one."""
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        return self
+
+    @property
+    def count(self) -> int:
+        return sum(self.buckets.values())
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, LatencyHistogram) and self.buckets == other.buckets
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Get the duration at quantile q (0 to 1), or None if the histogram is empty."""
+        total = self.count
+        if not total:
+            return None
+        rank = q * (total - 1)
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen > rank:
+                return bucket_value(index)
+        return bucket_value(max(self.buckets))
+
+    def percentiles(self, percentiles: Iterable[int] = DEFAULT_PERCENTILES) -> Dict[int, float]:
+        """Get {percentile: duration in seconds} (empty if the histogram is empty)."""
+        if not self.buckets:
+            return {}
+        return {percentile: self.quantile(percentile / 100) for percentile in percentiles}
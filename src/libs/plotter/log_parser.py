@@ -4,68 +4,565 @@ Log parsing functionality for connectivity data.
 
 import datetime
 import glob
+import hashlib
+import mmap
 import os
 import re
-from typing import List, Tuple
+from array import array
+from itertools import repeat
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
 
 
-def parse_log_files(logs_dir: str, hostname: str, wifi_filter: str = "GoTitansFC", time_range_hours: int = 72) -> List[Tuple[datetime.datetime, float]]:
-    """Parse log files and extract success rate data for specified WiFi network."""
-    data = []
-    
-    # Find all log files for this hostname
+# Pattern to match summary lines
+SUMMARY_PATTERN = re.compile(
+    r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}) - WiFi: ([^-]+) - Internet: (\d+)/(\d+) sites accessible'
+)
+
+# Fast path for whole memory-mapped files: search for the literal ' - WiFi: ' part of summary lines
+# (skipping detail lines cheaply) and read the fixed-width timestamp in front of it
+SUMMARY_TAIL_BYTES_PATTERN = re.compile(rb' - WiFi: ([^-\n]+) - Internet: (\d+)/(\d+) sites accessible')
+TIMESTAMP_BYTES_PATTERN = re.compile(rb'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}')
+TIMESTAMP_WIDTH = len('YYYY-MM-DD HH:MM:SS')
+
+# Process-pool workers return timestamps as whole seconds since this (naive, local) epoch
+COLUMN_EPOCH = datetime.datetime(1970, 1, 1)
+
+# Pattern to match per-site detail lines (after strip), with optional per-phase timings at the end
+SITE_PATTERN = re.compile(
+    r'^\((\d+\.\d+)s\) - (\S+?): (.*?)(?: \[((?:\w+=\d+\.\d+ ?)+)\])?$'
+)
+
+# Summary and per-site detail lines in one pass over a whole file (bytes, one line per match)
+ENTRY_BYTES_PATTERN = re.compile(
+    rb'^[ \t]*(?:(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}) - WiFi: ([^-\n]+) - Internet: (\d+)/(\d+) sites accessible'
+    rb'|\((\d+\.\d+)s\) - (\S+?): ([^\n]*?)(?: \[((?:\w+=\d+\.\d+ ?)+)\])?[ \t\r]*$)',
+    re.MULTILINE
+)
+
+# Status classes of per-site checks, by (substring of the error text, class), first match wins
+ERROR_CLASSES = (
+    ('timed out', 'timeout'),
+    ('HTTP Error', 'http_error'),
+    ('nodename nor servname', 'dns'),
+    ('Name or service not known', 'dns'),
+    ('Temporary failure in name resolution', 'dns'),
+    ('getaddrinfo failed', 'dns'),
+    ('SSL', 'ssl'),
+    ('CERTIFICATE', 'ssl'),
+    ('Connection refused', 'connection'),
+    ('Connection reset', 'connection'),
+    ('unreachable', 'connection'),
+    ('Network is down', 'connection'),
+)
+
+# Classes of checks that got a response (HTTP_xxx statuses are the non-200 codes below 400);
+# everything else (timeouts, DNS, SSL, connection errors) failed
+RESPONSE_CLASSES = ('success', 'redirect', 'non_200')
+
+# Date in log file names (connectivity_log_YYYYMMDD.txt)
+LOG_FILE_DATE_PATTERN = re.compile(r'connectivity_log_(\d{8})\.txt$')
+
+# A round started just before midnight is written to the next day's file
+LOG_FILE_DATE_SLACK = datetime.timedelta(minutes=5)
+
+# With --jobs, smaller sets of log files are parsed in this process: below this size,
+# starting workers and shipping results back costs more than the parallel parse saves
+POOL_MIN_BYTES = 64 * 1024 * 1024
+
+# Bytes hashed at each end of the already-parsed part of a log file to notice it was rewritten
+PREFIX_FINGERPRINT_BYTES = 4096
+
+
+def _find_log_files(logs_dir: str, hostname: str) -> List[str]:
+    """Find all log files for a hostname, sorted by date."""
     hostname_dir = os.path.join(logs_dir, hostname)
     if not os.path.exists(hostname_dir):
         print(f"Error: Hostname directory not found: {hostname_dir}")
-        return data
+        return []
     
     log_files = glob.glob(os.path.join(hostname_dir, "connectivity_log_*.txt"))
     if not log_files:
         print(f"Error: No log files found in {hostname_dir}")
-        return data
+        return []
     
     # Sort log files by date
     log_files.sort()
+    return log_files
+
+
+def parse_phase_timings(text: Optional[str]) -> Dict[str, float]:
+    """Parse phase timings like 'dns=0.012 connect=0.020 tls=0.045' into a dict of seconds."""
+    phases = {}
+    if not text:
+        return phases
+    for item in text.split():
+        phase, _, seconds = item.partition('=')
+        phases[phase] = float(seconds)
+    return phases
+
+
+def get_log_file_date(log_file: str) -> Optional[datetime.datetime]:
+    """Get the date in a log file name (connectivity_log_YYYYMMDD.txt), or None if it has none."""
+    match = LOG_FILE_DATE_PATTERN.search(os.path.basename(log_file))
+    if not match:
+        return None
+    try:
+        return datetime.datetime.strptime(match.group(1), '%Y%m%d')
+    except ValueError:
+        return None
+
+
+def log_file_may_overlap(log_file: str, since: Optional[datetime.datetime], until: Optional[datetime.datetime]) -> bool:
+    """Check from its file name whether a log file can hold entries between since and until."""
+    file_date = get_log_file_date(log_file)
+    if file_date is None:
+        return True
+    if since is not None and file_date + datetime.timedelta(days=1) <= since:
+        return False
+    if until is not None and file_date - LOG_FILE_DATE_SLACK > until:
+        return False
+    return True
+
+
+def get_prefix_fingerprint(buffer, offset: int, inode: int) -> str:
+    """Fingerprint the first offset bytes of a log file's bytes-like buffer (e.g. an mmap) with its inode.
     
-    # Pattern to match summary lines
-    summary_pattern = re.compile(
-        r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}) - WiFi: ([^-]+) - Internet: (\d+)/(\d+) sites accessible'
-    )
+    Only the first and last PREFIX_FINGERPRINT_BYTES are hashed, so this is cheap on large
+    files. Appending leaves it unchanged; replacing the file (e.g. git checkout) or rewriting
+    its start or end in place changes it, even when the size stays the same.
+    """
+    digest = hashlib.blake2b(buffer[:min(offset, PREFIX_FINGERPRINT_BYTES)], digest_size=16)
+    digest.update(buffer[max(PREFIX_FINGERPRINT_BYTES, offset - PREFIX_FINGERPRINT_BYTES):offset])
+    return f"{inode}:{digest.hexdigest()}"
+
+
+def _map_log_file(log_file: str) -> Optional[mmap.mmap]:
+    """Memory-map a log file read-only, or return None if it is empty or can't be mapped."""
+    try:
+        fd = os.open(log_file, os.O_RDONLY)
+    except OSError:
+        return None
+    try:
+        return mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    finally:
+        os.close(fd)
+
+
+def iter_summary_matches(buffer, pos: int = 0, endpos: Optional[int] = None) -> Iterator[Tuple[bytes, re.Match]]:
+    """Yield (timestamp bytes, match) for each summary line in a bytes-like buffer between pos and endpos.
     
-    print(f"Parsing {len(log_files)} log files...")
+    The match groups are the WiFi network (not stripped), accessible sites and total sites.
+    This is the one summary line scanner; the parser, parse cache and columns all use it.
+    """
+    for match in SUMMARY_TAIL_BYTES_PATTERN.finditer(buffer, pos, len(buffer) if endpos is None else endpos):
+        start = match.start() - TIMESTAMP_WIDTH
+        if start < pos or not TIMESTAMP_BYTES_PATTERN.fullmatch(buffer, start, match.start()):
+            continue
+        # Only whitespace may come before the timestamp on its line
+        line_start = buffer.rfind(b'\n', 0, start) + 1
+        if line_start != start and buffer[line_start:start].strip():
+            continue
+        yield buffer[start:match.start()], match
+
+
+def scan_summary_buffer(buffer, wifi_filter: str, data: List[Tuple[datetime.datetime, float]]):
+    """Append (timestamp, success rate) for each summary line in a bytes-like buffer matching the WiFi network."""
+    wifi_bytes = wifi_filter.encode('utf-8')
+    for ts, match in iter_summary_matches(buffer):
+        if match.group(1).strip() != wifi_bytes:
+            continue
+        # Fixed-width 'YYYY-MM-DD HH:MM:SS' - slicing is much cheaper than strptime
+        timestamp = datetime.datetime(int(ts[0:4]), int(ts[5:7]), int(ts[8:10]),
+                                      int(ts[11:13]), int(ts[14:16]), int(ts[17:19]))
+        total_sites = int(match.group(3))
+        success_rate = int(match.group(2)) / total_sites if total_sites > 0 else 0
+        data.append((timestamp, success_rate))
+
+
+def _parse_summary_file(log_file: str, wifi_filter: str, data: List[Tuple[datetime.datetime, float]], cache=None):
+    """Append (timestamp, success rate) for each summary line of one log file matching the WiFi network."""
+    if cache is not None:
+        for timestamp_str, wifi_network, accessible_sites, total_sites in cache.get_records(log_file):
+            if wifi_network == wifi_filter:
+                timestamp = datetime.datetime.fromisoformat(timestamp_str)
+                success_rate = accessible_sites / total_sites if total_sites > 0 else 0
+                data.append((timestamp, success_rate))
+        return
+    
+    buffer = _map_log_file(log_file)
+    if buffer is None:
+        with open(log_file, 'r', encoding='utf-8') as f:
+            scan_summary_buffer(f.read().encode('utf-8'), wifi_filter, data)
+        return
+    with buffer:
+        scan_summary_buffer(buffer, wifi_filter, data)
+
+
+def parse_file_chunk(log_file: str, wifi_filter: str) -> Tuple[str, array, Optional[str]]:
+    """Parse one log file into a sorted chunk (process-pool worker).
     
+    Returns (newline-separated ISO timestamps, success rates, error message or None).
+    Text and a flat array pickle far smaller than (datetime, float) tuples, and the
+    timestamps are rebuilt with datetime.fromisoformat, which is much faster than
+    datetime arithmetic in Python.
+    """
+    data = []
+    error = None
+    try:
+        _parse_summary_file(log_file, wifi_filter, data)
+    except Exception as e:
+        error = str(e)
+    data.sort(key=lambda x: x[0])
+    timestamps = '\n'.join(ts.isoformat(' ') for ts, _ in data)
+    rates = array('d', [rate for _, rate in data])
+    return timestamps, rates, error
+
+
+def _worth_a_pool(log_files: List[str], jobs: int) -> bool:
+    """Check whether parsing log_files on jobs processes is likely faster than parsing them here."""
+    if jobs < 2 or len(log_files) < 2:
+        return False
+    total_bytes = 0
     for log_file in log_files:
+        try:
+            total_bytes += os.path.getsize(log_file)
+        except OSError:
+            continue
+    return total_bytes >= POOL_MIN_BYTES
+
+
+def _parse_files_in_pool(log_files: List[str], wifi_filter: str, data: List[Tuple[datetime.datetime, float]], cache, jobs: int):
+    """Parse log files on a pool of jobs processes and append their data (each file's chunk sorted)."""
+    # Imported here: multiprocessing takes longer to import than a small single-process run takes
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        if cache is not None:
+            # Workers bring stale cache entries up to date; reading the fresh entries is cheap
+            cache.refresh(log_files, executor)
+            for log_file in log_files:
+                print(f"Processing: {os.path.basename(log_file)}")
+                try:
+                    _parse_summary_file(log_file, wifi_filter, data, cache)
+                except Exception as e:
+                    print(f"Error parsing {log_file}: {e}")
+            return
+        
+        # Files are in date order, so the chunks are (nearly) sorted runs; the caller's
+        # final sort merges them in about linear time
+        for log_file, (timestamps, rates, error) in zip(
+                log_files, executor.map(parse_file_chunk, log_files, repeat(wifi_filter))):
+            print(f"Processing: {os.path.basename(log_file)}")
+            if error is not None:
+                print(f"Error parsing {log_file}: {error}")
+            if rates:
+                data.extend(zip(map(datetime.datetime.fromisoformat, timestamps.split('\n')), rates))
+
+
+def parse_log_files(logs_dir: str, hostname: str, wifi_filter: str = "GoTitansFC", time_range_hours: int = 72, cache=None,
+                    since: Optional[datetime.datetime] = None, until: Optional[datetime.datetime] = None,
+                    jobs: int = 1) -> List[Tuple[datetime.datetime, float]]:
+    """Parse log files and extract success rate data for specified WiFi network.
+    
+    Without since/until the window is the time_range_hours before the newest data point;
+    with until only, the time_range_hours before until. Log files whose date (from the
+    file name) falls outside the window are not opened.
+    With a LogParseCache, only bytes appended since the previous run are parsed.
+    With jobs > 1, files are parsed on a pool of that many processes once they add up
+    to POOL_MIN_BYTES.
+    """
+    data = []
+    
+    # Find all log files for this hostname
+    log_files = _find_log_files(logs_dir, hostname)
+    if not log_files:
+        return data
+    
+    if since is None and until is not None:
+        since = until - datetime.timedelta(hours=time_range_hours)
+    candidate_files = [log_file for log_file in log_files if log_file_may_overlap(log_file, since, until)]
+    
+    print(f"Parsing {len(candidate_files)} log files...")
+    
+    # Newest first, so that in relative mode the cutoff is known before reaching older files
+    cutoff_time = since
+    skipped_files = len(log_files) - len(candidate_files)
+    pending_files = candidate_files[:]
+    while pending_files:
+        if cutoff_time is not None and _worth_a_pool(pending_files, jobs):
+            # The window is known - parse the rest in parallel
+            break
+        log_file = pending_files.pop()
+        if cutoff_time is not None and not log_file_may_overlap(log_file, cutoff_time, None):
+            skipped_files += 1
+            continue
+        
         print(f"Processing: {os.path.basename(log_file)}")
         
+        file_start = len(data)
+        try:
+            _parse_summary_file(log_file, wifi_filter, data, cache)
+        except Exception as e:
+            print(f"Error parsing {log_file}: {e}")
+        
+        if since is None and len(data) > file_start:
+            file_cutoff = max(ts for ts, _ in data[file_start:]) - datetime.timedelta(hours=time_range_hours)
+            cutoff_time = file_cutoff if cutoff_time is None else max(cutoff_time, file_cutoff)
+    
+    if pending_files:
+        pool_files = [log_file for log_file in pending_files if log_file_may_overlap(log_file, cutoff_time, None)]
+        skipped_files += len(pending_files) - len(pool_files)
+        _parse_files_in_pool(pool_files, wifi_filter, data, cache, jobs)
+    
+    if skipped_files:
+        print(f"Skipped {skipped_files} log files outside the time range")
+    
+    if cache is not None:
+        cache.prune(log_files)
+        cache.save()
+    
+    if until is not None:
+        data = [(ts, rate) for ts, rate in data if ts <= until]
+    
+    # Sort by timestamp
+    data.sort(key=lambda x: x[0])
+    
+    # Filter to specified time range if we have more data
+    if data:
+        if since is None:
+            latest_time = data[-1][0]
+            cutoff_time = latest_time - datetime.timedelta(hours=time_range_hours)
+        else:
+            cutoff_time = since
+        data = [(ts, rate) for ts, rate in data if ts >= cutoff_time]
+    
+    print(f"Found {len(data)} data points for WiFi network '{wifi_filter}'")
+    return data
+
+
+def iter_log_records(logs_dir: str, hostname: str, wifi_filter: str = "GoTitansFC",
+                     since: Optional[datetime.datetime] = None, until: Optional[datetime.datetime] = None,
+                     cache=None) -> Iterator[Tuple[datetime.datetime, float]]:
+    """Lazily yield (timestamp, success rate) for specified WiFi network, file by file in date order.
+    
+    Files outside since/until are skipped by name and records outside them are dropped
+    before being yielded, so without a cache at most one file's records are held in
+    memory at a time. A LogParseCache keeps the records of every cached file in memory
+    (it loads and saves them as one JSON file), so with a cache memory grows with the history.
+    Records come in file order; within a file they are in the order they were logged.
+    """
+    log_files = _find_log_files(logs_dir, hostname)
+    try:
+        for log_file in log_files:
+            if not log_file_may_overlap(log_file, since, until):
+                continue
+            
+            file_data = []
+            try:
+                _parse_summary_file(log_file, wifi_filter, file_data, cache)
+            except Exception as e:
+                print(f"Error parsing {log_file}: {e}")
+            
+            for timestamp, success_rate in file_data:
+                if (since is None or timestamp >= since) and (until is None or timestamp <= until):
+                    yield timestamp, success_rate
+    finally:
+        if cache is not None and log_files:
+            cache.prune(log_files)
+            cache.save()
+
+
+def find_latest_timestamp(logs_dir: str, hostname: str, wifi_filter: str = "GoTitansFC",
+                          until: Optional[datetime.datetime] = None, cache=None) -> Optional[datetime.datetime]:
+    """Find the newest data point for specified WiFi network (at or before until), reading files newest first."""
+    for log_file in reversed(_find_log_files(logs_dir, hostname)):
+        if not log_file_may_overlap(log_file, None, until):
+            continue
+        file_data = []
+        try:
+            _parse_summary_file(log_file, wifi_filter, file_data, cache)
+        except Exception as e:
+            print(f"Error parsing {log_file}: {e}")
+        timestamps = [timestamp for timestamp, _ in file_data if until is None or timestamp <= until]
+        if timestamps:
+            return max(timestamps)
+    return None
+
+
+def get_window_start(logs_dir: str, hostname: str, wifi_filter: str = "GoTitansFC", time_range_hours: int = 72,
+                     since: Optional[datetime.datetime] = None, until: Optional[datetime.datetime] = None,
+                     cache=None) -> Optional[datetime.datetime]:
+    """Resolve the start of the window parse_log_files uses (None when the WiFi network has no rounds)."""
+    if since is not None:
+        return since
+    end_time = until if until is not None else find_latest_timestamp(logs_dir, hostname, wifi_filter, cache=cache)
+    if end_time is None:
+        return None
+    return end_time - datetime.timedelta(hours=time_range_hours)
+
+
+def stream_log_files(logs_dir: str, hostname: str, wifi_filter: str = "GoTitansFC", time_range_hours: int = 72, cache=None,
+                     since: Optional[datetime.datetime] = None, until: Optional[datetime.datetime] = None) -> Iterator[Tuple[datetime.datetime, float]]:
+    """Streaming counterpart of parse_log_files: same window, records yielded lazily instead of returned in a list."""
+    since = get_window_start(logs_dir, hostname, wifi_filter, time_range_hours, since, until, cache)
+    if since is None:
+        return iter(())
+    return iter_log_records(logs_dir, hostname, wifi_filter, since, until, cache)
+
+
+def parse_phase_log_files(logs_dir: str, hostname: str, wifi_filter: str = "GoTitansFC", time_range_hours: int = 72) -> List[Tuple[datetime.datetime, str, Dict[str, float]]]:
+    """Parse per-site phase timings (dns/connect/tls/ttfb) for specified WiFi network."""
+    data = []
+    
+    log_files = _find_log_files(logs_dir, hostname)
+    if not log_files:
+        return data
+    
+    for log_file in log_files:
         try:
             with open(log_file, 'r', encoding='utf-8') as f:
+                timestamp = None
                 for line in f:
                     line = line.strip()
-                    match = summary_pattern.match(line)
-                    
+                    match = SUMMARY_PATTERN.match(line)
                     if match:
-                        timestamp_str = match.group(1)
-                        wifi_network = match.group(2).strip()
-                        accessible_sites = int(match.group(3))
-                        total_sites = int(match.group(4))
-                        
-                        # Filter by WiFi network
-                        if wifi_network == wifi_filter:
-                            timestamp = datetime.datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S')
-                            success_rate = accessible_sites / total_sites if total_sites > 0 else 0
-                            data.append((timestamp, success_rate))
+                        # Detail lines belong to the most recent summary line
+                        timestamp = None
+                        if match.group(2).strip() == wifi_filter:
+                            timestamp = datetime.datetime.strptime(match.group(1), '%Y-%m-%d %H:%M:%S')
+                        continue
+                    
+                    if timestamp is None:
+                        continue
+                    site_match = SITE_PATTERN.match(line)
+                    if site_match and site_match.group(4):
+                        data.append((timestamp, site_match.group(2), parse_phase_timings(site_match.group(4))))
         
         except Exception as e:
             print(f"Error parsing {log_file}: {e}")
     
-    # Sort by timestamp
     data.sort(key=lambda x: x[0])
     
-    # Filter to specified time range if we have more data
     if data:
-        latest_time = data[-1][0]
-        cutoff_time = latest_time - datetime.timedelta(hours=time_range_hours)
+        cutoff_time = data[-1][0] - datetime.timedelta(hours=time_range_hours)
+        data = [record for record in data if record[0] >= cutoff_time]
+    
+    print(f"Found {len(data)} phase timings for WiFi network '{wifi_filter}'")
+    return data
+
+
+class SiteRecord(NamedTuple):
+    """One per-site check from a detail line, attributed to its round's timestamp."""
+    timestamp: datetime.datetime
+    url: str
+    duration: float
+    status_class: str
+    error: Optional[str]
+    phases: Dict[str, float]
+
+
+def classify_status(status: str) -> Tuple[str, Optional[str]]:
+    """Classify a logged status into (status class, error text or None).
+    
+    Classes: 'success', 'redirect' (HTTP_3xx), 'non_200' (other HTTP_ codes, e.g. 204),
+    'timeout', 'http_error', 'dns', 'ssl', 'connection' or 'other'.
+    """
+    if status == 'SUCCESS':
+        return 'success', None
+    if status.startswith('HTTP_3'):
+        return 'redirect', None
+    if status.startswith('HTTP_'):
+        return 'non_200', None
+    error = status[len('FAILED: '):] if status.startswith('FAILED: ') else status
+    for text, status_class in ERROR_CLASSES:
+        if text in error:
+            return status_class, error
+    return 'other', error
+
+
+def scan_entries_buffer(buffer, wifi_filter: str, data: List[Tuple[datetime.datetime, float]], site_records: List[SiteRecord]):
+    """Append summary data points and per-site records for specified WiFi network from a bytes-like buffer."""
+    wifi_bytes = wifi_filter.encode('utf-8')
+    timestamp = None
+    for match in ENTRY_BYTES_PATTERN.finditer(buffer):
+        ts = match.group(1)
+        if ts is not None:
+            # Detail lines belong to the most recent summary line
+            timestamp = None
+            if match.group(2).strip() == wifi_bytes:
+                timestamp = datetime.datetime(int(ts[0:4]), int(ts[5:7]), int(ts[8:10]),
+                                              int(ts[11:13]), int(ts[14:16]), int(ts[17:19]))
+                total_sites = int(match.group(4))
+                data.append((timestamp, int(match.group(3)) / total_sites if total_sites > 0 else 0))
+            continue
+        
+        if timestamp is None:
+            continue
+        status_class, error = classify_status(match.group(7).decode('utf-8', errors='replace'))
+        phases = parse_phase_timings(match.group(8).decode('ascii')) if match.group(8) else {}
+        site_records.append(SiteRecord(timestamp, match.group(6).decode('utf-8', errors='replace'),
+                                       float(match.group(5)), status_class, error, phases))
+
+
+def _parse_entries_file(log_file: str, wifi_filter: str, data: List[Tuple[datetime.datetime, float]], site_records: List[SiteRecord]):
+    """Append summary data points and per-site records from one log file."""
+    buffer = _map_log_file(log_file)
+    if buffer is None:
+        with open(log_file, 'rb') as f:
+            scan_entries_buffer(f.read(), wifi_filter, data, site_records)
+        return
+    with buffer:
+        scan_entries_buffer(buffer, wifi_filter, data, site_records)
+
+
+def parse_log_entries(logs_dir: str, hostname: str, wifi_filter: str = "GoTitansFC", time_range_hours: int = 72,
+                      since: Optional[datetime.datetime] = None, until: Optional[datetime.datetime] = None) -> Tuple[List[Tuple[datetime.datetime, float]], List[SiteRecord]]:
+    """Parse summary data points and per-site records in a single pass over the log files.
+    
+    Returns (the data parse_log_files would return, the matching SiteRecords sorted by timestamp).
+    """
+    data = []
+    site_records = []
+    
+    log_files = _find_log_files(logs_dir, hostname)
+    if not log_files:
+        return data, site_records
+    
+    if since is None and until is not None:
+        since = until - datetime.timedelta(hours=time_range_hours)
+    
+    # Newest first, so that in relative mode the cutoff is known before reaching older files
+    cutoff_time = since
+    for log_file in reversed(log_files):
+        if not log_file_may_overlap(log_file, cutoff_time, until):
+            continue
+        
+        file_start = len(data)
+        try:
+            _parse_entries_file(log_file, wifi_filter, data, site_records)
+        except Exception as e:
+            print(f"Error parsing {log_file}: {e}")
+        
+        if since is None and len(data) > file_start:
+            file_cutoff = max(ts for ts, _ in data[file_start:]) - datetime.timedelta(hours=time_range_hours)
+            cutoff_time = file_cutoff if cutoff_time is None else max(cutoff_time, file_cutoff)
+    
+    if until is not None:
+        data = [(ts, rate) for ts, rate in data if ts <= until]
+    data.sort(key=lambda x: x[0])
+    
+    if data:
+        if since is None:
+            cutoff_time = data[-1][0] - datetime.timedelta(hours=time_range_hours)
+        else:
+            cutoff_time = since
         data = [(ts, rate) for ts, rate in data if ts >= cutoff_time]
+        site_records = [record for record in site_records
+                        if cutoff_time <= record.timestamp and (until is None or record.timestamp <= until)]
+        site_records.sort(key=lambda record: record.timestamp)
+    else:
+        site_records = []
     
-    print(f"Found {len(data)} data points for WiFi network '{wifi_filter}'")
-    return data
\ No newline at end of file
+    print(f"Found {len(data)} data points and {len(site_records)} site checks for WiFi network '{wifi_filter}'")
+    return data, site_records
@@ -0,0 +1,136 @@
+"""
+Persistent parse cache for connectivity log files.
+
+Stores the summary records already parsed from each log file together with the
+file's size, mtime, the byte offset parsing stopped at and a fingerprint of the
+bytes before it, so that later runs only parse the bytes appended since
+(past-day files are not read at all) and files rewritten in place are reparsed.
+"""
+
+import json
+import mmap
+import os
+from typing import List, Tuple
+from .log_parser import _map_log_file, get_prefix_fingerprint, iter_summary_matches
+
+
+# Bump when the cached record layout changes; older caches are discarded
+CACHE_VERSION = 2
+
+# (timestamp 'YYYY-MM-DD HH:MM:SS', wifi network, accessible sites, total sites)
+SummaryRecord = Tuple[str, str, int, int]
+
+
+def get_parse_cache_path(logs_dir: str, hostname: str) -> str:
+    """Get the parse cache file for a hostname (in the untracked logs/.cache directory)."""
+    return os.path.join(logs_dir, '.cache', f'parse_cache_{hostname}.json')
+
+
+def parse_summary_records(buffer, offset: int = 0) -> Tuple[List[SummaryRecord], int]:
+    """Parse summary lines from a bytes-like buffer starting at offset; returns (records, offset after last full line)."""
+    # A last line without its newline is still being written - parse it on the next run
+    end = buffer.rfind(b'\n', offset) + 1
+    if end <= offset:
+        return [], offset
+    records = [(ts.decode('ascii'), match.group(1).strip().decode('utf-8', errors='replace'),
+                int(match.group(2)), int(match.group(3)))
+               for ts, match in iter_summary_matches(buffer, offset, end)]
+    return records, end
+
+
+def build_cache_entry(log_file: str, entry=None) -> dict:
+    """Build the cache entry of a log file, continuing from a previous entry where possible."""
+    # Stat before reading, so bytes appended meanwhile make the entry stale rather than skipped
+    stat = os.stat(log_file)
+    buffer = _map_log_file(log_file)
+    if buffer is None:
+        with open(log_file, 'rb') as f:
+            buffer = f.read()
+    try:
+        if (entry is None or len(buffer) < entry['offset']
+                or entry.get('prefix') != get_prefix_fingerprint(buffer, entry['offset'], stat.st_ino)):
+            # New file, or it was truncated, replaced or rewritten (log rotation, git checkout) - parse from the start
+            entry = {'offset': 0, 'records': []}
+        records, offset = parse_summary_records(buffer, entry['offset'])
+        prefix = get_prefix_fingerprint(buffer, offset, stat.st_ino)
+    finally:
+        if isinstance(buffer, mmap.mmap):
+            buffer.close()
+
+    return {
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'offset': offset,
+        'prefix': prefix,
+        'records': entry['records'] + [list(record) for record in records]
+    }
+
+
+class LogParseCache:
+    """Per-file summary records, loaded from and saved to a JSON cache file."""
+
+    def __init__(self, cache_path: str):
+        self.cache_path = cache_path
+        self.files = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        """Load the cache file, starting empty if it is missing, unreadable or outdated."""
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(cache, dict) and cache.get('version') == CACHE_VERSION:
+            self.files = cache.get('files', {})
+
+    def is_fresh(self, log_file: str) -> bool:
+        """Check whether the cached records of a log file are up to date (without reading it)."""
+        entry = self.files.get(os.path.basename(log_file))
+        if not entry:
+            return False
+        stat = os.stat(log_file)
+        return entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns
+
+    def get_records(self, log_file: str) -> List[SummaryRecord]:
+        """Get all summary records of a log file, parsing only what was appended since the last run."""
+        key = os.path.basename(log_file)
+        if self.is_fresh(log_file):
+            return self.files[key]['records']
+
+        self.files[key] = build_cache_entry(log_file, self.files.get(key))
+        self._dirty = True
+        return self.files[key]['records']
+
+    def refresh(self, log_files: List[str], executor):
+        """Bring the entries of stale log files up to date, parsing them on an executor (e.g. a process pool)."""
+        stale_files = [log_file for log_file in log_files if not self.is_fresh(log_file)]
+        entries = [self.files.get(os.path.basename(log_file)) for log_file in stale_files]
+        for log_file, entry in zip(stale_files, executor.map(build_cache_entry, stale_files, entries)):
+            self.files[os.path.basename(log_file)] = entry
+            self._dirty = True
+
+    def prune(self, log_files: List[str]):
+        """Forget files that are no longer present."""
+        keep = {os.path.basename(log_file) for log_file in log_files}
+        for key in list(self.files):
+            if key not in keep:
+                del self.files[key]
+                self._dirty = True
+
+    def save(self) -> bool:
+        """Atomically write the cache file if anything changed."""
+        if not self._dirty:
+            return True
+        try:
+            os.makedirs(os.path.dirname(self.cache_path) or '.', exist_ok=True)
+            tmp_path = f"{self.cache_path}.tmp.{os.getpid()}"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': CACHE_VERSION, 'files': self.files}, f)
+            os.replace(tmp_path, self.cache_path)
+            self._dirty = False
+            return True
+        except OSError as e:
+            print(f"Could not save parse cache {self.cache_path}: {e}")
+            return False
@@ -7,6 +7,10 @@ import os
 import sys
 
 
+# Chart formats by output file extension
+EXTENSION_FORMATS = {'png': 'png', 'svg': 'svg', 'html': 'html', 'htm': 'html'}
+
+
 def setup_logs_directory(script_path: str) -> str:
     """Set up and validate the logs directory path."""
     script_dir = os.path.dirname(os.path.abspath(script_path))
@@ -19,10 +23,11 @@ def setup_logs_directory(script_path: str) -> str:
     return logs_dir
 
 
-def generate_output_filename(hostname: str, wifi_network: str, time_range_hours: int, interval_minutes: int, output_dir: str) -> str:
+def generate_output_filename(hostname: str, wifi_network: str, time_range_hours: int, interval_minutes: int, output_dir: str,
+                             output_format: str = 'png') -> str:
     """Generate an automatic output filename with timestamp."""
     timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
-    filename = f"connectivity_plot_{hostname}_{wifi_network}_{time_range_hours}h_{interval_minutes}m_{timestamp}.png"
+    filename = f"connectivity_plot_{hostname}_{wifi_network}_{time_range_hours}h_{interval_minutes}m_{timestamp}.{output_format}"
     output_file = os.path.join(output_dir, filename)
     
     # Ensure output directory exists
@@ -31,6 +36,29 @@ def generate_output_filename(hostname: str, wifi_network: str, time_range_hours:
     return output_file
 
 
+def get_output_format(output_format: str = None, output_file: str = None) -> str:
+    """Get a chart's format: output_format if set, else output_file's extension if it is svg or html, else png."""
+    if output_format:
+        return output_format
+    return EXTENSION_FORMATS.get(_get_extension(output_file), 'png')
+
+
+def check_output_format(output_format: str = None, output_file: str = None):
+    """Raise ValueError if output_file's extension names a different format than output_format."""
+    extension_format = EXTENSION_FORMATS.get(_get_extension(output_file))
+    if output_format and extension_format and extension_format != output_format:
+        raise ValueError(f"output file '{output_file}' is not a {output_format} file")
+
+
+def _get_extension(output_file: str = None) -> str:
+    return os.path.splitext(output_file or '')[1].lower().lstrip('.')
+
+
+def resolve_output_format(args) -> str:
+    """Resolve the output format based on arguments (--format, else the --output extension)."""
+    return get_output_format(getattr(args, 'format', None), args.output)
+
+
 def resolve_output_path(args) -> str:
     """Resolve the final output file path based on arguments."""
     if args.output:
@@ -41,5 +69,6 @@ def resolve_output_path(args) -> str:
             args.wifi_network, 
             args.time_range, 
             args.interval, 
-            args.output_dir
+            args.output_dir,
+            resolve_output_format(args)
         )
\ No newline at end of file
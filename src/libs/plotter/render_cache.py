@@ -0,0 +1,98 @@
+"""
+Render cache for connectivity plots.
+
+Rendered PNGs are stored under a digest of the aggregated series and the plot
+parameters in the untracked logs/.cache/renders directory, so re-running the
+plotter when no new rounds arrived copies the previous image instead of
+rendering it again. The least recently used images are evicted once the
+cache grows past its size limit.
+"""
+
+import hashlib
+import os
+import shutil
+from typing import List, Optional, Tuple
+
+
+# Bump when plot_success_rates changes how charts look; older renders are no longer used
+STYLE_VERSION = 2
+
+DEFAULT_MAX_BYTES = 100 * 1024 * 1024
+
+
+def get_render_cache_dir(logs_dir: str) -> str:
+    """Get the render cache directory (in the untracked logs/.cache directory)."""
+    return os.path.join(logs_dir, '.cache', 'renders')
+
+
+def render_cache_key(aggregated_data: List[Tuple], hostname: str, wifi_network: str, interval_minutes: int,
+                     style: int = STYLE_VERSION) -> str:
+    """Get the digest identifying a chart: the aggregated series plus everything else drawn on it."""
+    digest = hashlib.sha256(f"{style}\0{hostname}\0{wifi_network}\0{interval_minutes}\n".encode('utf-8'))
+    digest.update(''.join(f"{timestamp.isoformat()} {rate!r} {status}\n"
+                          for timestamp, rate, status in aggregated_data).encode('utf-8'))
+    return digest.hexdigest()
+
+
+class RenderCache:
+    """Rendered PNGs keyed by render_cache_key, with least-recently-used eviction."""
+
+    def __init__(self, cache_dir: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.png")
+
+    def get(self, key: str) -> Optional[str]:
+        """Get the cached PNG for key (marking it as recently used), or None."""
+        path = self._path(key)
+        try:
+            os.utime(path)
+        except OSError:
+            return None
+        return path
+
+    def put(self, key: str, png_file: str) -> Optional[str]:
+        """Store a copy of a rendered PNG under key, then evict old renders; returns the cached path."""
+        path = self._path(key)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{path}.tmp.{os.getpid()}"
+            shutil.copyfile(png_file, tmp_path)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Could not cache plot {png_file}: {e}")
+            return None
+        self.evict()
+        return path
+
+    def evict(self):
+        """Delete the least recently used renders until the cache fits in max_bytes."""
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith('.png'):
+                stat = entry.stat()
+                entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+
+        total_bytes = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_bytes <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total_bytes -= size
+
+
+def copy_cached_render(cached_file: str, output_file: str) -> Optional[str]:
+    """Copy a cached render to the requested output path; returns output_file, or None on failure."""
+    try:
+        shutil.copyfile(cached_file, output_file)
+    except OSError as e:
+        print(f"Could not copy cached plot to {output_file}: {e}")
+        return None
+    print(f"Plot unchanged since an earlier run, reused {cached_file}")
+    print(f"Plot saved to: {output_file}")
+    return output_file
@@ -0,0 +1,304 @@
+"""
+Materialized rollups of connectivity data.
+
+Keeps the sum of success rates and the number of rounds per WiFi network at
+several resolutions (1 minute, 15 minutes, 1 hour, 1 day) plus per second for
+cutting window edges, and per-site latency histograms from 15 minutes up, in a SQLite file in the untracked logs/.cache
+directory. Each run only folds in the log bytes
+appended since the previous one, and aggregate_by_interval serves an interval
+from the coarsest rollup that divides it, so month- and year-long charts read a
+few hundred rows instead of every round.
+"""
+
+import datetime
+import mmap
+import os
+import sqlite3
+from typing import Dict, List, Optional, Tuple
+from .latency_sketch import LatencyHistogram, bucket_index
+from .log_parser import COLUMN_EPOCH, ENTRY_BYTES_PATTERN, _find_log_files, _map_log_file, get_prefix_fingerprint
+
+
+# Rollup resolutions in minutes; each one divides the next, and all are aligned to COLUMN_EPOCH
+ROLLUP_RESOLUTIONS = (1, 15, 60, 1440)
+
+# Latency histograms are kept from 15 minutes up; a 1-minute bin holds about one check per site
+LATENCY_RESOLUTIONS = (15, 60, 1440)
+
+# Bump when the schema or the meaning of stored values changes; older stores are rebuilt
+ROLLUP_VERSION = 4
+
+# Seconds to wait for another run's update to finish (a first build over a long history takes a while)
+ROLLUP_LOCK_TIMEOUT = 300
+
+TABLES = ('files', 'networks', 'rollups', 'seconds', 'latency')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    name TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    offset INTEGER NOT NULL,
+    prefix TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS networks (
+    wifi_network TEXT PRIMARY KEY,
+    latest INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS rollups (
+    wifi_network TEXT NOT NULL,
+    resolution INTEGER NOT NULL,
+    bin INTEGER NOT NULL,
+    total REAL NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (wifi_network, resolution, bin)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS seconds (
+    wifi_network TEXT NOT NULL,
+    second INTEGER NOT NULL,
+    total REAL NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (wifi_network, second)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS latency (
+    wifi_network TEXT NOT NULL,
+    url TEXT NOT NULL,
+    resolution INTEGER NOT NULL,
+    bin INTEGER NOT NULL,
+    bucket INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (wifi_network, url, resolution, bin, bucket)
+) WITHOUT ROWID;
+"""
+
+ONE_SECOND = datetime.timedelta(seconds=1)
+
+
+def get_rollup_path(logs_dir: str, hostname: str) -> str:
+    """Get the rollup database of a hostname (in the untracked logs/.cache directory)."""
+    return os.path.join(logs_dir, '.cache', f'rollups_{hostname}.db')
+
+
+def get_rollup_resolution(interval_minutes: int, resolutions=ROLLUP_RESOLUTIONS) -> Optional[int]:
+    """Get the coarsest rollup resolution that divides interval_minutes (None if there is none)."""
+    return max((resolution for resolution in resolutions if interval_minutes % resolution == 0), default=None)
+
+
+def _timestamp_seconds(timestamp_str: str) -> int:
+    """Convert a log timestamp ('YYYY-MM-DD HH:MM:SS') to seconds since COLUMN_EPOCH."""
+    return (datetime.datetime.fromisoformat(timestamp_str) - COLUMN_EPOCH) // ONE_SECOND
+
+
+class RollupStore:
+    """Per-network rollups of one host's log files, kept in a SQLite database."""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+        self.connection = sqlite3.connect(db_path, timeout=ROLLUP_LOCK_TIMEOUT)
+        if self.connection.execute('PRAGMA user_version').fetchone()[0] != ROLLUP_VERSION:
+            self._drop_tables()
+        self.connection.executescript(SCHEMA)
+        self.connection.execute(f'PRAGMA user_version = {ROLLUP_VERSION}')
+
+    def _drop_tables(self):
+        with self.connection:
+            for table in TABLES:
+                self.connection.execute(f'DROP TABLE IF EXISTS {table}')
+
+    def close(self):
+        self.connection.close()
+
+    def update(self, log_files: List[str]) -> int:
+        """Fold rounds appended to log_files since the last update into the rollups; returns the number added.
+
+        Rollups of log files that were deleted are kept. If a file was truncated, replaced
+        or rewritten in place, its old rounds can't be subtracted, so the store is rebuilt
+        from log_files. The offsets are read and advanced in one write transaction, so
+        concurrent runs wait for each other instead of folding the same bytes in twice.
+        """
+        with self.connection:
+            self.connection.execute('BEGIN IMMEDIATE')
+            rounds = self._fold_appended(log_files)
+
+        if rounds:
+            print(f"Added {rounds} rounds to rollups")
+        return rounds
+
+    def _fold_appended(self, log_files: List[str]) -> int:
+        """Parse the bytes appended to log_files and add them to the rollups (inside update's transaction)."""
+        known_files = {name: (size, mtime_ns, offset, prefix) for name, size, mtime_ns, offset, prefix
+                       in self.connection.execute('SELECT name, size, mtime_ns, offset, prefix FROM files')}
+
+        # Group new rounds per (network, resolution, bin) before touching the database
+        totals: Dict[Tuple[str, int, int], List[float]] = {}
+        second_totals: Dict[Tuple[str, int], List[float]] = {}
+        latency: Dict[Tuple[str, str, int, int, int], int] = {}
+        latest: Dict[str, int] = {}
+        file_rows = []
+        rounds = 0
+        for log_file in log_files:
+            name = os.path.basename(log_file)
+            # Stat before reading, so bytes appended meanwhile are picked up by the next update
+            stat = os.stat(log_file)
+            known = known_files.get(name)
+            if known is not None and known[:2] == (stat.st_size, stat.st_mtime_ns):
+                continue
+            offset = known[2] if known else 0
+
+            buffer = _map_log_file(log_file)
+            if buffer is None:
+                with open(log_file, 'rb') as f:
+                    buffer = f.read()
+            try:
+                if known is not None and (len(buffer) < offset
+                                          or get_prefix_fingerprint(buffer, offset, stat.st_ino) != known[3]):
+                    # Truncated, replaced or rewritten in place (log rotation, git checkout) - start over
+                    for table in TABLES:
+                        self.connection.execute(f'DELETE FROM {table}')
+                    return self._fold_appended(log_files)
+
+                # Stop after the last complete line; the rest is still being written
+                end = max(offset, buffer.rfind(b'\n') + 1)
+                file_rows.append((name, stat.st_size, stat.st_mtime_ns, end,
+                                  get_prefix_fingerprint(buffer, end, stat.st_ino)))
+
+                wifi_network = None
+                for match in ENTRY_BYTES_PATTERN.finditer(buffer, offset, end):
+                    ts = match.group(1)
+                    if ts is not None:
+                        wifi_network = match.group(2).strip().decode('utf-8', errors='replace')
+                        seconds = _timestamp_seconds(ts.decode('ascii'))
+                        total_count = int(match.group(4))
+                        success_rate = int(match.group(3)) / total_count if total_count > 0 else 0
+                        for resolution in ROLLUP_RESOLUTIONS:
+                            bin_totals = totals.setdefault((wifi_network, resolution, seconds // (resolution * 60)), [0.0, 0])
+                            bin_totals[0] += success_rate
+                            bin_totals[1] += 1
+                        second_bin_totals = second_totals.setdefault((wifi_network, seconds), [0.0, 0])
+                        second_bin_totals[0] += success_rate
+                        second_bin_totals[1] += 1
+                        latest[wifi_network] = max(latest.get(wifi_network, seconds), seconds)
+                        rounds += 1
+                    elif wifi_network is not None and (match.group(7) == b'SUCCESS' or match.group(7).startswith(b'HTTP_')):
+                        # Latency of checks that got a response, attributed to the round above them
+                        url = match.group(6).decode('utf-8', errors='replace')
+                        bucket = bucket_index(float(match.group(5)))
+                        for resolution in LATENCY_RESOLUTIONS:
+                            key = (wifi_network, url, resolution, seconds // (resolution * 60), bucket)
+                            latency[key] = latency.get(key, 0) + 1
+            finally:
+                if isinstance(buffer, mmap.mmap):
+                    buffer.close()
+
+        self.connection.executemany(
+            'INSERT INTO rollups (wifi_network, resolution, bin, total, count) VALUES (?, ?, ?, ?, ?) '
+            'ON CONFLICT (wifi_network, resolution, bin) '
+            'DO UPDATE SET total = total + excluded.total, count = count + excluded.count',
+            [(*key, total, count) for key, (total, count) in totals.items()]
+        )
+        self.connection.executemany(
+            'INSERT INTO seconds (wifi_network, second, total, count) VALUES (?, ?, ?, ?) '
+            'ON CONFLICT (wifi_network, second) '
+            'DO UPDATE SET total = total + excluded.total, count = count + excluded.count',
+            [(*key, total, count) for key, (total, count) in second_totals.items()]
+        )
+        self.connection.executemany(
+            'INSERT INTO networks (wifi_network, latest) VALUES (?, ?) '
+            'ON CONFLICT (wifi_network) DO UPDATE SET latest = MAX(latest, excluded.latest)',
+            latest.items()
+        )
+        self.connection.executemany(
+            'INSERT INTO latency (wifi_network, url, resolution, bin, bucket, count) VALUES (?, ?, ?, ?, ?, ?) '
+            'ON CONFLICT (wifi_network, url, resolution, bin, bucket) DO UPDATE SET count = count + excluded.count',
+            [(*key, count) for key, count in latency.items()]
+        )
+        self.connection.executemany('INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?)', file_rows)
+        return rounds
+
+    def window(self, wifi_network: str, time_range_hours: int = 72, since: Optional[datetime.datetime] = None,
+               until: Optional[datetime.datetime] = None) -> 'RollupWindow':
+        """Select the plot window the way parse_log_files does (until alone means time_range_hours before it)."""
+        if since is None and until is None:
+            row = self.connection.execute('SELECT latest FROM networks WHERE wifi_network = ?',
+                                          (wifi_network,)).fetchone()
+            until_seconds = row[0] if row else 0
+            since_seconds = until_seconds - time_range_hours * 3600
+        else:
+            if since is None:
+                since = until - datetime.timedelta(hours=time_range_hours)
+            since_seconds = (since - COLUMN_EPOCH) // ONE_SECOND
+            until_seconds = (until - COLUMN_EPOCH) // ONE_SECOND if until is not None else None
+        return RollupWindow(self, wifi_network, since_seconds, until_seconds)
+
+
+class RollupWindow:
+    """One network's rollups within a time window, as accepted by aggregate_by_interval.
+
+    Whole rollup bins inside the window are read at the coarse resolution and the
+    partial bins at its edges per second, so the window is cut exactly where
+    parse_log_files cuts it.
+    """
+
+    def __init__(self, store: RollupStore, wifi_network: str, since_seconds: int, until_seconds: Optional[int]):
+        self.store = store
+        self.wifi_network = wifi_network
+        self.since_seconds = since_seconds
+        self.until_seconds = until_seconds
+
+    def interval_totals(self, interval_minutes: int) -> Dict[int, List[float]]:
+        """Get [sum of success rates, rounds] per interval index (epoch seconds // interval)."""
+        resolution = get_rollup_resolution(interval_minutes)
+        step = resolution * 60
+        first_second = self.since_seconds
+        last_second = self.until_seconds if self.until_seconds is not None else 2 ** 53
+
+        # Coarse bins that lie entirely inside the window, and the seconds left over on either side
+        first_bin = -(-first_second // step)
+        last_bin = (last_second + 1) // step - 1
+        if first_bin > last_bin:
+            edges = [(first_second, last_second), (1, 0)]
+        else:
+            edges = [(first_second, first_bin * step - 1), ((last_bin + 1) * step, last_second)]
+
+        rows = self.store.connection.execute(
+            'SELECT interval, SUM(total), SUM(count) FROM ('
+            '  SELECT bin * ? / ? AS interval, total, count FROM rollups '
+            '  WHERE wifi_network = ? AND resolution = ? AND bin BETWEEN ? AND ? '
+            '  UNION ALL '
+            '  SELECT second / ? AS interval, total, count FROM seconds '
+            '  WHERE wifi_network = ? AND (second BETWEEN ? AND ? OR second BETWEEN ? AND ?)'
+            ') GROUP BY interval',
+            (resolution, interval_minutes, self.wifi_network, resolution, first_bin, last_bin,
+             interval_minutes * 60, self.wifi_network, *edges[0], *edges[1])
+        )
+        print(f"Serving {interval_minutes}-minute intervals from {resolution}-minute rollups")
+        return {interval: [total, count] for interval, total, count in rows}
+
+    def latency_histograms(self, interval_minutes: int) -> Dict[str, Dict[int, LatencyHistogram]]:
+        """Get a latency histogram per site and interval index, merged from the latency rollups.
+
+        The window edges are rounded to whole rollup bins, and interval_minutes must be
+        a multiple of 15.
+        """
+        resolution = get_rollup_resolution(interval_minutes, LATENCY_RESOLUTIONS)
+        if resolution is None:
+            raise ValueError(f"latency rollups need an interval that is a multiple of {LATENCY_RESOLUTIONS[0]} minutes")
+        step = resolution * 60
+        last_bin = self.until_seconds // step if self.until_seconds is not None else 2 ** 53
+        rows = self.store.connection.execute(
+            'SELECT url, bin * ? / ? AS interval, bucket, SUM(count) FROM latency '
+            'WHERE wifi_network = ? AND resolution = ? AND bin BETWEEN ? AND ? GROUP BY url, interval, bucket',
+            (resolution, interval_minutes, self.wifi_network, resolution, self.since_seconds // step, last_bin)
+        )
+        histograms = {}
+        for url, interval, bucket, count in rows:
+            histograms.setdefault(url, {}).setdefault(interval, LatencyHistogram()).buckets[bucket] = count
+        return histograms
+
+
+def open_rollups(logs_dir: str, hostname: str) -> RollupStore:
+    """Open a hostname's rollups, brought up to date with its log files."""
+    store = RollupStore(get_rollup_path(logs_dir, hostname))
+    store.update(_find_log_files(logs_dir, hostname))
+    return store
@@ -0,0 +1,117 @@
+"""
+SQLite loading functionality for connectivity data.
+
+Reads the database written by the checker's --sqlite option with indexed range
+queries, as an alternative to parsing the text log files.
+"""
+
+import datetime
+import os
+import sqlite3
+from typing import Dict, List, Optional, Tuple
+
+
+# File name of the checker's results database inside the logs directory
+DB_FILE_NAME = 'connectivity.db'
+
+PHASES = ('dns', 'connect', 'tls', 'ttfb')
+
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def _open_database(db_path: str) -> Optional[sqlite3.Connection]:
+    """Open the results database read-only, or return None if it doesn't exist."""
+    if not os.path.exists(db_path):
+        print(f"Error: SQLite database not found: {db_path}")
+        return None
+    return sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+
+
+def _get_window_condition(connection: sqlite3.Connection, hostname: str, wifi_filter: str, time_range_hours: int,
+                          since: Optional[datetime.datetime], until: Optional[datetime.datetime]) -> Optional[Tuple[str, tuple]]:
+    """Get the SQL condition (and parameters) selecting the plotted time window, or None if there are no rounds.
+
+    since/until are local times, as in the log files; without them the window is the
+    time_range_hours before the newest round (by UTC timestamp).
+    """
+    if since is not None or until is not None:
+        if since is None:
+            since = until - datetime.timedelta(hours=time_range_hours)
+        if until is None:
+            return 'rounds.timestamp >= ?', (since.strftime(TIMESTAMP_FORMAT),)
+        return 'rounds.timestamp BETWEEN ? AND ?', (since.strftime(TIMESTAMP_FORMAT), until.strftime(TIMESTAMP_FORMAT))
+
+    row = connection.execute(
+        'SELECT MAX(timestamp_utc) FROM rounds WHERE hostname = ? AND wifi_network = ?',
+        (hostname, wifi_filter)
+    ).fetchone()
+    if row[0] is None:
+        return None
+    latest_time = datetime.datetime.strptime(row[0], TIMESTAMP_FORMAT)
+    cutoff_time = latest_time - datetime.timedelta(hours=time_range_hours)
+    return 'rounds.timestamp_utc >= ?', (cutoff_time.strftime(TIMESTAMP_FORMAT),)
+
+
+def load_success_rates(db_path: str, hostname: str, wifi_filter: str = "GoTitansFC", time_range_hours: int = 72,
+                       since: Optional[datetime.datetime] = None, until: Optional[datetime.datetime] = None) -> List[Tuple[datetime.datetime, float]]:
+    """Load success rate data for specified WiFi network (same result as parse_log_files)."""
+    data = []
+
+    connection = _open_database(db_path)
+    if connection is None:
+        return data
+
+    try:
+        window = _get_window_condition(connection, hostname, wifi_filter, time_range_hours, since, until)
+        if window is not None:
+            condition, params = window
+            rows = connection.execute(
+                'SELECT timestamp, success_count, total_count FROM rounds '
+                f'WHERE hostname = ? AND wifi_network = ? AND {condition} ORDER BY timestamp_utc',
+                (hostname, wifi_filter, *params)
+            )
+            for timestamp_str, success_count, total_count in rows:
+                timestamp = datetime.datetime.strptime(timestamp_str, TIMESTAMP_FORMAT)
+                success_rate = success_count / total_count if total_count > 0 else 0
+                data.append((timestamp, success_rate))
+    except sqlite3.Error as e:
+        print(f"Error reading {db_path}: {e}")
+    finally:
+        connection.close()
+
+    print(f"Found {len(data)} data points for WiFi network '{wifi_filter}'")
+    return data
+
+
+def load_phase_timings(db_path: str, hostname: str, wifi_filter: str = "GoTitansFC", time_range_hours: int = 72,
+                       since: Optional[datetime.datetime] = None, until: Optional[datetime.datetime] = None) -> List[Tuple[datetime.datetime, str, Dict[str, float]]]:
+    """Load per-site phase timings for specified WiFi network (same result as parse_phase_log_files)."""
+    data = []
+
+    connection = _open_database(db_path)
+    if connection is None:
+        return data
+
+    try:
+        window = _get_window_condition(connection, hostname, wifi_filter, time_range_hours, since, until)
+        if window is not None:
+            condition, params = window
+            rows = connection.execute(
+                'SELECT rounds.timestamp, checks.url, checks.dns, checks.connect, checks.tls, checks.ttfb '
+                'FROM rounds JOIN checks ON checks.round_id = rounds.id '
+                f'WHERE rounds.hostname = ? AND rounds.wifi_network = ? AND {condition} '
+                'ORDER BY rounds.timestamp_utc, checks.rowid',
+                (hostname, wifi_filter, *params)
+            )
+            for timestamp_str, url, *timings in rows:
+                phases = {phase: seconds for phase, seconds in zip(PHASES, timings) if seconds is not None}
+                if phases:
+                    timestamp = datetime.datetime.strptime(timestamp_str, TIMESTAMP_FORMAT)
+                    data.append((timestamp, url, phases))
+    except sqlite3.Error as e:
+        print(f"Error reading {db_path}: {e}")
+    finally:
+        connection.close()
+
+    print(f"Found {len(data)} phase timings for WiFi network '{wifi_filter}'")
+    return data
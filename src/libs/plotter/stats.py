@@ -0,0 +1,114 @@
+"""
+Uptime and outage summaries without rendering a chart.
+
+Summarizes the rounds of one host and WiFi network over the plotted window:
+availability and outage episodes (from libs.checker.outages), the aggregated
+intervals, and the share of failed checks per site. Used by the --stats and
+--json modes of plot_outage_graph.py, which never import matplotlib.
+"""
+
+import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+from ..checker.outages import detect_outages
+from .log_parser import SiteRecord
+
+
+def site_failure_shares(site_records: Iterable[SiteRecord]) -> Dict[str, Dict[str, object]]:
+    """Get {url: {'checks', 'failed', 'failure_share'}} with the most failing sites first.
+
+    A check failed unless it succeeded, as in the summary line and outage detection;
+    redirects and other HTTP statuses count as failed.
+    """
+    counts = {}
+    for record in site_records:
+        totals = counts.setdefault(record.url, [0, 0])
+        totals[0] += 1
+        if record.status_class != 'success':
+            totals[1] += 1
+    ordered = sorted(counts.items(), key=lambda item: (-item[1][1] / item[1][0], item[0]))
+    return {url: {'checks': checks, 'failed': failed, 'failure_share': failed / checks}
+            for url, (checks, failed) in ordered}
+
+
+def _seconds(duration: Optional[datetime.timedelta]) -> Optional[float]:
+    return None if duration is None else duration.total_seconds()
+
+
+def compute_stats(data: List[Tuple[datetime.datetime, float]], aggregated_data: List[Tuple[datetime.datetime, float, str]],
+                  interval_minutes: int, site_records: Iterable[SiteRecord] = ()) -> Dict[str, object]:
+    """Summarize rounds (from parse_log_files) and their intervals (from aggregate_by_interval) as a JSON-ready dict.
+
+    Durations are in seconds; availability is the share of observed time outside outages.
+    """
+    episodes, outage_stats = detect_outages(data)
+    measured = [rate for _, rate, status in aggregated_data if status == "measured"]
+    longest = max(episodes, key=lambda episode: episode.duration) if episodes else None
+
+    return {
+        'rounds': len(data),
+        'start': data[0][0].isoformat() if data else None,
+        'end': data[-1][0].isoformat() if data else None,
+        'mean_success_rate': sum(rate for _, rate in data) / len(data) if data else None,
+        'availability': outage_stats.availability,
+        'uptime': _seconds(outage_stats.uptime),
+        'downtime': _seconds(outage_stats.downtime),
+        'outages': outage_stats.episodes,
+        'longest_outage': None if longest is None else {
+            'start': longest.start.isoformat(),
+            'end': longest.end.isoformat(),
+            'duration': _seconds(longest.duration),
+            'ongoing': longest.ongoing
+        },
+        'mttr': _seconds(outage_stats.mttr),
+        'mtbf': _seconds(outage_stats.mtbf),
+        'interval_minutes': interval_minutes,
+        'intervals': len(aggregated_data),
+        'missing_intervals': len(aggregated_data) - len(measured),
+        'worst_interval_success_rate': min(measured) if measured else None,
+        'sites': site_failure_shares(site_records)
+    }
+
+
+def format_duration(seconds: Optional[float]) -> str:
+    """Format seconds like '2d 3h 15m' (or '45s' under a minute)."""
+    if seconds is None:
+        return 'n/a'
+    minutes = int(seconds // 60)
+    if minutes == 0:
+        return f"{int(seconds)}s"
+    days, minutes = divmod(minutes, 1440)
+    hours, minutes = divmod(minutes, 60)
+    parts = [f"{value}{unit}" for value, unit in ((days, 'd'), (hours, 'h'), (minutes, 'm')) if value]
+    return ' '.join(parts)
+
+
+def _percent(share: Optional[float]) -> str:
+    return 'n/a' if share is None else f"{share * 100:.2f}%"
+
+
+def format_stats(stats: Dict[str, object]) -> str:
+    """Format compute_stats output as a short human-readable report."""
+    lines = [
+        f"Rounds: {stats['rounds']} ({stats['start']} to {stats['end']})",
+        f"Availability: {_percent(stats['availability'])} "
+        f"({format_duration(stats['uptime'])} up, {format_duration(stats['downtime'])} down)",
+        f"Mean success rate: {_percent(stats['mean_success_rate'])}"
+    ]
+
+    longest = stats['longest_outage']
+    outages = f"Outages: {stats['outages']}"
+    if longest:
+        outages += (f", longest {format_duration(longest['duration'])} from {longest['start']}"
+                    f"{' (ongoing)' if longest['ongoing'] else ''}")
+        outages += f", MTTR {format_duration(stats['mttr'])}, MTBF {format_duration(stats['mtbf'])}"
+    lines.append(outages)
+
+    lines.append(f"Intervals: {stats['intervals']} {stats['interval_minutes']}-minute intervals, "
+                 f"{stats['missing_intervals']} without data, "
+                 f"worst {_percent(stats['worst_interval_success_rate'])} successful")
+
+    if stats['sites']:
+        lines.append("Failed checks per site:")
+        for url, site in stats['sites'].items():
+            lines.append(f"  {url}: {_percent(site['failure_share'])} of {site['checks']} checks")
+    return '\n'.join(lines)
@@ -0,0 +1,181 @@
+"""
+Matplotlib-free chart output.
+
+Draws the same success/failure bar chart as chart_generator.plot_success_rates
+(colors, stacking, missing-interval outlines and legend) as a self-contained
+SVG file, or an HTML page embedding it, using only the standard library. Each
+series is a single <path>, so files stay small and rendering is near-instant.
+"""
+
+import datetime
+import html
+import math
+from typing import List, Tuple
+from .path_utils import get_output_format
+
+
+SVG_FORMATS = ('svg', 'html')
+
+# Same colors as plot_success_rates
+FAILURE_COLOR = '#FF6B35'
+SUCCESS_COLOR = '#66D9A6'
+BAR_OPACITY = 0.8
+
+WIDTH = 1200
+HEIGHT = 600
+MARGIN_LEFT = 70
+MARGIN_RIGHT = 30
+MARGIN_TOP = 60
+MARGIN_BOTTOM = 150
+Y_MAX = 105
+
+# Most x-axis ticks before switching to a coarser tick spacing (as in chart_generator)
+MAX_TIME_TICKS = 32
+
+
+def get_time_ticks(start: datetime.datetime, end: datetime.datetime) -> List[datetime.datetime]:
+    """Get x-axis tick times: every 3 hours, or coarser when that would exceed MAX_TIME_TICKS ticks."""
+    span_hours = (end - start) / datetime.timedelta(hours=1)
+    for hours in (3, 6, 12):
+        if span_hours / hours <= MAX_TIME_TICKS:
+            step = datetime.timedelta(hours=hours)
+            tick = start.replace(hour=start.hour - start.hour % hours, minute=0, second=0, microsecond=0)
+            break
+    else:
+        step = datetime.timedelta(days=math.ceil(span_hours / 24 / MAX_TIME_TICKS))
+        tick = start.replace(hour=0, minute=0, second=0, microsecond=0)
+
+    ticks = []
+    while tick <= end:
+        if tick >= start:
+            ticks.append(tick)
+        tick += step
+    return ticks
+
+
+def format_tick_labels(ticks: List[datetime.datetime]) -> List[str]:
+    """Show the date for 00:00, leftmost and rightmost tick labels; only the time for others."""
+    labels = []
+    for pos, tick in enumerate(ticks):
+        if pos == 0 or pos == len(ticks) - 1 or (tick.hour == 0 and tick.minute == 0):
+            labels.append(tick.strftime('%m/%d %H:%M'))
+        else:
+            labels.append(tick.strftime('%H:%M'))
+    return labels
+
+
+def bar_path(bars: List[Tuple[float, float, float]], width: float) -> str:
+    """Get SVG path data for bars given as (left x, bottom y, top y) in pixels."""
+    return ''.join(f"M{left:.2f} {bottom:.2f}V{top:.2f}h{width:.2f}V{bottom:.2f}Z" for left, bottom, top in bars)
+
+
+def render_svg(data: List[Tuple[datetime.datetime, float, str]], hostname: str, wifi_network: str,
+               interval_minutes: int = 15) -> str:
+    """Render the output of aggregate_by_interval as an SVG document."""
+    plot_width = WIDTH - MARGIN_LEFT - MARGIN_RIGHT
+    plot_height = HEIGHT - MARGIN_TOP - MARGIN_BOTTOM
+    bottom = MARGIN_TOP + plot_height
+
+    # Bars are 80% of the interval, centered on the interval timestamps, with a margin on both sides
+    bar_width = datetime.timedelta(minutes=interval_minutes * 0.8)
+    padding = bar_width / 2 + (data[-1][0] - data[0][0] + bar_width) * 0.05
+    start = data[0][0] - padding
+    end = data[-1][0] + padding
+    seconds_per_pixel = (end - start).total_seconds() / plot_width
+
+    def x(timestamp):
+        return MARGIN_LEFT + (timestamp - start).total_seconds() / seconds_per_pixel
+
+    def y(rate):
+        return bottom - rate / Y_MAX * plot_height
+
+    width = bar_width.total_seconds() / seconds_per_pixel
+    failure_bars = []
+    success_bars = []
+    missing_bars = []
+    for timestamp, rate, status in data:
+        left = x(timestamp) - width / 2
+        if status == "measured":
+            failure = 100 - rate * 100
+            failure_bars.append((left, y(0), y(failure)))
+            success_bars.append((left, y(failure), y(100)))
+        elif status == "missing":
+            missing_bars.append((left, y(0), y(100)))
+
+    title = html.escape(f"Internet Connectivity Success/Failure Rate - {hostname} ({wifi_network})")
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{WIDTH}" height="{HEIGHT}" '
+        f'viewBox="0 0 {WIDTH} {HEIGHT}" font-family="sans-serif" font-size="12">',
+        f'<rect width="{WIDTH}" height="{HEIGHT}" fill="white"/>',
+        f'<text x="{WIDTH / 2}" y="22" text-anchor="middle" font-size="14">{title}</text>',
+        f'<text x="{WIDTH / 2}" y="40" text-anchor="middle" font-size="14">{interval_minutes}-minute intervals</text>'
+    ]
+
+    # Grid and y-axis ticks
+    parts.append('<g stroke="#b0b0b0" stroke-opacity="0.3">')
+    ticks = get_time_ticks(start, end)
+    for tick in ticks:
+        parts.append(f'<line x1="{x(tick):.2f}" y1="{MARGIN_TOP}" x2="{x(tick):.2f}" y2="{bottom}"/>')
+    for rate in range(0, 101, 20):
+        parts.append(f'<line x1="{MARGIN_LEFT}" y1="{y(rate):.2f}" x2="{MARGIN_LEFT + plot_width}" y2="{y(rate):.2f}"/>')
+    parts.append('</g>')
+    for rate in range(0, 101, 20):
+        parts.append(f'<text x="{MARGIN_LEFT - 6}" y="{y(rate) + 4:.2f}" text-anchor="end">{rate}</text>')
+
+    # Bars: one path per series
+    if failure_bars:
+        parts.append(f'<path d="{bar_path(failure_bars, width)}" fill="{FAILURE_COLOR}" fill-opacity="{BAR_OPACITY}" '
+                     f'stroke="black" stroke-width="0.5"/>')
+        parts.append(f'<path d="{bar_path(success_bars, width)}" fill="{SUCCESS_COLOR}" fill-opacity="{BAR_OPACITY}" '
+                     f'stroke="black" stroke-width="0.5"/>')
+    if missing_bars:
+        parts.append(f'<path d="{bar_path(missing_bars, width)}" fill="none" stroke="black" stroke-width="0.5" '
+                     f'stroke-dasharray="1.5 1.5"/>')
+
+    # Axes, x-axis tick labels and axis labels
+    parts.append(f'<rect x="{MARGIN_LEFT}" y="{MARGIN_TOP}" width="{plot_width}" height="{plot_height}" '
+                 f'fill="none" stroke="black"/>')
+    for tick, label in zip(ticks, format_tick_labels(ticks)):
+        parts.append(f'<text transform="translate({x(tick):.2f} {bottom + 12}) rotate(-45)" '
+                     f'text-anchor="end">{label}</text>')
+    parts.append(f'<text x="{MARGIN_LEFT + plot_width / 2}" y="{bottom + 90}" text-anchor="middle">Time</text>')
+    parts.append(f'<text transform="translate(20 {MARGIN_TOP + plot_height / 2}) rotate(-90)" '
+                 f'text-anchor="middle">Rate (%)</text>')
+
+    # Legend at the bottom, in one row
+    legend = [
+        (f'fill="{FAILURE_COLOR}" fill-opacity="{BAR_OPACITY}" stroke="black" stroke-width="0.5"', 'Connection Failed'),
+        (f'fill="{SUCCESS_COLOR}" fill-opacity="{BAR_OPACITY}" stroke="black" stroke-width="0.5"', 'Connection Success'),
+        ('fill="none" stroke="black" stroke-width="0.5" stroke-dasharray="1.5 1.5"', 'No Data Recorded')
+    ]
+    legend_x = WIDTH / 2 - 255
+    legend_y = HEIGHT - 30
+    for number, (style, label) in enumerate(legend):
+        item_x = legend_x + number * 170
+        parts.append(f'<rect x="{item_x}" y="{legend_y - 10}" width="20" height="10" {style}/>')
+        parts.append(f'<text x="{item_x + 26}" y="{legend_y}">{label}</text>')
+
+    parts.append('</svg>')
+    return '\n'.join(parts) + '\n'
+
+
+def plot_success_rates_svg(data: List[Tuple[datetime.datetime, float, str]], hostname: str, wifi_network: str,
+                           interval_minutes: int, output_file: str, output_format: str = None):
+    """Plot success rates like plot_success_rates, as SVG or an HTML page.
+
+    output_format is 'svg' or 'html'; by default it follows output_file's extension.
+    """
+    if not data:
+        print("No data to plot")
+        return None
+
+    svg = render_svg(data, hostname, wifi_network, interval_minutes)
+    if get_output_format(output_format, output_file) == 'html':
+        title = html.escape(f"Connectivity - {hostname} ({wifi_network})")
+        svg = (f'<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8">\n<title>{title}</title>\n</head>\n'
+               f'<body>\n{svg}</body>\n</html>\n')
+
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write(svg)
+    print(f"Plot saved to: {output_file}")
+    return output_file
@@ -6,17 +6,78 @@ This script generates a dot line graph showing success rates over time
 for connectivity logs from the current machine's hostname.
 """
 
+import contextlib
+import json
 import os
 import sys
 from libs.plotter.arg_parser import create_plot_argument_parser, print_configuration
-from libs.plotter.dependencies import exit_if_dependencies_missing
-from libs.plotter.path_utils import setup_logs_directory, resolve_output_path
-from libs.plotter.log_parser import parse_log_files
+from libs.plotter.dependencies import check_required_dependencies, exit_if_dependencies_missing, use_headless_backend
+from libs.plotter.path_utils import check_output_format, get_output_format, setup_logs_directory, resolve_output_format, resolve_output_path
+from libs.plotter.log_parser import get_window_start, parse_log_entries, parse_log_files, stream_log_files
+from libs.plotter.parse_cache import LogParseCache, get_parse_cache_path
+from libs.plotter.rollups import open_rollups
+from libs.plotter.sqlite_loader import load_success_rates, DB_FILE_NAME
 from libs.plotter.data_aggregator import aggregate_by_interval
-from libs.plotter.chart_generator import plot_success_rates
+from libs.plotter.render_cache import RenderCache, copy_cached_render, get_render_cache_dir, render_cache_key
+from libs.plotter.stats import compute_stats, format_stats
+from libs.plotter.svg_chart import SVG_FORMATS, plot_success_rates_svg
 from libs.plotter.file_utils import open_file_non_blocking
 
 
+def run_batch_mode(args, logs_dir):
+    """Render every chart from --batch and --chart, with the other options as defaults."""
+    # Batches aggregate from NumPy columns, whatever the chart formats
+    if not check_required_dependencies(('numpy',)):
+        sys.exit(1)
+    from libs.plotter.batch import expand_chart_specs, load_batch_spec, run_batch
+    defaults = {
+        'hostname': args.hostname,
+        'wifi_network': args.wifi_network,
+        'time_range': args.time_range,
+        'interval': args.interval,
+        'since': args.since,
+        'until': args.until,
+        'format': args.format
+    }
+    try:
+        specs = load_batch_spec(args.batch, defaults) if args.batch else []
+        for entry in args.chart or []:
+            specs.extend(expand_chart_specs(entry, defaults))
+    except (OSError, ValueError) as e:
+        print(f"Error: invalid batch spec: {e}")
+        sys.exit(1)
+    
+    if not specs:
+        print("No charts to render")
+        sys.exit(1)
+    
+    # Each chart picks its own format; only PNG charts need matplotlib
+    if any(get_output_format(spec.format, spec.output) not in SVG_FORMATS for spec in specs):
+        exit_if_dependencies_missing()
+    
+    print(f"Rendering {len(specs)} charts")
+    saved_files = run_batch(specs, logs_dir, args.output_dir, args.jobs)
+    if not saved_files:
+        sys.exit(1)
+
+
+def run_stats_mode(args, logs_dir):
+    """Print uptime and outage numbers for the window instead of plotting it."""
+    # With --json, stdout carries only the JSON document
+    with contextlib.redirect_stdout(sys.stderr if args.json else sys.stdout):
+        # Rounds and per-site results in one pass over the log files overlapping the window
+        data, site_records = parse_log_entries(logs_dir, args.hostname, args.wifi_network, args.time_range,
+                                               since=args.since, until=args.until)
+        if not data:
+            print("No data found")
+            sys.exit(1)
+        aggregated_data = aggregate_by_interval(data, args.interval)
+        stats = compute_stats(data, aggregated_data, args.interval, site_records)
+    
+    if args.json:
+        print(json.dumps({'hostname': args.hostname, 'wifi_network': args.wifi_network, **stats}, indent=2))
+    else:
+        print(format_stats(stats))
 
 
 def main():
@@ -25,30 +86,89 @@ def main():
     parser = create_plot_argument_parser()
     args = parser.parse_args()
     
-    # Check for required dependencies
-    exit_if_dependencies_missing()
+    # SVG and HTML charts are drawn without matplotlib
+    output_format = resolve_output_format(args)
+    try:
+        check_output_format(args.format, args.output)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    
+    # Check for required dependencies (batch mode checks them per chart format)
+    if output_format not in SVG_FORMATS and not (args.stats or args.json or args.batch or args.chart):
+        exit_if_dependencies_missing()
     
     # Print configuration
-    print_configuration(args)
+    with contextlib.redirect_stdout(sys.stderr if args.json else sys.stdout):
+        print_configuration(args)
     
     # Set up paths
     logs_dir = setup_logs_directory(__file__)
     
-    # Parse log files
-    data = parse_log_files(logs_dir, args.hostname, args.wifi_network, args.time_range)
+    if args.stats or args.json:
+        run_stats_mode(args, logs_dir)
+        return
     
-    if not data:
-        print("No data found to plot")
-        sys.exit(1)
+    if args.batch or args.chart:
+        run_batch_mode(args, logs_dir)
+        return
+    
+    if args.sqlite is not None:
+        # Range query against the checker's SQLite database
+        db_path = args.sqlite or os.path.join(logs_dir, DB_FILE_NAME)
+        data = load_success_rates(db_path, args.hostname, args.wifi_network, args.time_range,
+                                  since=args.since, until=args.until)
+    elif args.rollups:
+        # Fold newly logged rounds into the materialized rollups and read the window from them
+        data = open_rollups(logs_dir, args.hostname).window(args.wifi_network, args.time_range, args.since, args.until)
+    elif args.columnar:
+        # Compact NumPy columns for every network, narrowed to the plotted network and window;
+        # like parse_log_files, only the log files that may overlap the window are read
+        from libs.plotter.columnar import ConnectivityColumns, parse_log_columns
+        since = get_window_start(logs_dir, args.hostname, args.wifi_network, args.time_range, args.since, args.until)
+        if since is None:
+            data = ConnectivityColumns.empty()
+        else:
+            data = parse_log_columns(logs_dir, args.hostname, since, args.until)
+            data = data.select_network(args.wifi_network).select_window(args.time_range, args.since, args.until)
+    elif args.jobs > 1:
+        # Parse log files on a process pool, reusing records parsed by earlier runs
+        cache = LogParseCache(get_parse_cache_path(logs_dir, args.hostname))
+        data = parse_log_files(logs_dir, args.hostname, args.wifi_network, args.time_range, cache=cache,
+                               since=args.since, until=args.until, jobs=args.jobs)
+    else:
+        # Stream records straight into the aggregation, one file at a time; the parse cache
+        # would hold every file's records, so only the files overlapping the window are scanned
+        data = stream_log_files(logs_dir, args.hostname, args.wifi_network, args.time_range,
+                                since=args.since, until=args.until)
     
     # Aggregate data by specified intervals
     aggregated_data = aggregate_by_interval(data, args.interval)
     
+    if not aggregated_data:
+        print("No data found to plot")
+        sys.exit(1)
+    
     # Resolve output file path
     output_file = resolve_output_path(args)
     
-    # Plot the data
-    saved_file = plot_success_rates(aggregated_data, args.hostname, args.wifi_network, args.interval, output_file)
+    if output_format in SVG_FORMATS:
+        saved_file = plot_success_rates_svg(aggregated_data, args.hostname, args.wifi_network, args.interval, output_file,
+                                            output_format)
+    else:
+        # Reuse an earlier render of the same chart, or plot the data and keep the render
+        render_cache = RenderCache(get_render_cache_dir(logs_dir))
+        cache_key = render_cache_key(aggregated_data, args.hostname, args.wifi_network, args.interval)
+        cached_file = render_cache.get(cache_key)
+        if cached_file:
+            saved_file = copy_cached_render(cached_file, output_file)
+        else:
+            # matplotlib is only imported when a PNG is actually rendered
+            use_headless_backend()
+            from libs.plotter.chart_generator import plot_success_rates
+            saved_file = plot_success_rates(aggregated_data, args.hostname, args.wifi_network, args.interval, output_file)
+            if saved_file:
+                render_cache.put(cache_key, saved_file)
     
     # Open the file in a non-blocking way
     if saved_file and os.path.exists(saved_file):
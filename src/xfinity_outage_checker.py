@@ -1,18 +1,35 @@
 #!/usr/bin/env python3
 import os
+from libs.checker.arg_parser import create_checker_argument_parser
 from libs.checker.site_checker import check_connectivity
 from libs.checker.logging import log_to_file, print_summary
-from libs.checker.git import push_logs_to_git
+from libs.checker.sqlite_sink import log_to_sqlite
+from libs.checker.git_sync import run_git_sync, spawn_git_sync_worker
+from libs.checker.daemon import run_daemon
+from libs.checker.wifi import WifiNetworkCache
+from libs.checker.state import get_state_path
 
 
 if __name__ == "__main__":
-    results = check_connectivity()
-    log_to_file(results)
-    print_summary(results)
-    
-    # Push log changes to remote repository
-    # Note: We use local log files (logs/{hostname}) instead of remote log services
-    # since we can't emit logs externally when network connectivity fails.
-    # The push_logs_to_git() function has internal logic to avoid excessive commits.
-    push_logs_to_git()
+    args = create_checker_argument_parser().parse_args()
     
+    if args.git_sync_worker:
+        # Detached worker: lock file, backoff and minimum push interval are handled by run_git_sync()
+        run_git_sync()
+    elif args.daemon:
+        # One long-lived process: probes on its own schedule, git work on a slower cadence
+        run_daemon(args.interval, args.git_interval, engine=args.engine, sqlite_path=args.sqlite)
+    else:
+        # Reuse the last WiFi lookup across runs unless the interface state changed
+        wifi_cache = WifiNetworkCache(state_file=get_state_path('wifi_network.json'))
+        results = check_connectivity(engine=args.engine, wifi_provider=wifi_cache.get)
+        log_to_file(results)
+        if args.sqlite:
+            log_to_sqlite(results, args.sqlite)
+        print_summary(results)
+        
+        # Push log changes to remote repository
+        # Note: We use local log files (logs/{hostname}) instead of remote log services
+        # since we can't emit logs externally when network connectivity fails.
+        # The push runs in a detached worker so a hanging git pull/push never delays the next round.
+        spawn_git_sync_worker(os.path.abspath(__file__))
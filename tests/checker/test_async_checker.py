@@ -0,0 +1,122 @@
+import pytest
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from src.libs.checker.async_checker import check_sites_async, status_from_code
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Serve a few canned responses for the async engine tests."""
+    
+    def do_GET(self):
+        path = self.path.split('?')[0]
+        if path == '/redirect':
+            self.send_response(301)
+            self.send_header('Location', '/ok')
+            self.end_headers()
+        elif path == '/ok':
+            self.send_response(200)
+            self.end_headers()
+            self.wfile.write(b'ok')
+        else:
+            self.send_response(404, 'Not Found')
+            self.end_headers()
+    
+    def log_message(self, format, *args):
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+
+@pytest.fixture
+def http_server():
+    server = _Server(('127.0.0.1', 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_address[1]}'
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def silent_server():
+    # Accepts TCP connections (via the listen backlog) but never answers
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.bind(('127.0.0.1', 0))
+    sock.listen(16)
+    yield f'http://127.0.0.1:{sock.getsockname()[1]}'
+    sock.close()
+
+
+class TestStatusFromCode:
+    """Test cases for status_from_code function."""
+    
+    def test_status_from_code_success(self):
+        assert status_from_code(200, 'OK') == 'SUCCESS'
+    
+    def test_status_from_code_non_200(self):
+        assert status_from_code(204, 'No Content') == 'HTTP_204'
+    
+    def test_status_from_code_http_error_matches_urllib(self):
+        assert status_from_code(404, 'Not Found') == 'FAILED: HTTP Error 404: Not Found'
+
+
+class TestCheckSitesAsync:
+    """Test cases for check_sites_async function."""
+    
+    def test_check_sites_async_success_and_errors(self, http_server):
+        urls = [f'{http_server}/ok', f'{http_server}/missing']
+        
+        result = check_sites_async(urls)
+        
+        assert [check['url'] for check in result] == urls
+        assert result[0]['status'] == 'SUCCESS'
+        assert result[1]['status'] == 'FAILED: HTTP Error 404: Not Found'
+        assert all(check['duration'] >= 0 for check in result)
+    
+    def test_check_sites_async_follows_redirects(self, http_server):
+        result = check_sites_async([f'{http_server}/redirect'])
+        
+        assert result[0]['status'] == 'SUCCESS'
+    
+    def test_check_sites_async_connection_refused(self):
+        # Grab a free port and close it so nothing is listening
+        sock = socket.socket()
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+        sock.close()
+        
+        result = check_sites_async([f'http://127.0.0.1:{port}/'])
+        
+        assert result[0]['status'].startswith('FAILED: <urlopen error ')
+    
+    def test_check_sites_async_shared_deadline(self, http_server, silent_server):
+        urls = [f'{silent_server}/a', f'{http_server}/ok', f'{silent_server}/b']
+        
+        result = check_sites_async(urls, timeout=0.5)
+        
+        assert [check['url'] for check in result] == urls
+        assert result[0]['status'] == 'FAILED: timed out'
+        assert result[1]['status'] == 'SUCCESS'
+        assert result[2]['status'] == 'FAILED: timed out'
+        assert 0.4 < result[0]['duration'] < 2.0
+    
+    def test_check_sites_async_many_targets(self, http_server):
+        urls = [f'{http_server}/ok?n={i}' for i in range(200)]
+        
+        result = check_sites_async(urls)
+        
+        assert len(result) == 200
+        assert all(check['status'] == 'SUCCESS' for check in result)
+    
+    def test_check_sites_async_records_phases(self, http_server):
+        result = check_sites_async([f'{http_server}/ok'])
+        
+        phases = result[0]['phases']
+        assert phases['dns'] >= 0
+        assert phases['connect'] >= 0
+        assert phases['tls'] is None  # plain http
+        assert phases['ttfb'] >= 0
@@ -0,0 +1,47 @@
+import pytest
+import argparse
+from src.libs.checker.arg_parser import create_checker_argument_parser
+from src.libs.checker.daemon import DEFAULT_PROBE_INTERVAL, DEFAULT_GIT_INTERVAL
+from src.libs.checker.sqlite_sink import DEFAULT_DB_PATH
+
+
+class TestCreateCheckerArgumentParser:
+    """Test cases for create_checker_argument_parser function."""
+    
+    def test_create_parser_returns_argument_parser(self):
+        parser = create_checker_argument_parser()
+        
+        assert isinstance(parser, argparse.ArgumentParser)
+    
+    def test_parser_default_values(self):
+        args = create_checker_argument_parser().parse_args([])
+        
+        assert args.daemon is False
+        assert args.interval == DEFAULT_PROBE_INTERVAL
+        assert args.git_interval == DEFAULT_GIT_INTERVAL
+    
+    def test_parser_daemon_mode(self):
+        args = create_checker_argument_parser().parse_args(['--daemon', '--interval', '30', '--git-interval', '600'])
+        
+        assert args.daemon is True
+        assert args.interval == 30
+        assert args.git_interval == 600
+    
+    def test_parser_invalid_interval(self):
+        with pytest.raises(SystemExit):
+            create_checker_argument_parser().parse_args(['--interval', 'soon'])
+    
+    def test_parser_engine_choice(self):
+        assert create_checker_argument_parser().parse_args([]).engine == 'threads'
+        assert create_checker_argument_parser().parse_args(['--engine', 'async']).engine == 'async'
+        with pytest.raises(SystemExit):
+            create_checker_argument_parser().parse_args(['--engine', 'processes'])
+    
+    def test_parser_git_sync_worker_flag(self):
+        assert create_checker_argument_parser().parse_args([]).git_sync_worker is False
+        assert create_checker_argument_parser().parse_args(['--git-sync-worker']).git_sync_worker is True
+    
+    def test_parser_sqlite_option(self):
+        assert create_checker_argument_parser().parse_args([]).sqlite is None
+        assert create_checker_argument_parser().parse_args(['--sqlite']).sqlite == DEFAULT_DB_PATH
+        assert create_checker_argument_parser().parse_args(['--sqlite', '/tmp/results.db']).sqlite == '/tmp/results.db'
@@ -0,0 +1,164 @@
+import pytest
+from unittest.mock import MagicMock
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from src.libs.checker.connection_pool import ProbeConnectionPool
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    """HTTP/1.1 handler that keeps connections open unless asked to close."""
+    
+    protocol_version = 'HTTP/1.1'
+    connections_seen = set()
+    methods_seen = []
+    
+    def do_GET(self):
+        type(self).connections_seen.add(self.client_address)
+        type(self).methods_seen.append(self.command)
+        path = self.path.split('?')[0]
+        body = b''
+        if path == '/redirect':
+            self.send_response(302)
+            self.send_header('Location', '/ok')
+        elif path == '/ok':
+            self.send_response(200)
+            body = b'<html>ok</html>'
+        elif path == '/close':
+            self.send_response(200)
+            self.send_header('Connection', 'close')
+        else:
+            self.send_response(404, 'Not Found')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def keep_alive_server():
+    _KeepAliveHandler.connections_seen = set()
+    _KeepAliveHandler.methods_seen = []
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _KeepAliveHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_address[1]}'
+    server.shutdown()
+    server.server_close()
+
+
+class TestProbeConnectionPool:
+    """Test cases for ProbeConnectionPool class."""
+    
+    def test_check_reuses_connection(self, keep_alive_server):
+        with ProbeConnectionPool() as pool:
+            first = pool.check(f'{keep_alive_server}/ok')
+            second = pool.check(f'{keep_alive_server}/ok')
+        
+        assert first['status'] == 'SUCCESS'
+        assert first['reused'] is False
+        assert first['phases']['connect'] is not None
+        assert second['status'] == 'SUCCESS'
+        assert second['reused'] is True
+        # No new connection, so only the request round-trip was measured
+        assert second['phases']['connect'] is None
+        assert second['phases']['ttfb'] is not None
+        assert len(_KeepAliveHandler.connections_seen) == 1
+        # Same request method as the serial and asyncio engines
+        assert _KeepAliveHandler.methods_seen == ['GET', 'GET']
+    
+    def test_check_follows_redirects(self, keep_alive_server):
+        with ProbeConnectionPool() as pool:
+            result = pool.check(f'{keep_alive_server}/redirect')
+        
+        assert result['status'] == 'SUCCESS'
+        assert len(_KeepAliveHandler.connections_seen) == 1
+    
+    def test_check_http_error_matches_urllib(self, keep_alive_server):
+        with ProbeConnectionPool() as pool:
+            result = pool.check(f'{keep_alive_server}/missing')
+        
+        assert result['status'] == 'FAILED: HTTP Error 404: Not Found'
+    
+    def test_check_reconnects_after_server_close(self, keep_alive_server):
+        with ProbeConnectionPool() as pool:
+            first = pool.check(f'{keep_alive_server}/close')
+            second = pool.check(f'{keep_alive_server}/ok')
+        
+        assert first['status'] == 'SUCCESS'
+        assert second['status'] == 'SUCCESS'
+        assert second['reused'] is False
+        assert len(_KeepAliveHandler.connections_seen) == 2
+    
+    def test_check_connection_refused(self):
+        import socket
+        sock = socket.socket()
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+        sock.close()
+        
+        with ProbeConnectionPool(timeout=1) as pool:
+            result = pool.check(f'http://127.0.0.1:{port}/')
+        
+        assert result['status'].startswith('FAILED: <urlopen error ')
+        assert pool._connections == {}
+    
+    def test_discard_keeps_tls_session_for_resumption(self):
+        pool = ProbeConnectionPool()
+        conn = MagicMock()
+        conn.sock = None
+        conn.tls_session = 'session-ticket'
+        key = ('https', 'example.com', 443)
+        pool._connections[key] = conn
+        
+        pool._discard(key)
+        
+        conn.close.assert_called_once()
+        assert pool._tls_sessions[key] == 'session-ticket'
+        new_conn = pool._get_connection(key, MagicMock())
+        assert new_conn.tls_session == 'session-ticket'
+    
+    def test_discard_reads_session_from_socket(self):
+        pool = ProbeConnectionPool()
+        conn = MagicMock()
+        conn.tls_session = 'handshake-session'
+        conn.sock.session = 'session-with-ticket'
+        key = ('https', 'example.com', 443)
+        pool._connections[key] = conn
+        
+        pool._discard(key)
+        
+        assert pool._tls_sessions[key] == 'session-with-ticket'
+    
+    def test_session_after_response_is_resumed(self):
+        pool = ProbeConnectionPool()
+        key = ('https', 'example.com', 443)
+        conn = MagicMock()
+        conn.tls_session = 'handshake-session'
+        conn.getresponse.return_value = MagicMock(status=200, reason='OK', will_close=False)
+        
+        def receive_ticket(*args, **kwargs):
+            # TLS 1.3: the ticket arrives with the first response, after the handshake
+            conn.sock.session = 'session-with-ticket'
+        conn.request.side_effect = receive_ticket
+        pool._connections[key] = conn
+        
+        pool._request('https://example.com/', MagicMock())
+        pool._connections.pop(key)
+        new_conn = pool._get_connection(key, MagicMock())
+        
+        assert pool._tls_sessions[key] == 'session-with-ticket'
+        assert new_conn.tls_session == 'session-with-ticket'
+    
+    def test_close_closes_all_connections(self):
+        pool = ProbeConnectionPool()
+        conns = [MagicMock(tls_session=None), MagicMock(tls_session=None)]
+        pool._connections = {('http', 'a', 80): conns[0], ('http', 'b', 80): conns[1]}
+        
+        pool.close()
+        
+        assert pool._connections == {}
+        for conn in conns:
+            conn.close.assert_called_once()
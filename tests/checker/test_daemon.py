@@ -0,0 +1,224 @@
+import pytest
+import sqlite3
+from unittest.mock import patch, MagicMock, call
+from src.libs.checker.daemon import DailyLogWriter, CheckerDaemon, next_deadline
+
+
+@pytest.fixture
+def sample_results():
+    return {
+        'timestamp': '2025-07-09 10:30:45',
+        'timestamp_utc': '2025-07-09 14:30:45',
+        'timezone_local': 'America/New_York',
+        'wifi_network': 'TestNetwork',
+        'checks': [
+            {'url': 'https://google.com', 'status': 'SUCCESS', 'duration': 0.25}
+        ]
+    }
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+    
+    def __init__(self, start=1000.0):
+        self.now = start
+    
+    def __call__(self):
+        return self.now
+
+
+class TestNextDeadline:
+    """Test cases for next_deadline function."""
+    
+    def test_next_deadline_on_schedule(self):
+        assert next_deadline(100.0, 60, 110.0) == 160.0
+    
+    def test_next_deadline_skips_missed_rounds(self):
+        # Slept through several rounds: realign to the next future slot
+        assert next_deadline(100.0, 60, 345.0) == 400.0
+    
+    def test_next_deadline_exact_boundary(self):
+        assert next_deadline(100.0, 60, 160.0) == 220.0
+
+
+class TestDailyLogWriter:
+    """Test cases for DailyLogWriter class."""
+    
+    @patch('src.libs.checker.daemon.write_log_entry')
+    @patch('src.libs.checker.daemon.get_log_file_path')
+    @patch('builtins.open')
+    def test_write_keeps_file_open_between_rounds(self, mock_open, mock_path, mock_write, sample_results):
+        mock_path.return_value = 'logs/host/connectivity_log_20250709.txt'
+        
+        writer = DailyLogWriter()
+        writer.write(sample_results)
+        writer.write(sample_results)
+        
+        mock_open.assert_called_once_with('logs/host/connectivity_log_20250709.txt', 'a')
+        assert mock_write.call_count == 2
+        assert mock_open.return_value.flush.call_count == 2
+    
+    @patch('src.libs.checker.daemon.write_log_entry')
+    @patch('src.libs.checker.daemon.get_log_file_path')
+    @patch('builtins.open')
+    def test_write_reopens_on_date_change(self, mock_open, mock_path, mock_write, sample_results):
+        first_file = MagicMock()
+        second_file = MagicMock()
+        mock_open.side_effect = [first_file, second_file]
+        mock_path.side_effect = ['logs/host/connectivity_log_20250709.txt',
+                                 'logs/host/connectivity_log_20250710.txt']
+        
+        writer = DailyLogWriter()
+        writer.write(sample_results)
+        writer.write(sample_results)
+        
+        assert mock_open.call_args_list == [
+            call('logs/host/connectivity_log_20250709.txt', 'a'),
+            call('logs/host/connectivity_log_20250710.txt', 'a')
+        ]
+        first_file.close.assert_called_once()
+        second_file.close.assert_not_called()
+    
+    def test_close_without_open_file(self):
+        writer = DailyLogWriter()
+        
+        # Should not raise
+        writer.close()
+
+
+class TestCheckerDaemon:
+    """Test cases for CheckerDaemon class."""
+    
+    @patch('src.libs.checker.daemon.print_summary')
+    @patch('src.libs.checker.daemon.check_connectivity')
+    def test_run_round_keeps_state_in_memory(self, mock_check, mock_summary, sample_results):
+        mock_check.return_value = sample_results
+        daemon = CheckerDaemon(websites=['https://google.com'])
+        daemon.log_writer = MagicMock()
+        
+        result = daemon.run_round()
+        
+        assert result == sample_results
+        assert daemon.last_results == sample_results
+        assert daemon.rounds == 1
+        mock_check.assert_called_once_with(['https://google.com'], engine='threads', pool=None,
+                                           wifi_provider=daemon.wifi_cache.get)
+        daemon.log_writer.write.assert_called_once_with(sample_results)
+        mock_summary.assert_called_once_with(sample_results)
+    
+    @patch('src.libs.checker.daemon.start_git_sync_thread')
+    @patch('src.libs.checker.daemon.print_summary')
+    @patch('src.libs.checker.daemon.check_connectivity')
+    def test_run_probes_on_schedule_and_git_on_slower_cadence(self, mock_check, mock_summary, mock_push, sample_results):
+        mock_check.return_value = sample_results
+        clock = FakeClock()
+        daemon = CheckerDaemon(probe_interval=60, git_interval=150, clock=clock)
+        daemon.log_writer = MagicMock()
+        
+        def fake_wait(timeout):
+            clock.now += timeout
+            return False
+        daemon._stop_event.wait = fake_wait
+        
+        daemon.run(max_rounds=4)
+        
+        # Rounds at t=0, 60, 120, 180; git sync once at t=150
+        assert mock_check.call_count == 4
+        mock_push.assert_called_once()
+        daemon.log_writer.close.assert_called_once()
+    
+    @patch('src.libs.checker.daemon.start_git_sync_thread')
+    @patch('src.libs.checker.daemon.print_summary')
+    @patch('src.libs.checker.daemon.check_connectivity')
+    def test_stop_ends_run_loop(self, mock_check, mock_summary, mock_push, sample_results):
+        mock_check.return_value = sample_results
+        daemon = CheckerDaemon(probe_interval=60, git_interval=3600, clock=FakeClock())
+        daemon.log_writer = MagicMock()
+        mock_check.side_effect = lambda websites, **kwargs: (daemon.stop(), sample_results)[1]
+        
+        daemon.run()
+        
+        assert daemon.rounds == 1
+        mock_push.assert_not_called()
+        daemon.log_writer.close.assert_called_once()
+    
+    @patch('src.libs.checker.daemon.start_git_sync_thread')
+    @patch('src.libs.checker.daemon.print_summary')
+    @patch('src.libs.checker.daemon.check_connectivity')
+    def test_pooled_engine_keeps_pool_between_rounds(self, mock_check, mock_summary, mock_push, sample_results):
+        mock_check.return_value = sample_results
+        clock = FakeClock()
+        daemon = CheckerDaemon(probe_interval=60, engine='pooled', clock=clock)
+        daemon.log_writer = MagicMock()
+        daemon.connection_pool = MagicMock()
+        
+        def fake_wait(timeout):
+            clock.now += timeout
+            return False
+        daemon._stop_event.wait = fake_wait
+        
+        daemon.run(max_rounds=2)
+        
+        for c in mock_check.call_args_list:
+            assert c.kwargs['pool'] is daemon.connection_pool
+        daemon.connection_pool.close.assert_called_once()
+    
+    @patch('builtins.print')
+    @patch('src.libs.checker.daemon.start_git_sync_thread')
+    def test_sync_git_skips_while_previous_sync_running(self, mock_start, mock_print):
+        daemon = CheckerDaemon()
+        mock_start.return_value.is_alive.return_value = True
+        
+        daemon.sync_git()
+        daemon.sync_git()
+        
+        mock_start.assert_called_once()
+        mock_print.assert_called_once_with("DEBUG: Previous git sync still running - skipping")
+    
+    @patch('src.libs.checker.daemon.print_summary')
+    @patch('src.libs.checker.daemon.check_connectivity')
+    def test_run_round_writes_sqlite_when_enabled(self, mock_check, mock_summary, sample_results, tmp_path):
+        mock_check.return_value = sample_results
+        daemon = CheckerDaemon(sqlite_path=str(tmp_path / 'connectivity.db'))
+        daemon.log_writer = MagicMock()
+        daemon.results_db = MagicMock()
+        
+        daemon.run_round()
+        
+        daemon.results_db.write.assert_called_once_with(sample_results)
+    
+    @patch('builtins.print')
+    @patch('src.libs.checker.daemon.print_summary')
+    @patch('src.libs.checker.daemon.check_connectivity')
+    def test_run_round_survives_sqlite_errors(self, mock_check, mock_summary, mock_print, sample_results):
+        mock_check.return_value = sample_results
+        daemon = CheckerDaemon(sqlite_path='/nonexistent/connectivity.db')
+        daemon.log_writer = MagicMock()
+        daemon.results_db.write = MagicMock(side_effect=sqlite3.OperationalError("disk I/O error"))
+        
+        assert daemon.run_round() == sample_results
+        
+        daemon.log_writer.write.assert_called_once_with(sample_results)
+        mock_print.assert_called_once_with(
+            "DEBUG: Could not write results to /nonexistent/connectivity.db: disk I/O error")
+
+
+class TestTrackOutages:
+    """Test cases for outage tracking in the daemon."""
+    
+    @patch('builtins.print')
+    def test_reports_outage_start_and_end(self, mock_print):
+        daemon = CheckerDaemon()
+        statuses = ['SUCCESS', 'FAILED: timed out', 'FAILED: timed out', 'SUCCESS', 'SUCCESS']
+        
+        for minute, status in enumerate(statuses):
+            daemon.track_outages({
+                'timestamp': f'2025-07-09 10:{minute:02d}:00',
+                'checks': [{'url': 'https://google.com', 'status': status, 'duration': 0.25}]
+            })
+        
+        assert mock_print.call_args_list == [
+            call("Outage started at 2025-07-09 10:01:00"),
+            call("Outage ended: 2025-07-09 10:01:00 to 2025-07-09 10:03:00 (0:02:00), up to 100% of sites down")
+        ]
+        assert daemon.outage_detector.stats().episodes == 1
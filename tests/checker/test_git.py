@@ -1,5 +1,6 @@
 import pytest
 from unittest.mock import patch, MagicMock
+import json
 import subprocess
 from src.libs.checker.git import (
     _get_git_status,
@@ -7,7 +8,11 @@ from src.libs.checker.git import (
     _add_files_to_git,
     _commit_files,
     _pull_and_push,
-    push_logs_to_git
+    _has_unpushed_commits,
+    _has_unpushed_log_commits,
+    _get_log_fingerprint,
+    push_logs_to_git,
+    GIT_NETWORK_TIMEOUT
 )
 
 
@@ -24,7 +29,7 @@ class TestGetGitStatus:
         
         assert result == "M logs/test-hostname/connectivity_log_20250708.txt\n?? logs/test-hostname/connectivity_log_20250707.txt"
         mock_run.assert_called_once_with(
-            ['git', 'status', '--porcelain', 'logs/test-hostname/'],
+            ['git', 'status', '--porcelain', '--branch', '--', 'logs/test-hostname/'],
             check=True, capture_output=True, text=True
         )
     
@@ -158,9 +163,11 @@ class TestAddFilesToGit:
         result = _add_files_to_git(files)
         
         assert result is True
-        assert mock_run.call_count == 2
-        mock_run.assert_any_call(['git', 'add', 'logs/test-hostname/connectivity_log_20250708.txt'], check=True, capture_output=True)
-        mock_run.assert_any_call(['git', 'add', 'logs/test-hostname/connectivity_log_20250707.txt'], check=True, capture_output=True)
+        # All files are staged with one git invocation
+        mock_run.assert_called_once_with(
+            ['git', 'add', '--', 'logs/test-hostname/connectivity_log_20250708.txt', 'logs/test-hostname/connectivity_log_20250707.txt'],
+            check=True, capture_output=True
+        )
     
     @patch('src.libs.checker.git.subprocess.run')
     @patch('builtins.print')
@@ -222,8 +229,8 @@ class TestPullAndPush:
         
         assert result is True
         assert mock_run.call_count == 2
-        mock_run.assert_any_call(['git', 'pull', '--rebase'], check=True, capture_output=True)
-        mock_run.assert_any_call(['git', 'push'], check=True, capture_output=True)
+        mock_run.assert_any_call(['git', 'pull', '--rebase'], check=True, capture_output=True, timeout=GIT_NETWORK_TIMEOUT)
+        mock_run.assert_any_call(['git', 'push'], check=True, capture_output=True, timeout=GIT_NETWORK_TIMEOUT)
         mock_print.assert_called_once_with("DEBUG: Successfully pushed 2 past day log files")
     
     @patch('src.libs.checker.git.subprocess.run')
@@ -259,6 +266,11 @@ class TestPullAndPush:
 class TestPushLogsToGit:
     """Test cases for push_logs_to_git function."""
     
+    @pytest.fixture(autouse=True)
+    def state_dir(self, tmp_path):
+        with patch('src.libs.checker.state.STATE_DIR', str(tmp_path)):
+            yield tmp_path
+    
     @patch('src.libs.checker.git.socket.gethostname')
     @patch('src.libs.checker.git.datetime.datetime')
     @patch('src.libs.checker.git._get_git_status')
@@ -273,18 +285,18 @@ class TestPushLogsToGit:
         # Setup mocks
         mock_hostname.return_value = "test-hostname"
         mock_datetime.now.return_value.strftime.return_value = "20250709"
-        mock_git_status.return_value = " M logs/test-hostname/connectivity_log_20250708.txt"
+        mock_git_status.return_value = "## main...origin/main\n M logs/test-hostname/connectivity_log_20250708.txt"
         mock_find.return_value = ["logs/test-hostname/connectivity_log_20250708.txt"]
         mock_add.return_value = True
         mock_commit.return_value = True
         mock_pull_push.return_value = True
         
-        push_logs_to_git()
+        assert push_logs_to_git() is True
         
         # Verify all functions were called
         mock_git_status.assert_called_once_with("test-hostname")
         mock_find.assert_called_once_with(
-            " M logs/test-hostname/connectivity_log_20250708.txt",
+            "## main...origin/main\n M logs/test-hostname/connectivity_log_20250708.txt",
             "test-hostname",
             "logs/test-hostname/connectivity_log_20250709.txt"
         )
@@ -346,4 +358,154 @@ class TestPushLogsToGit:
         push_logs_to_git()
         
         mock_print.assert_called_once()
-        assert "Unexpected error in push_logs_to_git()" in mock_print.call_args[0][0]
\ No newline at end of file
+        assert "Unexpected error in push_logs_to_git()" in mock_print.call_args[0][0]
+    
+    @patch('src.libs.checker.git.socket.gethostname')
+    @patch('src.libs.checker.git.datetime.datetime')
+    @patch('src.libs.checker.git._get_git_status')
+    @patch('src.libs.checker.git.subprocess.run')
+    @patch('builtins.print')
+    def test_push_logs_to_git_reports_failed_push(self, mock_print, mock_run, mock_git_status,
+                                                  mock_datetime, mock_hostname):
+        mock_hostname.return_value = "test-hostname"
+        mock_datetime.now.return_value.strftime.return_value = "20250709"
+        mock_git_status.return_value = "## main...origin/main [ahead 1]"
+        mock_run.side_effect = subprocess.TimeoutExpired(['git', 'push'], 120)
+        
+        assert push_logs_to_git() is False
+    
+    @patch('src.libs.checker.git.socket.gethostname')
+    @patch('src.libs.checker.git.datetime.datetime')
+    @patch('src.libs.checker.git._get_log_fingerprint')
+    @patch('src.libs.checker.git.subprocess.run')
+    def test_push_logs_to_git_skips_git_when_logs_unchanged(self, mock_run, mock_fingerprint,
+                                                           mock_datetime, mock_hostname, state_dir):
+        mock_hostname.return_value = "test-hostname"
+        mock_datetime.now.return_value.strftime.return_value = "20250709"
+        mock_fingerprint.return_value = "abc123"
+        (state_dir / 'git_push.json').write_text('{"fingerprint": "abc123"}')
+        
+        assert push_logs_to_git() is True
+        
+        mock_run.assert_not_called()
+    
+    @patch('src.libs.checker.git.socket.gethostname')
+    @patch('src.libs.checker.git.datetime.datetime')
+    @patch('src.libs.checker.git._get_log_fingerprint')
+    @patch('src.libs.checker.git._get_git_status')
+    @patch('src.libs.checker.git._check_unpushed_commits', return_value=True)
+    @patch('src.libs.checker.git._pull_and_push')
+    @patch('builtins.print')
+    def test_push_logs_to_git_pushes_existing_commits(self, mock_print, mock_pull_push, mock_check_unpushed, mock_git_status,
+                                                      mock_fingerprint, mock_datetime, mock_hostname, state_dir):
+        mock_hostname.return_value = "test-hostname"
+        mock_datetime.now.return_value.strftime.return_value = "20250709"
+        mock_fingerprint.return_value = "def456"
+        mock_git_status.return_value = "## main...origin/main [ahead 2]"
+        mock_pull_push.return_value = True
+        
+        assert push_logs_to_git() is True
+        
+        mock_pull_push.assert_called_once_with(0)
+        # The new fingerprint is only recorded after a successful push
+        assert json.loads((state_dir / 'git_push.json').read_text()) == {'fingerprint': 'def456'}
+    
+    @patch('src.libs.checker.git.socket.gethostname')
+    @patch('src.libs.checker.git.datetime.datetime')
+    @patch('src.libs.checker.git._get_log_fingerprint')
+    @patch('src.libs.checker.git._get_git_status')
+    @patch('src.libs.checker.git._check_unpushed_commits', return_value=True)
+    @patch('src.libs.checker.git._pull_and_push')
+    @patch('builtins.print')
+    def test_push_logs_to_git_failed_push_keeps_old_fingerprint(self, mock_print, mock_pull_push, mock_check_unpushed, mock_git_status,
+                                                                mock_fingerprint, mock_datetime, mock_hostname, state_dir):
+        mock_hostname.return_value = "test-hostname"
+        mock_datetime.now.return_value.strftime.return_value = "20250709"
+        mock_fingerprint.return_value = "def456"
+        mock_git_status.return_value = "## main...origin/main [ahead 2]"
+        mock_pull_push.return_value = False
+        
+        assert push_logs_to_git() is False
+        
+        assert not (state_dir / 'git_push.json').exists()
+
+
+class TestHasUnpushedCommits:
+    """Test cases for _has_unpushed_commits function."""
+    
+    def test_up_to_date(self):
+        assert _has_unpushed_commits("## main...origin/main\n M logs/h/connectivity_log_20250708.txt") is False
+    
+    def test_ahead(self):
+        assert _has_unpushed_commits("## main...origin/main [ahead 3]") is True
+    
+    def test_ahead_and_behind(self):
+        assert _has_unpushed_commits("## main...origin/main [ahead 1, behind 2]") is True
+    
+    def test_behind_only(self):
+        assert _has_unpushed_commits("## main...origin/main [behind 2]") is False
+    
+    def test_no_upstream(self):
+        assert _has_unpushed_commits("## main") is True
+    
+    def test_upstream_gone(self):
+        assert _has_unpushed_commits("## main...origin/main [gone]") is True
+
+
+class TestGetLogFingerprint:
+    """Test cases for _get_log_fingerprint function."""
+    
+    def test_fingerprint_ignores_today_and_other_files(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        log_dir = tmp_path / 'logs' / 'test-hostname'
+        log_dir.mkdir(parents=True)
+        (log_dir / 'connectivity_log_20250708.txt').write_text('past day\n')
+        (log_dir / 'connectivity_log_20250709.txt').write_text('today\n')
+        today_file = 'logs/test-hostname/connectivity_log_20250709.txt'
+        
+        before = _get_log_fingerprint('test-hostname', today_file)
+        (log_dir / 'connectivity_log_20250709.txt').write_text('today, more rounds\n')
+        (log_dir / 'notes.md').write_text('unrelated\n')
+        
+        assert _get_log_fingerprint('test-hostname', today_file) == before
+        
+        (log_dir / 'connectivity_log_20250708.txt').write_text('past day, late append\n')
+        assert _get_log_fingerprint('test-hostname', today_file) != before
+    
+    def test_fingerprint_missing_directory(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        
+        assert _get_log_fingerprint('missing-host', 'logs/missing-host/connectivity_log_20250709.txt') is None
+
+
+class TestHasUnpushedLogCommits:
+    """Test cases for _has_unpushed_log_commits function."""
+    
+    @patch('src.libs.checker.git.subprocess.run')
+    def test_up_to_date_skips_git_log(self, mock_run):
+        assert _has_unpushed_log_commits("## main...origin/main", "test-hostname") is False
+        
+        mock_run.assert_not_called()
+    
+    @patch('src.libs.checker.git.subprocess.run')
+    def test_ahead_with_log_commits(self, mock_run):
+        mock_run.return_value = MagicMock(stdout="abc1234 Add connectivity log entries\n")
+        
+        assert _has_unpushed_log_commits("## main...origin/main [ahead 1]", "test-hostname") is True
+        
+        mock_run.assert_called_once_with(
+            ['git', 'log', 'origin/main..HEAD', '--oneline', '--', 'logs/test-hostname/'],
+            check=True, capture_output=True, text=True)
+    
+    @patch('src.libs.checker.git.subprocess.run')
+    def test_ahead_with_unrelated_commits_only(self, mock_run):
+        # Commits that don't touch this host's logs don't trigger a push
+        mock_run.return_value = MagicMock(stdout="")
+        
+        assert _has_unpushed_log_commits("## main...origin/main [ahead 2]", "test-hostname") is False
+    
+    @patch('src.libs.checker.git.subprocess.run')
+    def test_log_failure_assumes_unpushed(self, mock_run):
+        mock_run.side_effect = subprocess.CalledProcessError(128, ['git', 'log'])
+        
+        assert _has_unpushed_log_commits("## main", "test-hostname") is True
@@ -0,0 +1,143 @@
+import pytest
+from unittest.mock import patch, MagicMock
+import os
+import subprocess
+import sys
+from src.libs.checker.git_sync import (
+    is_sync_due,
+    record_sync_result,
+    acquire_sync_lock,
+    release_sync_lock,
+    run_git_sync,
+    spawn_git_sync_worker,
+    MIN_PUSH_INTERVAL,
+    INITIAL_BACKOFF,
+    MAX_BACKOFF
+)
+
+
+@pytest.fixture
+def state_dir(tmp_path):
+    with patch('src.libs.checker.state.STATE_DIR', str(tmp_path)):
+        yield tmp_path
+
+
+class TestSyncSchedule:
+    """Test cases for sync scheduling helpers."""
+    
+    def test_is_sync_due_with_empty_state(self):
+        assert is_sync_due({}, 1000.0) is True
+    
+    def test_is_sync_due_respects_next_attempt(self):
+        assert is_sync_due({'next_attempt_at': 1500.0}, 1000.0) is False
+        assert is_sync_due({'next_attempt_at': 1500.0}, 1500.0) is True
+    
+    def test_record_success_enforces_min_interval(self):
+        state = record_sync_result({'failures': 3}, True, 1000.0)
+        
+        assert state['failures'] == 0
+        assert state['last_success_at'] == 1000.0
+        assert state['next_attempt_at'] == 1000.0 + MIN_PUSH_INTERVAL
+    
+    def test_record_failure_backs_off_exponentially(self):
+        state = {}
+        delays = []
+        for _ in range(10):
+            state = record_sync_result(state, False, 1000.0)
+            delays.append(state['next_attempt_at'] - 1000.0)
+        
+        assert delays[:4] == [INITIAL_BACKOFF, INITIAL_BACKOFF * 2, INITIAL_BACKOFF * 4, INITIAL_BACKOFF * 8]
+        assert delays[-1] == MAX_BACKOFF
+        assert state['failures'] == 10
+
+
+class TestSyncLock:
+    """Test cases for the git sync lock file."""
+    
+    def test_lock_is_exclusive(self, tmp_path):
+        lock_path = str(tmp_path / 'git_sync.lock')
+        
+        first = acquire_sync_lock(lock_path)
+        second = acquire_sync_lock(lock_path)
+        
+        assert first is not None
+        assert second is None
+        release_sync_lock(first)
+        third = acquire_sync_lock(lock_path)
+        assert third is not None
+        release_sync_lock(third)
+    
+    def test_lock_records_pid(self, tmp_path):
+        lock_path = str(tmp_path / 'git_sync.lock')
+        
+        lock_file = acquire_sync_lock(lock_path)
+        
+        with open(lock_path) as f:
+            assert f.read().strip() == str(os.getpid())
+        release_sync_lock(lock_file)
+
+
+class TestRunGitSync:
+    """Test cases for run_git_sync function."""
+    
+    @patch('src.libs.checker.git_sync.push_logs_to_git')
+    def test_run_git_sync_success_sets_min_interval(self, mock_push, state_dir):
+        mock_push.return_value = True
+        
+        assert run_git_sync(clock=lambda: 1000.0) is True
+        # Second call within the minimum interval does nothing
+        assert run_git_sync(clock=lambda: 1100.0) is None
+        
+        mock_push.assert_called_once()
+    
+    @patch('builtins.print')
+    @patch('src.libs.checker.git_sync.push_logs_to_git')
+    def test_run_git_sync_failure_backs_off(self, mock_push, mock_print, state_dir):
+        mock_push.return_value = False
+        
+        assert run_git_sync(clock=lambda: 1000.0) is False
+        assert run_git_sync(clock=lambda: 1000.0 + INITIAL_BACKOFF - 1) is None
+        assert run_git_sync(clock=lambda: 1000.0 + INITIAL_BACKOFF) is False
+        
+        assert mock_push.call_count == 2
+        assert "next attempt in 120s" in mock_print.call_args[0][0]
+    
+    @patch('builtins.print')
+    @patch('src.libs.checker.git_sync.push_logs_to_git')
+    def test_run_git_sync_skips_when_locked(self, mock_push, mock_print, state_dir):
+        held = acquire_sync_lock(str(state_dir / 'git_sync.lock'))
+        
+        assert run_git_sync() is None
+        
+        release_sync_lock(held)
+        mock_push.assert_not_called()
+        mock_print.assert_called_once_with("DEBUG: Another git sync is already running - skipping")
+
+
+class TestSpawnGitSyncWorker:
+    """Test cases for spawn_git_sync_worker function."""
+    
+    @patch('src.libs.checker.git_sync.subprocess.Popen')
+    def test_spawn_detached_worker(self, mock_popen, state_dir):
+        assert spawn_git_sync_worker('/project/src/xfinity_outage_checker.py') is True
+        
+        mock_popen.assert_called_once_with(
+            [sys.executable, '/project/src/xfinity_outage_checker.py', '--git-sync-worker'],
+            stdin=subprocess.DEVNULL, start_new_session=True
+        )
+    
+    @patch('src.libs.checker.git_sync.subprocess.Popen')
+    def test_spawn_skipped_while_backing_off(self, mock_popen, state_dir):
+        (state_dir / 'git_sync.json').write_text('{"next_attempt_at": 2000.0}')
+        
+        assert spawn_git_sync_worker('/project/src/xfinity_outage_checker.py', clock=lambda: 1000.0) is False
+        
+        mock_popen.assert_not_called()
+    
+    @patch('builtins.print')
+    @patch('src.libs.checker.git_sync.subprocess.Popen')
+    def test_spawn_failure(self, mock_popen, mock_print, state_dir):
+        mock_popen.side_effect = OSError("fork failed")
+        
+        assert spawn_git_sync_worker('/project/src/xfinity_outage_checker.py') is False
+        assert "Could not start git sync worker" in mock_print.call_args[0][0]
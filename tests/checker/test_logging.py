@@ -1,7 +1,7 @@
 import pytest
 from unittest.mock import patch, mock_open, MagicMock, call
 import json
-from src.libs.checker.logging import log_to_file
+from src.libs.checker.logging import log_to_file, get_log_file_path, write_log_entry, format_phases
 
 
 @pytest.fixture
@@ -18,6 +18,7 @@ def sample_results():
         ]
     }
 
+
 @patch('src.libs.checker.logging.socket.gethostname')
 @patch('src.libs.checker.logging.datetime.datetime')
 @patch('src.libs.checker.logging.os.makedirs')
@@ -42,6 +43,7 @@ def test_log_to_file_default_path(mock_file, mock_makedirs, mock_datetime, mock_
     ]
     handle.write.assert_has_calls(expected_calls)
 
+
 @patch('builtins.open', new_callable=mock_open)
 def test_log_to_file_custom_path(mock_file, sample_results):
     custom_log_file = '/tmp/test_log.txt'
@@ -51,3 +53,45 @@ def test_log_to_file_custom_path(mock_file, sample_results):
     mock_file.assert_called_once_with(custom_log_file, 'a')
 
 
+@patch('src.libs.checker.logging.socket.gethostname')
+@patch('src.libs.checker.logging.datetime.datetime')
+@patch('src.libs.checker.logging.os.makedirs')
+def test_get_log_file_path(mock_makedirs, mock_datetime, mock_hostname):
+    mock_hostname.return_value = 'test-hostname'
+    mock_datetime.now.return_value.strftime.return_value = '20250709'
+    
+    result = get_log_file_path()
+    
+    assert result == 'logs/test-hostname/connectivity_log_20250709.txt'
+    mock_makedirs.assert_called_once_with('logs/test-hostname', exist_ok=True)
+
+
+@patch('src.libs.checker.logging.socket.gethostname')
+def test_write_log_entry_to_open_file(mock_hostname, sample_results):
+    mock_hostname.return_value = 'test-hostname'
+    handle = MagicMock()
+    
+    write_log_entry(handle, sample_results)
+    
+    written = ''.join(c.args[0] for c in handle.write.call_args_list)
+    assert written.startswith('2025-07-09 10:30:45 - WiFi: TestNetwork - Internet: 2/3 sites accessible\n')
+    assert written.endswith('Hostname: test-hostname\n\n')
+
+
+@patch('src.libs.checker.logging.socket.gethostname')
+def test_write_log_entry_with_phases(mock_hostname, sample_results):
+    mock_hostname.return_value = 'test-hostname'
+    sample_results['checks'][0]['phases'] = {'dns': 0.012, 'connect': 0.02, 'tls': 0.0456, 'ttfb': 0.11}
+    sample_results['checks'][2]['phases'] = {'dns': 5.0, 'connect': None, 'tls': None, 'ttfb': None}
+    handle = MagicMock()
+    
+    write_log_entry(handle, sample_results)
+    
+    handle.write.assert_any_call('  (0.25s) - https://google.com: SUCCESS [dns=0.012 connect=0.020 tls=0.046 ttfb=0.110]\n')
+    handle.write.assert_any_call('  (0.18s) - https://github.com: SUCCESS\n')
+    handle.write.assert_any_call('  (5.00s) - https://example.com: FAILED [dns=5.000]\n')
+
+
+def test_format_phases_empty():
+    assert format_phases(None) == ''
+    assert format_phases({'dns': None, 'connect': None}) == ''
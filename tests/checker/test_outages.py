@@ -0,0 +1,93 @@
+import pytest
+import datetime
+from src.libs.checker.outages import OutageDetector, detect_outages
+
+
+START = datetime.datetime(2025, 7, 10, 12, 0)
+MINUTE = datetime.timedelta(minutes=1)
+
+
+def make_rounds(success_rates, start=START, step=MINUTE):
+    return [(start + step * i, rate) for i, rate in enumerate(success_rates)]
+
+
+class TestOutageDetector:
+    """Test cases for OutageDetector class."""
+    
+    def test_episode_from_first_failed_to_first_recovered_round(self):
+        episodes, stats = detect_outages(make_rounds([1, 1, 0, 0.25, 0, 1, 1, 1]))
+        
+        assert len(episodes) == 1
+        episode = episodes[0]
+        assert episode.start == START + 2 * MINUTE
+        assert episode.end == START + 5 * MINUTE
+        assert episode.duration == 3 * MINUTE
+        assert episode.failed_rounds == 3
+        assert episode.severity == 1.0
+        assert not episode.ongoing
+        
+        assert stats.episodes == 1
+        assert stats.downtime == 3 * MINUTE
+        assert stats.uptime == 4 * MINUTE
+        assert stats.mttr == 3 * MINUTE
+        assert stats.mtbf == 4 * MINUTE
+        assert stats.longest == 3 * MINUTE
+        assert stats.availability == pytest.approx(4 / 7)
+    
+    def test_short_failures_and_flapping_recovery(self):
+        # A single failed round is not an outage; a single good round doesn't end one
+        episodes, stats = detect_outages(make_rounds([1, 0, 1, 1, 0, 0, 1, 0, 1, 1, 1]))
+        
+        assert [(episode.start, episode.end, episode.failed_rounds) for episode in episodes] == [
+            (START + 4 * MINUTE, START + 8 * MINUTE, 3)
+        ]
+        assert stats.downtime == 4 * MINUTE
+        assert stats.uptime == 6 * MINUTE
+    
+    def test_thresholds(self):
+        rounds = make_rounds([1, 0.5, 0.5, 1, 1])
+        
+        assert detect_outages(rounds)[0] == []
+        episodes, _ = detect_outages(rounds, min_success_rate=0.75, min_failed_rounds=1, min_recovered_rounds=1)
+        assert [(episode.start, episode.end, episode.severity) for episode in episodes] == [
+            (START + MINUTE, START + 3 * MINUTE, 0.5)
+        ]
+    
+    def test_ongoing_outage(self):
+        episodes, stats = detect_outages(make_rounds([1, 1, 0, 0, 0]))
+        
+        assert episodes[-1].ongoing
+        assert episodes[-1].start == START + 2 * MINUTE
+        assert episodes[-1].end == START + 4 * MINUTE
+        assert stats.episodes == 1
+        assert stats.mttr is None
+        assert stats.downtime == 2 * MINUTE
+    
+    def test_gaps_are_not_counted(self):
+        rounds = make_rounds([1, 1]) + make_rounds([1, 1], start=START + datetime.timedelta(hours=5))
+        
+        _, stats = detect_outages(rounds)
+        
+        assert stats.uptime == 2 * MINUTE
+        assert stats.availability == 1.0
+        assert stats.mtbf is None
+    
+    def test_affected_sites_and_events(self):
+        detector = OutageDetector()
+        
+        assert detector.update(START, 0.0, ['https://a.com', 'https://b.com']) is None
+        assert detector.update(START + MINUTE, 0.25, ['https://c.com']) is None
+        assert detector.in_outage
+        assert detector.current_start == START
+        assert detector.update(START + 2 * MINUTE, 1.0) is None
+        
+        episode = detector.update(START + 3 * MINUTE, 1.0)
+        assert episode.affected_sites == ('https://a.com', 'https://b.com', 'https://c.com')
+        assert not detector.in_outage
+    
+    def test_empty(self):
+        episodes, stats = detect_outages([])
+        
+        assert episodes == []
+        assert stats.episodes == 0
+        assert stats.availability is None
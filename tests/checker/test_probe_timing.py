@@ -0,0 +1,81 @@
+import pytest
+from unittest.mock import patch, MagicMock
+import socket
+from src.libs.checker.probe_timing import (
+    PhaseTimer,
+    PHASES,
+    TimedHTTPConnection,
+    TimedHTTPSHandler,
+    build_timed_opener,
+    get_ssl_context
+)
+
+
+class FakeClock:
+    def __init__(self, times):
+        self.times = list(times)
+    
+    def __call__(self):
+        return self.times.pop(0)
+
+
+class TestPhaseTimer:
+    """Test cases for PhaseTimer class."""
+    
+    def test_phase_timer_starts_empty(self):
+        timer = PhaseTimer()
+        
+        assert timer.phases == {phase: None for phase in PHASES}
+    
+    def test_phase_timer_accumulates_across_redirect_hops(self):
+        timer = PhaseTimer(clock=FakeClock([10.5, 20.25]))
+        
+        timer.add('dns', 10.0)
+        timer.add('dns', 20.0)
+        
+        assert timer.phases['dns'] == 0.75
+        assert timer.phases['tls'] is None
+
+
+class TestTimedConnections:
+    """Test cases for the timed connection classes."""
+    
+    @patch('src.libs.checker.probe_timing.socket.getaddrinfo')
+    def test_dns_failure_records_only_dns(self, mock_getaddrinfo):
+        mock_getaddrinfo.side_effect = socket.gaierror(8, 'nodename nor servname provided')
+        timer = PhaseTimer()
+        conn = TimedHTTPConnection('example.invalid', 80, timeout=1, phase_timer=timer)
+        
+        with pytest.raises(socket.gaierror):
+            conn.connect()
+        
+        # DNS failed before its phase was recorded; nothing later was reached
+        assert timer.phases['connect'] is None
+        assert timer.phases['tls'] is None
+    
+    def test_connect_refused_records_dns_and_connect(self):
+        sock = socket.socket()
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+        sock.close()
+        timer = PhaseTimer()
+        conn = TimedHTTPConnection('127.0.0.1', port, timeout=1, phase_timer=timer)
+        
+        with pytest.raises(OSError):
+            conn.connect()
+        
+        assert timer.phases['dns'] >= 0
+        assert timer.phases['connect'] >= 0
+        assert timer.phases['ttfb'] is None
+
+
+class TestBuildTimedOpener:
+    """Test cases for build_timed_opener function."""
+    
+    def test_opener_uses_timed_handlers(self):
+        opener = build_timed_opener(PhaseTimer())
+        
+        assert any(isinstance(handler, TimedHTTPSHandler) for handler in opener.handlers)
+    
+    def test_ssl_context_shared(self):
+        assert get_ssl_context() is get_ssl_context()
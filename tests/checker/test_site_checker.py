@@ -3,35 +3,47 @@ from unittest.mock import patch, MagicMock
 import urllib.error
 import time
 from concurrent.futures import Future
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
 from src.libs.checker.site_checker import check_single_site, check_connectivity, DEFAULT_WEBSITES
 
 
+class _OkHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(200)
+        self.end_headers()
+    
+    def log_message(self, format, *args):
+        pass
+
+
 class TestSiteChecker:
 
-    @patch('src.libs.checker.site_checker.time.time')
-    @patch('src.libs.checker.site_checker.urllib.request.urlopen')
-    def test_check_single_site_success(self, mock_urlopen, mock_time):
+    @patch('src.libs.checker.site_checker.time.monotonic')
+    @patch('src.libs.checker.site_checker.build_timed_opener')
+    def test_check_single_site_success(self, mock_build_opener, mock_time):
         mock_time.side_effect = [1000.0, 1000.5]  # Start and end times
         mock_response = MagicMock()
         mock_response.getcode.return_value = 200
-        mock_urlopen.return_value = mock_response
+        mock_build_opener.return_value.open.return_value = mock_response
         
         result = check_single_site('https://example.com')
         
         assert result == {
             'url': 'https://example.com',
             'status': 'SUCCESS',
-            'duration': 0.5
+            'duration': 0.5,
+            'phases': {'dns': None, 'connect': None, 'tls': None, 'ttfb': None}
         }
-        mock_urlopen.assert_called_once_with('https://example.com', timeout=5)
+        mock_build_opener.return_value.open.assert_called_once_with('https://example.com', timeout=5)
 
-    @patch('src.libs.checker.site_checker.time.time')
-    @patch('src.libs.checker.site_checker.urllib.request.urlopen')
-    def test_check_single_site_http_error(self, mock_urlopen, mock_time):
+    @patch('src.libs.checker.site_checker.time.monotonic')
+    @patch('src.libs.checker.site_checker.build_timed_opener')
+    def test_check_single_site_http_error(self, mock_build_opener, mock_time):
         mock_time.side_effect = [1000.0, 1000.3]
         mock_response = MagicMock()
         mock_response.getcode.return_value = 404
-        mock_urlopen.return_value = mock_response
+        mock_build_opener.return_value.open.return_value = mock_response
         
         result = check_single_site('https://example.com')
         
@@ -39,11 +51,11 @@ class TestSiteChecker:
         assert result['status'] == 'HTTP_404'
         assert abs(result['duration'] - 0.3) < 0.001  # Allow for floating point precision
 
-    @patch('src.libs.checker.site_checker.time.time')
-    @patch('src.libs.checker.site_checker.urllib.request.urlopen')
-    def test_check_single_site_url_error(self, mock_urlopen, mock_time):
+    @patch('src.libs.checker.site_checker.time.monotonic')
+    @patch('src.libs.checker.site_checker.build_timed_opener')
+    def test_check_single_site_url_error(self, mock_build_opener, mock_time):
         mock_time.side_effect = [1000.0, 1005.0]
-        mock_urlopen.side_effect = urllib.error.URLError("Name or service not known")
+        mock_build_opener.return_value.open.side_effect = urllib.error.URLError("Name or service not known")
         
         result = check_single_site('https://nonexistent.com')
         
@@ -52,11 +64,11 @@ class TestSiteChecker:
         assert 'Name or service not known' in result['status']
         assert result['duration'] == 5.0
 
-    @patch('src.libs.checker.site_checker.time.time')
-    @patch('src.libs.checker.site_checker.urllib.request.urlopen')
-    def test_check_single_site_generic_exception(self, mock_urlopen, mock_time):
+    @patch('src.libs.checker.site_checker.time.monotonic')
+    @patch('src.libs.checker.site_checker.build_timed_opener')
+    def test_check_single_site_generic_exception(self, mock_build_opener, mock_time):
         mock_time.side_effect = [1000.0, 1002.0]
-        mock_urlopen.side_effect = Exception("Connection timeout")
+        mock_build_opener.return_value.open.side_effect = Exception("Connection timeout")
         
         result = check_single_site('https://example.com')
         
@@ -64,6 +76,22 @@ class TestSiteChecker:
         assert result['status'] == 'FAILED: Connection timeout'
         assert result['duration'] == 2.0
 
+    def test_check_single_site_records_phases(self):
+        # Real request against a local server: DNS, connect and TTFB get measured, no TLS for http://
+        server = HTTPServer(('127.0.0.1', 0), _OkHandler)
+        thread = threading.Thread(target=server.handle_request, daemon=True)
+        thread.start()
+        
+        result = check_single_site(f'http://localhost:{server.server_address[1]}/')
+        
+        thread.join(5)
+        server.server_close()
+        assert result['status'] == 'SUCCESS'
+        assert result['phases']['dns'] >= 0
+        assert result['phases']['connect'] >= 0
+        assert result['phases']['tls'] is None
+        assert result['phases']['ttfb'] >= 0
+
     @patch('src.libs.checker.site_checker.get_wifi_network')
     @patch('src.libs.checker.site_checker.get_timestamp_info')
     @patch('src.libs.checker.site_checker.ThreadPoolExecutor')
@@ -251,4 +279,90 @@ class TestSiteChecker:
         assert 'https://github.com' in DEFAULT_WEBSITES
         assert 'https://google.com' in DEFAULT_WEBSITES
         assert 'https://apple.com' in DEFAULT_WEBSITES
-        assert 'https://reddit.com' in DEFAULT_WEBSITES
\ No newline at end of file
+        assert 'https://reddit.com' in DEFAULT_WEBSITES
+
+    @patch('src.libs.checker.site_checker.get_wifi_network')
+    @patch('src.libs.checker.site_checker.get_timestamp_info')
+    @patch('src.libs.checker.site_checker.check_sites_async')
+    @patch('src.libs.checker.site_checker.ThreadPoolExecutor')
+    def test_check_connectivity_async_engine(self, mock_executor, mock_async, mock_timestamp, mock_wifi):
+        websites = ['https://a.com', 'https://b.com']
+        mock_timestamp.return_value = {
+            'timestamp_local': '2025-07-09 10:30:45',
+            'timestamp_utc': '2025-07-09 14:30:45',
+            'timezone_local': 'America/New_York'
+        }
+        mock_wifi.return_value = 'TestNetwork'
+        mock_async.return_value = [
+            {'url': 'https://b.com', 'status': 'SUCCESS', 'duration': 0.2},
+            {'url': 'https://a.com', 'status': 'FAILED: timed out', 'duration': 5.0}
+        ]
+        
+        result = check_connectivity(websites, engine='async')
+        
+        mock_async.assert_called_once_with(websites)
+        mock_executor.assert_not_called()
+        assert [check['url'] for check in result['checks']] == websites
+        assert result['wifi_network'] == 'TestNetwork'
+
+    def test_check_connectivity_unknown_engine(self):
+        with pytest.raises(ValueError, match="Unknown probe engine"):
+            check_connectivity(['https://a.com'], engine='carrier-pigeon')
+
+    @patch('src.libs.checker.site_checker.get_wifi_network')
+    @patch('src.libs.checker.site_checker.get_timestamp_info')
+    @patch('src.libs.checker.site_checker.check_sites_with_threads')
+    def test_check_connectivity_pooled_engine_uses_given_pool(self, mock_threads, mock_timestamp, mock_wifi):
+        mock_timestamp.return_value = {
+            'timestamp_local': '2025-07-09 10:30:45',
+            'timestamp_utc': '2025-07-09 14:30:45',
+            'timezone_local': 'America/New_York'
+        }
+        mock_threads.return_value = [{'url': 'https://a.com', 'status': 'SUCCESS', 'duration': 0.1}]
+        pool = MagicMock()
+        
+        check_connectivity(['https://a.com'], engine='pooled', pool=pool)
+        
+        mock_threads.assert_called_once_with(['https://a.com'], pool.check)
+        pool.close.assert_not_called()
+
+    @patch('src.libs.checker.site_checker.get_wifi_network')
+    @patch('src.libs.checker.site_checker.get_timestamp_info')
+    @patch('src.libs.checker.site_checker.check_sites_with_threads')
+    @patch('src.libs.checker.site_checker.ProbeConnectionPool')
+    def test_check_connectivity_pooled_engine_temporary_pool(self, mock_pool_class, mock_threads, mock_timestamp, mock_wifi):
+        mock_timestamp.return_value = {
+            'timestamp_local': '2025-07-09 10:30:45',
+            'timestamp_utc': '2025-07-09 14:30:45',
+            'timezone_local': 'America/New_York'
+        }
+        mock_threads.return_value = [{'url': 'https://a.com', 'status': 'SUCCESS', 'duration': 0.1}]
+        
+        check_connectivity(['https://a.com'], engine='pooled')
+        
+        # The temporary pool is closed when the round ends
+        mock_pool_class.return_value.__exit__.assert_called_once()
+
+    @patch('src.libs.checker.site_checker.get_timestamp_info')
+    @patch('src.libs.checker.site_checker.check_sites_with_threads')
+    def test_check_connectivity_wifi_lookup_runs_concurrently(self, mock_threads, mock_timestamp):
+        mock_timestamp.return_value = {
+            'timestamp_local': '2025-07-09 10:30:45',
+            'timestamp_utc': '2025-07-09 14:30:45',
+            'timezone_local': 'America/New_York'
+        }
+        wifi_started = threading.Event()
+        
+        def slow_wifi():
+            wifi_started.set()
+            return 'CachedNetwork'
+        
+        def probes(websites):
+            # The WiFi lookup is already running while the probes are
+            assert wifi_started.wait(5)
+            return [{'url': 'https://a.com', 'status': 'SUCCESS', 'duration': 0.1}]
+        mock_threads.side_effect = probes
+        
+        result = check_connectivity(['https://a.com'], wifi_provider=slow_wifi)
+        
+        assert result['wifi_network'] == 'CachedNetwork'
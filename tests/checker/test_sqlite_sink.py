@@ -0,0 +1,117 @@
+import pytest
+import sqlite3
+from unittest.mock import patch
+from src.libs.checker.sqlite_sink import open_results_database, write_round, ResultsDatabase, log_to_sqlite
+
+
+@pytest.fixture
+def sample_results():
+    return {
+        'timestamp': '2025-07-09 10:30:45',
+        'timestamp_utc': '2025-07-09 14:30:45',
+        'timezone_local': 'EDT GMT-0400',
+        'wifi_network': 'TestNetwork',
+        'checks': [
+            {'url': 'https://google.com', 'status': 'SUCCESS', 'duration': 0.25,
+             'phases': {'dns': 0.012, 'connect': 0.02, 'tls': 0.045, 'ttfb': 0.11}},
+            {'url': 'https://example.com', 'status': 'FAILED: timed out', 'duration': 5.0,
+             'phases': {'dns': 0.01, 'connect': None, 'tls': None, 'ttfb': None}},
+            {'url': 'https://github.com', 'status': 'SUCCESS', 'duration': 0.18}
+        ]
+    }
+
+
+class TestOpenResultsDatabase:
+    """Test cases for open_results_database function."""
+    
+    def test_creates_tables_and_indexes(self, tmp_path):
+        db_path = tmp_path / 'nested' / 'connectivity.db'
+        
+        connection = open_results_database(str(db_path))
+        indexes = {row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        tables = {row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        connection.close()
+        
+        assert {'rounds', 'checks'} <= tables
+        assert {'idx_rounds_timestamp_utc', 'idx_rounds_host_wifi_time', 'idx_checks_round'} <= indexes
+    
+    def test_reopening_keeps_existing_rows(self, tmp_path, sample_results):
+        db_path = str(tmp_path / 'connectivity.db')
+        connection = open_results_database(db_path)
+        write_round(connection, sample_results, hostname='test-hostname')
+        connection.close()
+        
+        connection = open_results_database(db_path)
+        assert connection.execute('SELECT COUNT(*) FROM rounds').fetchone()[0] == 1
+        connection.close()
+
+
+class TestWriteRound:
+    """Test cases for write_round function."""
+    
+    def test_writes_round_and_checks(self, tmp_path, sample_results):
+        connection = open_results_database(str(tmp_path / 'connectivity.db'))
+        
+        round_id = write_round(connection, sample_results, hostname='test-hostname')
+        
+        assert connection.execute('SELECT * FROM rounds').fetchall() == [
+            (round_id, '2025-07-09 10:30:45', '2025-07-09 14:30:45', 'EDT GMT-0400', 'test-hostname',
+             'TestNetwork', 2, 3)
+        ]
+        assert connection.execute('SELECT * FROM checks ORDER BY rowid').fetchall() == [
+            (round_id, 'https://google.com', 'SUCCESS', 0.25, 0.012, 0.02, 0.045, 0.11),
+            (round_id, 'https://example.com', 'FAILED: timed out', 5.0, 0.01, None, None, None),
+            (round_id, 'https://github.com', 'SUCCESS', 0.18, None, None, None, None)
+        ]
+        connection.close()
+    
+    @patch('src.libs.checker.sqlite_sink.socket.gethostname')
+    def test_defaults_to_this_hostname(self, mock_hostname, tmp_path, sample_results):
+        mock_hostname.return_value = 'this-machine'
+        connection = open_results_database(str(tmp_path / 'connectivity.db'))
+        
+        write_round(connection, sample_results)
+        
+        assert connection.execute('SELECT hostname FROM rounds').fetchone() == ('this-machine',)
+        connection.close()
+
+
+class TestResultsDatabase:
+    """Test cases for ResultsDatabase class."""
+    
+    def test_write_opens_once_and_close(self, tmp_path, sample_results):
+        db = ResultsDatabase(str(tmp_path / 'connectivity.db'))
+        
+        db.write(sample_results)
+        connection = db._connection
+        db.write(sample_results)
+        
+        assert db._connection is connection
+        assert connection.execute('SELECT COUNT(*) FROM rounds').fetchone()[0] == 2
+        db.close()
+        assert db._connection is None
+        
+        # Closing twice should not raise
+        db.close()
+
+
+class TestLogToSqlite:
+    """Test cases for log_to_sqlite function."""
+    
+    def test_appends_results(self, tmp_path, sample_results):
+        db_path = str(tmp_path / 'connectivity.db')
+        
+        assert log_to_sqlite(sample_results, db_path) is True
+        assert log_to_sqlite(sample_results, db_path) is True
+        
+        connection = sqlite3.connect(db_path)
+        assert connection.execute('SELECT COUNT(*) FROM checks').fetchone()[0] == 6
+        connection.close()
+    
+    @patch('builtins.print')
+    def test_unwritable_path_returns_false(self, mock_print, tmp_path, sample_results):
+        blocker = tmp_path / 'not-a-directory'
+        blocker.write_text('')
+        
+        assert log_to_sqlite(sample_results, str(blocker / 'connectivity.db')) is False
+        assert mock_print.call_args[0][0].startswith("DEBUG: Could not write results to ")
@@ -0,0 +1,36 @@
+import pytest
+from unittest.mock import patch
+import os
+from src.libs.checker.state import get_state_path, load_state, save_state
+
+
+class TestState:
+    """Test cases for the JSON state file helpers."""
+    
+    def test_get_state_path(self):
+        assert get_state_path('git_sync.json') == os.path.join('logs/.cache', 'git_sync.json')
+    
+    def test_save_and_load_round_trip(self, tmp_path):
+        path = str(tmp_path / 'nested' / 'state.json')
+        
+        assert save_state(path, {'failures': 2, 'last_push': 1000.5}) is True
+        
+        assert load_state(path) == {'failures': 2, 'last_push': 1000.5}
+        assert os.listdir(tmp_path / 'nested') == ['state.json']
+    
+    def test_load_missing_file(self, tmp_path):
+        assert load_state(str(tmp_path / 'missing.json')) == {}
+    
+    def test_load_corrupt_file(self, tmp_path):
+        path = tmp_path / 'state.json'
+        path.write_text('{not json')
+        
+        assert load_state(str(path)) == {}
+    
+    @patch('builtins.print')
+    @patch('src.libs.checker.state.os.makedirs')
+    def test_save_state_failure(self, mock_makedirs, mock_print):
+        mock_makedirs.side_effect = OSError("Read-only file system")
+        
+        assert save_state('/readonly/state.json', {}) is False
+        assert "Could not save state file" in mock_print.call_args[0][0]
@@ -1,10 +1,17 @@
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, mock_open
 import subprocess
 from src.libs.checker.wifi import (
     get_wifi_network_via_networksetup,
     get_wifi_network_via_system_profiler,
-    get_wifi_network
+    get_wifi_network,
+    get_linux_wireless_interfaces,
+    get_ssid_via_ioctl,
+    get_bssid_via_ioctl,
+    get_ssid_via_iw,
+    get_wifi_network_via_linux,
+    get_interface_fingerprint,
+    WifiNetworkCache
 )
 
 
@@ -230,6 +237,7 @@ class TestWiFi:
         
         assert result == "TestNetwork"
 
+    @patch('src.libs.checker.wifi.sys.platform', 'darwin')
     @patch('src.libs.checker.wifi.get_wifi_network_via_system_profiler')
     @patch('src.libs.checker.wifi.get_wifi_network_via_networksetup')
     def test_get_wifi_network_networksetup_success(self, mock_networksetup, mock_system_profiler):
@@ -243,6 +251,7 @@ class TestWiFi:
         mock_networksetup.assert_called_once()
         mock_system_profiler.assert_not_called()
 
+    @patch('src.libs.checker.wifi.sys.platform', 'darwin')
     @patch('src.libs.checker.wifi.get_wifi_network_via_system_profiler')
     @patch('src.libs.checker.wifi.get_wifi_network_via_networksetup')
     def test_get_wifi_network_fallback_to_system_profiler(self, mock_networksetup, mock_system_profiler):
@@ -256,6 +265,7 @@ class TestWiFi:
         mock_networksetup.assert_called_once()
         mock_system_profiler.assert_called_once()
 
+    @patch('src.libs.checker.wifi.sys.platform', 'darwin')
     @patch('src.libs.checker.wifi.get_wifi_network_via_system_profiler')
     @patch('src.libs.checker.wifi.get_wifi_network_via_networksetup')
     def test_get_wifi_network_both_methods_fail(self, mock_networksetup, mock_system_profiler):
@@ -269,6 +279,7 @@ class TestWiFi:
         mock_networksetup.assert_called_once()
         mock_system_profiler.assert_called_once()
 
+    @patch('src.libs.checker.wifi.sys.platform', 'darwin')
     @patch('src.libs.checker.wifi.get_wifi_network_via_system_profiler')
     @patch('src.libs.checker.wifi.get_wifi_network_via_networksetup')
     def test_get_wifi_network_networksetup_returns_empty_string(self, mock_networksetup, mock_system_profiler):
@@ -337,4 +348,142 @@ class TestWiFi:
         
         result = get_wifi_network_via_system_profiler()
         
-        assert result is None
\ No newline at end of file
+        assert result is None
+
+
+class TestLinuxWiFi:
+    """Test cases for the Linux WiFi backend."""
+    
+    @patch('builtins.open', new_callable=mock_open, read_data=(
+        "Inter-| sta-|   Quality        |   Discarded packets               | Missed | WE\n"
+        " face | tus | link level noise |  nwid  crypt   frag  retry   misc | beacon | 22\n"
+        " wlan0: 0000   70.  -40.  -256        0      0      0      0      0        0\n"
+    ))
+    def test_get_linux_wireless_interfaces_from_proc(self, mock_file):
+        assert get_linux_wireless_interfaces() == ['wlan0']
+    
+    @patch('src.libs.checker.wifi.os.path.isdir')
+    @patch('src.libs.checker.wifi.os.listdir')
+    @patch('builtins.open', side_effect=OSError("No such file"))
+    def test_get_linux_wireless_interfaces_falls_back_to_sysfs(self, mock_file, mock_listdir, mock_isdir):
+        mock_listdir.return_value = ['lo', 'wlp2s0', 'eth0']
+        mock_isdir.side_effect = lambda path: path == '/sys/class/net/wlp2s0/wireless'
+        
+        assert get_linux_wireless_interfaces() == ['wlp2s0']
+    
+    @patch('src.libs.checker.wifi.fcntl.ioctl')
+    def test_get_ssid_via_ioctl_unsupported(self, mock_ioctl):
+        mock_ioctl.side_effect = OSError(95, 'Operation not supported')
+        
+        assert get_ssid_via_ioctl('wlan0') is None
+    
+    @patch('src.libs.checker.wifi.fcntl.ioctl')
+    def test_get_bssid_via_ioctl(self, mock_ioctl):
+        mock_ioctl.return_value = b'wlan0'.ljust(16, b'\0') + b'\x01\x00' + bytes.fromhex('aabbccddeeff') + bytes(8)
+        
+        assert get_bssid_via_ioctl('wlan0') == 'aa:bb:cc:dd:ee:ff'
+    
+    @patch('src.libs.checker.wifi.fcntl.ioctl')
+    def test_get_bssid_via_ioctl_unsupported(self, mock_ioctl):
+        mock_ioctl.side_effect = OSError(95, 'Operation not supported')
+        
+        assert get_bssid_via_ioctl('wlan0') is None
+    
+    @patch('src.libs.checker.wifi.sys.platform', 'linux')
+    @patch('src.libs.checker.wifi.get_default_route_address', return_value='192.168.1.20')
+    @patch('src.libs.checker.wifi.get_bssid_via_ioctl')
+    @patch('src.libs.checker.wifi.get_linux_wireless_interfaces', return_value=['wlan0'])
+    @patch('builtins.open', new_callable=mock_open, read_data='up\n')
+    def test_fingerprint_changes_with_access_point(self, mock_file, mock_interfaces, mock_bssid, mock_address):
+        # Same interface, link state and address - only the access point differs
+        mock_bssid.side_effect = ['aa:bb:cc:dd:ee:ff', '11:22:33:44:55:66']
+        
+        assert get_interface_fingerprint() != get_interface_fingerprint()
+    
+    @patch('src.libs.checker.wifi.subprocess.run')
+    def test_get_ssid_via_iw(self, mock_run):
+        mock_run.return_value = MagicMock(stdout="Connected to aa:bb:cc:dd:ee:ff (on wlan0)\n\tSSID: My Home WiFi\n\tfreq: 5180\n")
+        
+        assert get_ssid_via_iw('wlan0') == 'My Home WiFi'
+        mock_run.assert_called_once_with(['iw', 'dev', 'wlan0', 'link'], capture_output=True, text=True, check=True)
+    
+    @patch('src.libs.checker.wifi.subprocess.run')
+    def test_get_ssid_via_iw_not_connected(self, mock_run):
+        mock_run.return_value = MagicMock(stdout="Not connected.\n")
+        
+        assert get_ssid_via_iw('wlan0') is None
+    
+    @patch('src.libs.checker.wifi.get_ssid_via_iw')
+    @patch('src.libs.checker.wifi.get_ssid_via_ioctl')
+    @patch('src.libs.checker.wifi.get_linux_wireless_interfaces')
+    def test_get_wifi_network_via_linux_prefers_ioctl(self, mock_interfaces, mock_ioctl, mock_iw):
+        mock_interfaces.return_value = ['wlan0']
+        mock_ioctl.return_value = 'GoTitansFC'
+        
+        assert get_wifi_network_via_linux() == 'GoTitansFC'
+        mock_iw.assert_not_called()
+    
+    @patch('src.libs.checker.wifi.get_ssid_via_iw')
+    @patch('src.libs.checker.wifi.get_ssid_via_ioctl')
+    @patch('src.libs.checker.wifi.get_linux_wireless_interfaces')
+    def test_get_wifi_network_via_linux_falls_back_to_iw(self, mock_interfaces, mock_ioctl, mock_iw):
+        mock_interfaces.return_value = ['wlan0']
+        mock_ioctl.return_value = None
+        mock_iw.return_value = 'GoTitansFC'
+        
+        assert get_wifi_network_via_linux() == 'GoTitansFC'
+    
+    @patch('src.libs.checker.wifi.sys.platform', 'linux')
+    @patch('src.libs.checker.wifi.get_wifi_network_via_networksetup')
+    @patch('src.libs.checker.wifi.get_wifi_network_via_linux')
+    def test_get_wifi_network_on_linux_skips_macos_tools(self, mock_linux, mock_networksetup):
+        mock_linux.return_value = None
+        
+        assert get_wifi_network() == "Not connected to WiFi"
+        mock_networksetup.assert_not_called()
+
+
+class TestWifiNetworkCache:
+    """Test cases for WifiNetworkCache class."""
+    
+    def test_cache_reuses_lookup_while_state_unchanged(self):
+        lookup = MagicMock(return_value='HomeNetwork')
+        cache = WifiNetworkCache(ttl=300, lookup=lookup, fingerprint=lambda: 'fp', clock=lambda: 1000.0)
+        
+        assert cache.get() == 'HomeNetwork'
+        assert cache.get() == 'HomeNetwork'
+        lookup.assert_called_once()
+    
+    def test_cache_requeries_when_fingerprint_changes(self):
+        lookup = MagicMock(side_effect=['HomeNetwork', 'Hotspot'])
+        fingerprints = iter(['fp1', 'fp2'])
+        cache = WifiNetworkCache(lookup=lookup, fingerprint=lambda: next(fingerprints), clock=lambda: 1000.0)
+        
+        assert cache.get() == 'HomeNetwork'
+        assert cache.get() == 'Hotspot'
+    
+    def test_cache_requeries_after_ttl(self):
+        lookup = MagicMock(side_effect=['HomeNetwork', 'HomeNetwork'])
+        times = iter([1000.0, 1400.0])
+        cache = WifiNetworkCache(ttl=300, lookup=lookup, fingerprint=lambda: 'fp', clock=lambda: next(times))
+        
+        cache.get()
+        cache.get()
+        
+        assert lookup.call_count == 2
+    
+    def test_cache_persists_between_instances(self, tmp_path):
+        state_file = str(tmp_path / 'wifi_network.json')
+        first = WifiNetworkCache(state_file=state_file, lookup=lambda: 'HomeNetwork',
+                                 fingerprint=lambda: 'fp', clock=lambda: 1000.0)
+        first.get()
+        lookup = MagicMock()
+        
+        second = WifiNetworkCache(state_file=state_file, lookup=lookup,
+                                  fingerprint=lambda: 'fp', clock=lambda: 1060.0)
+        
+        assert second.get() == 'HomeNetwork'
+        lookup.assert_not_called()
+    
+    def test_interface_fingerprint_is_string(self):
+        assert isinstance(get_interface_fingerprint(), str)
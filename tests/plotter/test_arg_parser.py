@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import patch, MagicMock
 import argparse
+import datetime
 import os
 from src.libs.plotter.arg_parser import create_plot_argument_parser, print_configuration
 
@@ -204,4 +205,110 @@ class TestPrintConfiguration:
         
         assert mock_print.call_count == 5
         actual_calls = [call[0] for call in mock_print.call_args_list]
-        assert actual_calls == expected_calls
\ No newline at end of file
+        assert actual_calls == expected_calls
+
+class TestSqliteOption:
+    """Test cases for the --sqlite option."""
+    
+    @patch('src.libs.plotter.arg_parser.get_hostname')
+    def test_sqlite_option(self, mock_hostname):
+        mock_hostname.return_value = 'test-hostname'
+        parser = create_plot_argument_parser()
+        
+        assert parser.parse_args([]).sqlite is None
+        # Bare --sqlite means the default database in the logs directory
+        assert parser.parse_args(['--sqlite']).sqlite == ''
+        assert parser.parse_args(['--sqlite', '/tmp/results.db']).sqlite == '/tmp/results.db'
+
+
+class TestTimeWindowOptions:
+    """Test cases for the --since/--until options."""
+    
+    @patch('src.libs.plotter.arg_parser.get_hostname')
+    def test_since_until(self, mock_hostname):
+        mock_hostname.return_value = 'test-hostname'
+        parser = create_plot_argument_parser()
+        
+        args = parser.parse_args(['--since', '2025-07-10', '--until', '2025-07-11 18:30'])
+        
+        assert args.since == datetime.datetime(2025, 7, 10)
+        assert args.until == datetime.datetime(2025, 7, 11, 18, 30)
+        assert parser.parse_args([]).since is None
+        assert parser.parse_args([]).until is None
+    
+    @patch('src.libs.plotter.arg_parser.get_hostname')
+    def test_invalid_datetime(self, mock_hostname):
+        mock_hostname.return_value = 'test-hostname'
+        
+        with pytest.raises(SystemExit):
+            create_plot_argument_parser().parse_args(['--since', 'yesterday'])
+
+
+class TestJobsOption:
+    """Test cases for the --jobs option."""
+    
+    @patch('src.libs.plotter.arg_parser.get_hostname')
+    def test_jobs(self, mock_hostname):
+        mock_hostname.return_value = 'test-hostname'
+        parser = create_plot_argument_parser()
+        
+        assert parser.parse_args([]).jobs == 1
+        assert parser.parse_args(['--jobs', '4']).jobs == 4
+        for value in ('0', '-2', 'many'):
+            with pytest.raises(SystemExit):
+                parser.parse_args(['--jobs', value])
+
+
+class TestIntervalOption:
+    """Test cases for the --interval option."""
+    
+    @patch('src.libs.plotter.arg_parser.get_hostname')
+    def test_interval_units(self, mock_hostname):
+        mock_hostname.return_value = 'test-hostname'
+        parser = create_plot_argument_parser()
+        
+        assert parser.parse_args(['--interval', '7']).interval == 7
+        assert parser.parse_args(['--interval', '7m']).interval == 7
+        assert parser.parse_args(['--interval', '2h']).interval == 120
+        assert parser.parse_args(['--interval', '1d']).interval == 1440
+        for value in ('0', '-5m', 'h', '1w'):
+            with pytest.raises(SystemExit):
+                parser.parse_args(['--interval', value])
+
+
+class TestBatchOptions:
+    """Test cases for the --batch and --chart options."""
+    
+    @patch('src.libs.plotter.arg_parser.get_hostname')
+    def test_chart_entries(self, mock_hostname):
+        mock_hostname.return_value = 'test-hostname'
+        parser = create_plot_argument_parser()
+        
+        args = parser.parse_args(['--chart', 'wifi-network=Office, interval=1h', '--chart', 'time_range=168'])
+        
+        assert args.chart == [{'wifi_network': 'Office', 'interval': '1h'}, {'time_range': '168'}]
+        assert args.batch is None
+        assert parser.parse_args([]).chart is None
+        with pytest.raises(SystemExit):
+            parser.parse_args(['--chart', 'Office'])
+    
+    @patch('src.libs.plotter.arg_parser.get_hostname')
+    def test_batch_spec_file(self, mock_hostname):
+        mock_hostname.return_value = 'test-hostname'
+        parser = create_plot_argument_parser()
+        
+        assert parser.parse_args(['--batch', 'charts.json']).batch == 'charts.json'
+
+
+class TestStatsOptions:
+    """Test cases for the --stats and --json options."""
+    
+    @patch('src.libs.plotter.arg_parser.get_hostname')
+    def test_stats_flags(self, mock_hostname):
+        mock_hostname.return_value = 'test-hostname'
+        parser = create_plot_argument_parser()
+        
+        args = parser.parse_args([])
+        assert (args.stats, args.json) == (False, False)
+        args = parser.parse_args(['--stats', '--json'])
+        assert (args.stats, args.json) == (True, True)
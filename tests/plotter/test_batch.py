@@ -0,0 +1,218 @@
+import pytest
+import datetime
+import json
+import os
+from unittest.mock import patch
+from src.libs.plotter.batch import ChartSpec, expand_chart_specs, load_batch_spec, run_batch, _get_parse_window
+from src.libs.plotter.columnar import parse_log_columns
+from src.libs.plotter.data_aggregator import aggregate_by_interval
+from src.libs.plotter.log_parser import parse_log_files
+
+
+DEFAULTS = {'hostname': 'test-host', 'wifi_network': 'GoTitansFC', 'time_range': 72, 'interval': 15}
+
+LOG_CONTENT = (
+    "2025-07-10 12:00:00 - WiFi: GoTitansFC - Internet: 3/4 sites accessible\n"
+    "2025-07-10 12:05:00 - WiFi: Office - Internet: 1/4 sites accessible\n"
+    "2025-07-10 12:20:00 - WiFi: GoTitansFC - Internet: 4/4 sites accessible\n"
+    "2025-07-10 13:10:00 - WiFi: Office - Internet: 2/4 sites accessible\n"
+)
+
+
+@pytest.fixture
+def logs_dir(tmp_path):
+    host_dir = tmp_path / 'logs' / 'test-host'
+    host_dir.mkdir(parents=True)
+    (host_dir / 'connectivity_log_20250710.txt').write_text(LOG_CONTENT)
+    return str(tmp_path / 'logs')
+
+
+def fake_render(job):
+    """Stand-in for _render_chart that writes a small file instead of plotting."""
+    aggregated_data, spec, output_file = job
+    with open(output_file, 'wb') as f:
+        f.write(b'\x89PNG' + repr(aggregated_data).encode('utf-8'))
+    return output_file
+
+
+class TestExpandChartSpecs:
+    """Test cases for expand_chart_specs function."""
+
+    def test_single_chart_uses_defaults(self):
+        specs = expand_chart_specs({'wifi_network': 'Office'}, DEFAULTS)
+
+        assert specs == [ChartSpec('test-host', 'Office', 72, 15)]
+
+    def test_lists_fan_out(self):
+        specs = expand_chart_specs({'wifi_network': ['Home', 'Office'], 'interval': ['15m', '1h']}, DEFAULTS)
+
+        assert [(spec.wifi_network, spec.interval) for spec in specs] == [
+            ('Home', 15), ('Home', 60), ('Office', 15), ('Office', 60)
+        ]
+
+    def test_converts_values(self):
+        specs = expand_chart_specs({'time_range': '168', 'interval': '1d', 'since': '2025-07-10 06:00'}, DEFAULTS)
+
+        assert specs[0].time_range == 168
+        assert specs[0].interval == 1440
+        assert specs[0].since == datetime.datetime(2025, 7, 10, 6, 0)
+
+    @pytest.mark.parametrize('entry, message', [
+        ({'network': 'Home'}, 'unknown chart field'),
+        ({'interval': '0m'}, 'invalid interval'),
+        ({'since': 'yesterday'}, 'invalid since'),
+        ({'wifi_network': ['Home', 'Office'], 'output': 'chart.png'}, "'output'"),
+        ({'format': 'svg', 'output': 'chart.png'}, 'is not a svg file'),
+        ('Home', 'not an object')
+    ])
+    def test_invalid_entries(self, entry, message):
+        with pytest.raises(ValueError, match=message):
+            expand_chart_specs(entry, DEFAULTS)
+
+
+class TestLoadBatchSpec:
+    """Test cases for load_batch_spec function."""
+
+    def test_spec_defaults_override_arguments(self, tmp_path):
+        spec_file = tmp_path / 'charts.json'
+        spec_file.write_text(json.dumps({
+            'defaults': {'time_range': 168},
+            'charts': [{'wifi_network': ['Home', 'Office']}, {'interval': '1h'}]
+        }))
+
+        specs = load_batch_spec(str(spec_file), DEFAULTS)
+
+        assert [(spec.wifi_network, spec.time_range, spec.interval) for spec in specs] == [
+            ('Home', 168, 15), ('Office', 168, 15), ('GoTitansFC', 168, 60)
+        ]
+
+    def test_plain_list(self, tmp_path):
+        spec_file = tmp_path / 'charts.json'
+        spec_file.write_text(json.dumps([{'hostname': 'other-host'}]))
+
+        assert load_batch_spec(str(spec_file), DEFAULTS) == [ChartSpec('other-host', 'GoTitansFC', 72, 15)]
+
+
+class TestGetParseWindow:
+    """Test cases for _get_parse_window function."""
+
+    def test_covers_every_chart(self, logs_dir):
+        specs = [
+            ChartSpec('test-host', 'Home', 24, 15, until=datetime.datetime(2025, 7, 5)),
+            ChartSpec('test-host', 'Home', 24, 15, since=datetime.datetime(2025, 7, 6),
+                      until=datetime.datetime(2025, 7, 8))
+        ]
+
+        assert _get_parse_window(logs_dir, specs) == (datetime.datetime(2025, 7, 4), datetime.datetime(2025, 7, 8))
+
+    def test_relative_to_newest_round_of_network(self, logs_dir):
+        specs = [ChartSpec('test-host', 'GoTitansFC', 48, 15), ChartSpec('test-host', 'Office', 24, 15)]
+
+        assert _get_parse_window(logs_dir, specs) == (datetime.datetime(2025, 7, 8, 12, 20), None)
+
+    def test_ignores_newer_files_of_other_networks(self, logs_dir):
+        newer_file = os.path.join(logs_dir, 'test-host', 'connectivity_log_20250713.txt')
+        with open(newer_file, 'w') as f:
+            f.write("2025-07-13 09:00:00 - WiFi: Not connected to WiFi - Internet: 0/4 sites accessible\n")
+
+        specs = [ChartSpec('test-host', 'Office', 24, 15)]
+
+        assert _get_parse_window(logs_dir, specs) == (datetime.datetime(2025, 7, 9, 13, 10), None)
+
+    def test_skips_networks_without_rounds(self, logs_dir):
+        specs = [ChartSpec('test-host', 'Home', 24, 15), ChartSpec('test-host', 'Office', 24, 15)]
+
+        assert _get_parse_window(logs_dir, specs) == (datetime.datetime(2025, 7, 9, 13, 10), None)
+
+    def test_unbounded_without_log_files(self, logs_dir):
+        assert _get_parse_window(logs_dir, [ChartSpec('missing-host', 'Home', 24, 15)]) == (None, None)
+
+
+class TestRunBatch:
+    """Test cases for run_batch function."""
+
+    @patch('builtins.print')
+    @patch('src.libs.plotter.batch._render_chart', side_effect=fake_render)
+    def test_parses_each_host_once(self, mock_render, mock_print, logs_dir, tmp_path):
+        specs = expand_chart_specs({'wifi_network': ['GoTitansFC', 'Office'], 'interval': [15, 60]}, DEFAULTS)
+
+        with patch('src.libs.plotter.batch.parse_log_columns', wraps=parse_log_columns) as mock_parse:
+            saved_files = run_batch(specs, logs_dir, str(tmp_path))
+
+        mock_parse.assert_called_once()
+        assert len(saved_files) == 4
+        assert len(set(saved_files)) == 4
+        assert all(os.path.exists(saved_file) for saved_file in saved_files)
+
+    @patch('builtins.print')
+    @patch('src.libs.plotter.batch._render_chart', side_effect=fake_render)
+    def test_charts_match_single_chart_aggregation(self, mock_render, mock_print, logs_dir, tmp_path):
+        specs = [ChartSpec('test-host', 'Office', 72, 60)]
+
+        run_batch(specs, logs_dir, str(tmp_path))
+
+        columns = parse_log_columns(logs_dir, 'test-host').select_network('Office').select_window(72)
+        aggregated_data, spec, _ = mock_render.call_args[0][0]
+        assert aggregated_data == aggregate_by_interval(columns, 60)
+        assert spec == specs[0]
+
+    @patch('builtins.print')
+    @patch('src.libs.plotter.batch._render_chart', side_effect=fake_render)
+    def test_newer_file_of_other_network_matches_single_chart(self, mock_render, mock_print, logs_dir, tmp_path):
+        newer_file = os.path.join(logs_dir, 'test-host', 'connectivity_log_20250713.txt')
+        with open(newer_file, 'w') as f:
+            f.write("2025-07-13 09:00:00 - WiFi: Not connected to WiFi - Internet: 0/4 sites accessible\n")
+        specs = [ChartSpec('test-host', 'GoTitansFC', 1, 15), ChartSpec('test-host', 'Office', 24, 60)]
+
+        run_batch(specs, logs_dir, str(tmp_path))
+
+        rendered = {job[0][1].wifi_network: job[0][0] for job, _ in mock_render.call_args_list}
+        for spec in specs:
+            data = parse_log_files(logs_dir, 'test-host', spec.wifi_network, spec.time_range)
+            assert rendered[spec.wifi_network] == aggregate_by_interval(data, spec.interval)
+
+    @patch('builtins.print')
+    @patch('src.libs.plotter.batch._render_chart', side_effect=fake_render)
+    def test_html_format_without_extension(self, mock_render, mock_print, logs_dir, tmp_path):
+        specs = [ChartSpec('test-host', 'Office', 72, 60, output=str(tmp_path / 'chart'), format='html')]
+
+        saved_files = run_batch(specs, logs_dir, str(tmp_path))
+
+        mock_render.assert_not_called()
+        with open(saved_files[0], encoding='utf-8') as f:
+            assert f.read().startswith('<!DOCTYPE html>')
+
+    @patch('builtins.print')
+    @patch('src.libs.plotter.batch._render_chart', side_effect=fake_render)
+    def test_reuses_render_cache(self, mock_render, mock_print, logs_dir, tmp_path):
+        specs = [ChartSpec('test-host', 'GoTitansFC', 72, 15, output=str(tmp_path / 'chart.png'))]
+
+        run_batch(specs, logs_dir, str(tmp_path))
+        saved_files = run_batch(specs, logs_dir, str(tmp_path))
+
+        assert mock_render.call_count == 1
+        assert saved_files == [str(tmp_path / 'chart.png')]
+        mock_print.assert_any_call("Saved 1 of 1 charts (0 rendered, 1 from the render cache)")
+
+    @patch('builtins.print')
+    @patch('src.libs.plotter.batch._render_chart', side_effect=fake_render)
+    def test_skips_charts_without_data(self, mock_render, mock_print, logs_dir, tmp_path):
+        specs = [ChartSpec('test-host', 'Nowhere', 72, 15), ChartSpec('test-host', 'Office', 72, 15)]
+
+        saved_files = run_batch(specs, logs_dir, str(tmp_path))
+
+        assert len(saved_files) == 1
+        mock_print.assert_any_call("No data found to plot for test-host (Nowhere)")
+        mock_print.assert_any_call("Saved 1 of 2 charts (1 rendered, 0 from the render cache)")
+
+    @patch('builtins.print')
+    @patch('src.libs.plotter.batch._render_chart', side_effect=fake_render)
+    def test_distinct_names_for_same_range(self, mock_render, mock_print, logs_dir, tmp_path):
+        specs = [
+            ChartSpec('test-host', 'GoTitansFC', 1, 15, until=datetime.datetime(2025, 7, 10, 12, 30)),
+            ChartSpec('test-host', 'GoTitansFC', 1, 15, until=datetime.datetime(2025, 7, 10, 13, 0))
+        ]
+
+        saved_files = run_batch(specs, logs_dir, str(tmp_path))
+
+        assert len(set(saved_files)) == 2
@@ -3,7 +3,24 @@ from unittest.mock import patch, MagicMock, call
 import datetime
 import tempfile
 import os
-from src.libs.plotter.chart_generator import plot_success_rates
+import matplotlib.dates as mdates
+from matplotlib.colors import to_hex
+from src.libs.plotter.chart_generator import plot_success_rates, bar_vertices, get_time_locator, EdgeDateFormatter
+from src.libs.plotter.columnar import ConnectivityColumns, to_epoch_seconds
+
+
+def added_collections(mock_gca):
+    """Get the bar collections plot_success_rates added to the (mocked) axes."""
+    return [call_args[0][0] for call_args in mock_gca.add_collection.call_args_list]
+
+
+def bar_heights(collection):
+    return [path.vertices[1][1] - path.vertices[0][1] for path in collection.get_paths()]
+
+
+def bar_centers(collection):
+    return [mdates.num2date((path.vertices[0][0] + path.vertices[2][0]) / 2).replace(tzinfo=None)
+            for path in collection.get_paths()]
 
 
 class TestPlotSuccessRates:
@@ -36,7 +53,7 @@ class TestPlotSuccessRates:
         
         # Verify matplotlib calls
         mock_plt.figure.assert_called_once_with(figsize=(12, 6))
-        assert mock_plt.bar.call_count == 2  # Two bar calls (failure and success)
+        assert len(added_collections(mock_gca)) == 2  # Two bar collections (failure and success)
         mock_plt.title.assert_called_once()
         mock_plt.xlabel.assert_called_once_with('Time', labelpad=20)
         mock_plt.ylabel.assert_called_once_with('Rate (%)')
@@ -67,8 +84,9 @@ class TestPlotSuccessRates:
         result = plot_success_rates(test_data, 'test-host', 'TestNetwork', 15, output_file)
         
         # Verify file operations
-        mock_plt.savefig.assert_called_once_with(output_file, dpi=300, bbox_inches='tight')
-        mock_plt.close.assert_called_once()
+        mock_figure.savefig.assert_called_once_with(output_file, dpi=300, bbox_inches='tight')
+        mock_plt.savefig.assert_not_called()
+        mock_plt.close.assert_called_once_with(mock_figure)
         mock_plt.show.assert_not_called()
         mock_print.assert_called_once_with(f"Plot saved to: {output_file}")
         
@@ -91,21 +109,20 @@ class TestPlotSuccessRates:
         
         plot_success_rates(test_data, 'test-host', 'TestNetwork', 15)
         
-        # Verify bar chart calls with correct data
-        bar_calls = mock_plt.bar.call_args_list
-        assert len(bar_calls) == 2
+        # Verify bar collections with correct data
+        collections = added_collections(mock_gca)
+        assert len(collections) == 2
         
-        # First call should be for failure rates
-        failure_call = bar_calls[0]
-        failure_rates = failure_call[0][1]  # Second argument (y values)
+        # First collection should be for failure rates
         expected_failure_rates = [0.0, 25.0, 100.0]  # 100-success_rate*100
-        assert failure_rates == expected_failure_rates
+        assert bar_heights(collections[0]) == expected_failure_rates
+        assert [path.vertices[0][1] for path in collections[0].get_paths()] == [0.0, 0.0, 0.0]
         
-        # Second call should be for success rates
-        success_call = bar_calls[1]
-        success_rates = success_call[0][1]  # Second argument (y values)
+        # Second collection should be for success rates, stacked on the failure bars
         expected_success_rates = [100.0, 75.0, 0.0]  # success_rate*100
-        assert success_rates == expected_success_rates
+        assert bar_heights(collections[1]) == expected_success_rates
+        assert [path.vertices[0][1] for path in collections[1].get_paths()] == expected_failure_rates
+        assert bar_centers(collections[1]) == [item[0] for item in test_data]
     
     @patch('src.libs.plotter.chart_generator.plt')
     def test_plot_success_rates_title_formatting(self, mock_plt):
@@ -146,12 +163,11 @@ class TestPlotSuccessRates:
         plot_success_rates(test_data, 'test-host', 'TestNetwork', interval_minutes)
         
         # Verify bar width calculation
-        bar_calls = mock_plt.bar.call_args_list
-        first_bar_call = bar_calls[0]
-        bar_width = first_bar_call[1]['width']  # width keyword argument
+        vertices = added_collections(mock_gca)[0].get_paths()[0].vertices
+        bar_width = vertices[2][0] - vertices[0][0]  # in days, as date2num
         
         expected_width = datetime.timedelta(minutes=interval_minutes * 0.8)
-        assert bar_width == expected_width
+        assert bar_width == pytest.approx(expected_width / datetime.timedelta(days=1))
     
     @patch('src.libs.plotter.chart_generator.plt')
     def test_plot_success_rates_color_scheme(self, mock_plt):
@@ -168,17 +184,16 @@ class TestPlotSuccessRates:
         plot_success_rates(test_data, 'test-host', 'TestNetwork', 15)
         
         # Verify color scheme
-        bar_calls = mock_plt.bar.call_args_list
+        failure_bars, success_bars = added_collections(mock_gca)
         
-        # Failure bars (first call)
-        failure_call = bar_calls[0]
-        assert failure_call[1]['color'] == '#FF6B35'  # Orange-red
-        assert failure_call[1]['label'] == 'Connection Failed'
+        # Failure bars (first collection)
+        assert to_hex(failure_bars.get_facecolor()[0], keep_alpha=False) == '#ff6b35'  # Orange-red
+        assert failure_bars.get_alpha() == 0.8
+        assert failure_bars.get_label() == 'Connection Failed'
         
-        # Success bars (second call)
-        success_call = bar_calls[1]
-        assert success_call[1]['color'] == '#66D9A6'  # Light green
-        assert success_call[1]['label'] == 'Connection Success'
+        # Success bars (second collection)
+        assert to_hex(success_bars.get_facecolor()[0], keep_alpha=False) == '#66d9a6'  # Light green
+        assert success_bars.get_label() == 'Connection Success'
     
     @patch('src.libs.plotter.chart_generator.plt')
     def test_plot_success_rates_axis_formatting(self, mock_plt):
@@ -218,7 +233,7 @@ class TestPlotSuccessRates:
         
         # Should still work with single data point
         mock_plt.figure.assert_called_once()
-        assert mock_plt.bar.call_count == 2
+        assert len(added_collections(mock_gca)) == 2
         assert result is None
     
     @patch('src.libs.plotter.chart_generator.plt')
@@ -239,7 +254,7 @@ class TestPlotSuccessRates:
         
         # Should handle edge cases without error
         mock_plt.figure.assert_called_once()
-        assert mock_plt.bar.call_count == 2
+        assert len(added_collections(mock_gca)) == 2
     
     def test_plot_success_rates_with_real_file(self):
         """Test with actual file creation (integration test)."""
@@ -261,4 +276,59 @@ class TestPlotSuccessRates:
         finally:
             # Clean up
             if os.path.exists(output_file):
-                os.unlink(output_file)
\ No newline at end of file
+                os.unlink(output_file)
+
+class TestPlotColumns:
+    """Test cases for plotting ConnectivityColumns directly."""
+    
+    @patch('src.libs.plotter.chart_generator.plt')
+    @patch('builtins.print')
+    def test_plot_success_rates_aggregates_columns(self, mock_print, mock_plt):
+        mock_gca = mock_plt.gca.return_value
+        columns = ConnectivityColumns([to_epoch_seconds(datetime.datetime(2025, 7, 10, 12, 5)),
+                                       to_epoch_seconds(datetime.datetime(2025, 7, 10, 12, 40))],
+                                      [4, 2], [4, 4], [0, 0], ['TestNetwork'])
+        
+        plot_success_rates(columns, 'test-host', 'TestNetwork', 15, output_file='/tmp/plot.png')
+        
+        mock_print.assert_any_call("Aggregated into 3 15-minute intervals")
+        # Measured bars (failure + success) plus the missing 12:30 interval
+        collections = added_collections(mock_gca)
+        assert len(collections) == 3
+        assert bar_centers(collections[1]) == [datetime.datetime(2025, 7, 10, 12, 15), datetime.datetime(2025, 7, 10, 12, 45)]
+        assert bar_heights(collections[1]) == [100.0, 50.0]
+        assert bar_centers(collections[2]) == [datetime.datetime(2025, 7, 10, 12, 30)]
+        assert collections[2].get_linestyle() != collections[1].get_linestyle()
+    
+    @patch('builtins.print')
+    def test_plot_success_rates_empty_columns(self, mock_print):
+        assert plot_success_rates(ConnectivityColumns.empty(), 'test-host', 'TestNetwork') is None
+        mock_print.assert_called_once_with("No data to plot")
+
+
+class TestChartHelpers:
+    """Test cases for the x-axis and bar helpers."""
+    
+    def test_bar_vertices(self):
+        vertices = bar_vertices([datetime.datetime(2025, 7, 10, 12, 0)], [75.0], datetime.timedelta(hours=12), bottoms=[25.0])
+        
+        center = mdates.date2num(datetime.datetime(2025, 7, 10, 12, 0))
+        assert vertices.shape == (1, 4, 2)
+        assert vertices[0].tolist() == [[center - 0.25, 25.0], [center - 0.25, 100.0], [center + 0.25, 100.0], [center + 0.25, 25.0]]
+    
+    def test_time_locator_keeps_three_hour_ticks_for_short_ranges(self):
+        start = datetime.datetime(2025, 7, 10)
+        
+        locator = get_time_locator(start, start + datetime.timedelta(hours=72))
+        ticks = locator.tick_values(start, start + datetime.timedelta(hours=12))
+        assert [mdates.num2date(tick).hour for tick in ticks] == [0, 3, 6, 9, 12]
+        
+        assert isinstance(get_time_locator(start, start + datetime.timedelta(days=30)), mdates.DayLocator)
+    
+    def test_edge_date_formatter(self):
+        ticks = [mdates.date2num(datetime.datetime(2025, 7, 10, hour)) for hour in (18, 21)]
+        ticks += [mdates.date2num(datetime.datetime(2025, 7, 11, hour)) for hour in (0, 3, 6)]
+        
+        labels = EdgeDateFormatter().format_ticks(ticks)
+        
+        assert labels == ['07/10 18:00', '21:00', '07/11 00:00', '03:00', '07/11 06:00']
@@ -0,0 +1,163 @@
+import pytest
+import datetime
+import numpy as np
+from unittest.mock import patch
+from src.libs.plotter.columnar import (
+    ConnectivityColumns, aggregate_columns, parse_log_columns, to_epoch_seconds, from_epoch_seconds
+)
+from src.libs.plotter.data_aggregator import aggregate_by_interval
+from src.libs.plotter.log_parser import _map_log_file, get_window_start, parse_log_files
+
+
+LOG_CONTENT = (
+    "2025-07-10 12:00:00 - WiFi: GoTitansFC - Internet: 3/4 sites accessible\n"
+    "  (0.24s) - https://github.com: SUCCESS\n"
+    "Hostname: test-host\n"
+    "\n"
+    "2025-07-10 12:07:00 - WiFi: Other Network - Internet: 1/4 sites accessible\n"
+    "2025-07-10 11:50:00 - WiFi: GoTitansFC - Internet: 4/4 sites accessible\n"
+    "2025-07-10 12:50:00 - WiFi: GoTitansFC - Internet: 0/0 sites accessible\n"
+)
+
+
+@pytest.fixture
+def logs_dir(tmp_path):
+    host_dir = tmp_path / 'test-host'
+    host_dir.mkdir()
+    (host_dir / 'connectivity_log_20250710.txt').write_text(LOG_CONTENT)
+    (host_dir / 'connectivity_log_20250709.txt').write_text(
+        "2025-07-09 08:00:00 - WiFi: GoTitansFC - Internet: 2/4 sites accessible\n"
+    )
+    return str(tmp_path)
+
+
+def make_columns(points, network='GoTitansFC'):
+    return ConnectivityColumns([to_epoch_seconds(ts) for ts, _, _ in points], [s for _, s, _ in points],
+                               [t for _, _, t in points], [0] * len(points), [network])
+
+
+class TestEpochSeconds:
+    """Test cases for epoch second conversion."""
+    
+    def test_round_trip(self):
+        timestamp = datetime.datetime(2025, 7, 10, 12, 34, 56)
+        
+        assert to_epoch_seconds(datetime.datetime(1970, 1, 2)) == 86400
+        assert from_epoch_seconds(to_epoch_seconds(timestamp)) == timestamp
+
+
+class TestParseLogColumns:
+    """Test cases for parse_log_columns function."""
+    
+    @patch('builtins.print')
+    def test_columns_and_network_dictionary(self, mock_print, logs_dir):
+        columns = parse_log_columns(logs_dir, 'test-host')
+        
+        assert columns.timestamps.dtype == np.int64
+        assert columns.success_counts.dtype == np.uint16
+        assert columns.networks == ['GoTitansFC', 'Other Network']
+        # Sorted by timestamp across files
+        assert [from_epoch_seconds(s).strftime('%d %H:%M') for s in columns.timestamps] == [
+            '09 08:00', '10 11:50', '10 12:00', '10 12:07', '10 12:50'
+        ]
+        assert list(columns.network_codes) == [0, 0, 0, 1, 0]
+        assert columns.nbytes == 5 * 14
+    
+    @patch('builtins.print')
+    def test_matches_parse_log_files(self, mock_print, logs_dir):
+        columns = parse_log_columns(logs_dir, 'test-host').select_network('GoTitansFC').select_window(24)
+        
+        assert columns.to_records() == parse_log_files(logs_dir, 'test-host', time_range_hours=24)
+    
+    @patch('builtins.print')
+    def test_since_until(self, mock_print, logs_dir):
+        columns = parse_log_columns(logs_dir, 'test-host', since=datetime.datetime(2025, 7, 10, 11, 55),
+                                    until=datetime.datetime(2025, 7, 10, 12, 10))
+        
+        assert len(columns) == 2
+        assert len(columns.select_network('Other Network')) == 1
+        assert len(columns.select_network('Unknown')) == 0
+    
+    @patch('builtins.print')
+    def test_missing_host(self, mock_print, tmp_path):
+        assert len(parse_log_columns(str(tmp_path), 'missing-host')) == 0
+    
+    @patch('builtins.print')
+    def test_out_of_range_counts_keep_columns_aligned(self, mock_print, logs_dir):
+        with open(f'{logs_dir}/test-host/connectivity_log_20250710.txt', 'a') as f:
+            f.write("2025-07-10 13:00:00 - WiFi: New Network - Internet: 70000/70000 sites accessible\n"
+                    "2025-07-10 13:01:00 - WiFi: GoTitansFC - Internet: 1/4 sites accessible\n")
+        
+        columns = parse_log_columns(logs_dir, 'test-host')
+        
+        assert len(columns) == len(columns.success_counts) == len(columns.total_counts) == len(columns.network_codes) == 6
+        assert columns.networks == ['GoTitansFC', 'Other Network']
+    
+    @patch('builtins.print')
+    def test_window_start_prunes_older_files(self, mock_print, logs_dir):
+        since = get_window_start(logs_dir, 'test-host', 'GoTitansFC', time_range_hours=2)
+        
+        with patch('src.libs.plotter.columnar._map_log_file', wraps=_map_log_file) as mock_map:
+            columns = parse_log_columns(logs_dir, 'test-host', since).select_network('GoTitansFC').select_window(2)
+        
+        assert [call[0][0][-12:] for call in mock_map.call_args_list] == ['20250710.txt']
+        assert columns.to_records() == parse_log_files(logs_dir, 'test-host', time_range_hours=2)
+
+
+class TestConnectivityColumns:
+    """Test cases for ConnectivityColumns class."""
+    
+    def test_success_rates_handles_zero_totals(self):
+        columns = make_columns([(datetime.datetime(2025, 7, 10, 12), 3, 4), (datetime.datetime(2025, 7, 10, 13), 0, 0)])
+        
+        assert list(columns.success_rates) == [0.75, 0.0]
+    
+    def test_select_window(self):
+        columns = make_columns([(datetime.datetime(2025, 7, 10, hour), 1, 1) for hour in range(10)])
+        
+        assert len(columns.select_window(3)) == 4
+        assert len(columns.select_window(3, until=datetime.datetime(2025, 7, 10, 5))) == 4
+        assert len(columns.select_window(3, since=datetime.datetime(2025, 7, 10, 8))) == 2
+    
+    def test_concatenate_merges_network_dictionaries(self):
+        first = make_columns([(datetime.datetime(2025, 7, 10, 12), 1, 1)], network='A')
+        second = make_columns([(datetime.datetime(2025, 7, 10, 13), 1, 2)], network='B')
+        third = make_columns([(datetime.datetime(2025, 7, 10, 14), 0, 1)], network='A')
+        
+        merged = ConnectivityColumns.concatenate([first, second, third])
+        
+        assert merged.networks == ['A', 'B']
+        assert list(merged.network_codes) == [0, 1, 0]
+        assert len(merged.select_network('A')) == 2
+        assert len(ConnectivityColumns.concatenate([])) == 0
+
+
+class TestAggregateColumns:
+    """Test cases for vectorized aggregation of ConnectivityColumns."""
+    
+    @pytest.mark.parametrize('interval_minutes', [5, 15, 45, 60])
+    def test_matches_list_aggregation(self, interval_minutes):
+        points = [(datetime.datetime(2025, 7, 10, 9, 0) + datetime.timedelta(minutes=7 * i), i % 5, 4)
+                  for i in range(60) if i % 11 != 3]
+        columns = make_columns(points)
+        
+        with patch('builtins.print'):
+            expected = aggregate_by_interval(columns.to_records(), interval_minutes)
+        
+        assert aggregate_columns(columns, interval_minutes) == expected
+    
+    @patch('builtins.print')
+    def test_aggregate_by_interval_accepts_columns(self, mock_print):
+        columns = make_columns([(datetime.datetime(2025, 7, 10, 12, 5), 3, 4), (datetime.datetime(2025, 7, 10, 12, 40), 1, 4)])
+        
+        result = aggregate_by_interval(columns, 15)
+        
+        assert result == [
+            (datetime.datetime(2025, 7, 10, 12, 15), 0.75, "measured"),
+            (datetime.datetime(2025, 7, 10, 12, 30), 0.0, "missing"),
+            (datetime.datetime(2025, 7, 10, 12, 45), 0.25, "measured")
+        ]
+        mock_print.assert_called_once_with("Aggregated into 3 15-minute intervals")
+    
+    def test_empty(self):
+        assert aggregate_columns(ConnectivityColumns.empty(), 15) == []
@@ -1,7 +1,8 @@
 import pytest
 from unittest.mock import patch
 import datetime
-from src.libs.plotter.data_aggregator import aggregate_by_interval
+from src.libs.plotter.data_aggregator import aggregate_by_interval, aggregate_latency_by_interval
+from src.libs.plotter.log_parser import SiteRecord
 
 
 class TestAggregateByInterval:
@@ -206,4 +207,102 @@ class TestAggregateByInterval:
         expected_avg_first = (0.8 + 0.6) / 2
         assert result[0] == (datetime.datetime(2025, 7, 10, 12, 6), expected_avg_first, "measured")
         assert result[1] == (datetime.datetime(2025, 7, 10, 12, 7), 1.0, "measured")
-        mock_print.assert_called_once_with("Aggregated into 2 1-minute intervals")
\ No newline at end of file
+        mock_print.assert_called_once_with("Aggregated into 2 1-minute intervals")
+
+class TestAggregateStream:
+    """Test cases for aggregating a stream of data points."""
+    
+    @patch('builtins.print')
+    def test_aggregate_generator(self, mock_print):
+        data = [
+            (datetime.datetime(2025, 7, 10, 12, 5), 0.8),
+            (datetime.datetime(2025, 7, 10, 12, 40), 0.5),
+            (datetime.datetime(2025, 7, 10, 12, 10), 0.6)
+        ]
+        
+        result = aggregate_by_interval((point for point in data), 15)
+        
+        assert result == aggregate_by_interval(data, 15)
+        assert result[0] == (datetime.datetime(2025, 7, 10, 12, 15), 0.7, "measured")
+    
+    @patch('builtins.print')
+    def test_aggregate_empty_generator(self, mock_print):
+        assert aggregate_by_interval(iter(()), 15) == []
+        mock_print.assert_not_called()
+
+
+class TestEpochAlignedIntervals:
+    """Test cases for intervals that don't divide an hour."""
+    
+    @patch('builtins.print')
+    def test_seven_minute_intervals_continue_across_hours(self, mock_print):
+        # Epoch-aligned 7-minute intervals on 2025-07-10 end at 12:01, 12:08, ..., 12:57, 13:04
+        data = [
+            (datetime.datetime(2025, 7, 10, 12, 55), 1.0),
+            (datetime.datetime(2025, 7, 10, 13, 1), 0.5),
+            (datetime.datetime(2025, 7, 10, 13, 15), 0.0)
+        ]
+        
+        result = aggregate_by_interval(data, 7)
+        
+        assert result == [
+            (datetime.datetime(2025, 7, 10, 12, 57), 1.0, "measured"),
+            (datetime.datetime(2025, 7, 10, 13, 4), 0.5, "measured"),
+            (datetime.datetime(2025, 7, 10, 13, 11), 0.0, "missing"),
+            (datetime.datetime(2025, 7, 10, 13, 18), 0.0, "measured")
+        ]
+        mock_print.assert_called_once_with("Aggregated into 4 7-minute intervals")
+    
+    @patch('builtins.print')
+    def test_two_hour_and_one_day_intervals(self, mock_print):
+        data = [
+            (datetime.datetime(2025, 7, 10, 9, 30), 1.0),
+            (datetime.datetime(2025, 7, 10, 10, 45), 0.5),
+            (datetime.datetime(2025, 7, 12, 23, 59), 0.0)
+        ]
+        
+        two_hours = aggregate_by_interval(data, 120)
+        assert two_hours[0] == (datetime.datetime(2025, 7, 10, 10, 0), 1.0, "measured")
+        assert two_hours[1] == (datetime.datetime(2025, 7, 10, 12, 0), 0.5, "measured")
+        assert two_hours[-1] == (datetime.datetime(2025, 7, 13, 0, 0), 0.0, "measured")
+        assert len(two_hours) == 32
+        
+        assert aggregate_by_interval(data, 1440) == [
+            (datetime.datetime(2025, 7, 11, 0, 0), 0.75, "measured"),
+            (datetime.datetime(2025, 7, 12, 0, 0), 0.0, "missing"),
+            (datetime.datetime(2025, 7, 13, 0, 0), 0.0, "measured")
+        ]
+    
+    @pytest.mark.parametrize('interval_minutes', [1, 7, 15, 45, 120, 1440])
+    @patch('builtins.print')
+    def test_stream_matches_vectorized(self, mock_print, interval_minutes):
+        data = [(datetime.datetime(2025, 7, 10, 9, 0, 30) + datetime.timedelta(minutes=13 * i), (i % 7) / 6)
+                for i in range(500) if i % 17 != 5]
+        
+        assert aggregate_by_interval(iter(data), interval_minutes) == aggregate_by_interval(data, interval_minutes)
+
+
+class TestAggregateLatencyByInterval:
+    """Test cases for aggregate_latency_by_interval function."""
+    
+    def test_percentiles_per_site_and_interval(self):
+        start = datetime.datetime(2025, 7, 10, 12, 0)
+        records = [SiteRecord(start + datetime.timedelta(minutes=minute), 'https://google.com', 0.1 + minute / 100, 'success', None, {})
+                   for minute in range(15)]
+        records.append(SiteRecord(start, 'https://google.com', 5.0, 'timeout', 'timed out', {}))
+        records.append(SiteRecord(start + datetime.timedelta(minutes=20), 'https://github.com', 0.5, 'redirect', None, {}))
+        records.append(SiteRecord(start + datetime.timedelta(minutes=25), 'https://github.com', 0.5, 'non_200', None, {}))
+        
+        latencies = aggregate_latency_by_interval(records, 15, percentiles=(50, 99))
+        
+        [(end, percentiles, checks)] = latencies['https://google.com']
+        assert end == datetime.datetime(2025, 7, 10, 12, 15)
+        assert checks == 15
+        assert percentiles[50] == pytest.approx(0.17, rel=0.01)
+        assert percentiles[99] == pytest.approx(0.23, rel=0.01)
+        assert latencies['https://github.com'] == [(datetime.datetime(2025, 7, 10, 12, 30), {50: pytest.approx(0.5, rel=0.01), 99: pytest.approx(0.5, rel=0.01)}, 2)]
+    
+    def test_no_successful_checks(self):
+        records = [SiteRecord(datetime.datetime(2025, 7, 10, 12), 'https://google.com', 5.0, 'timeout', 'timed out', {})]
+        
+        assert aggregate_latency_by_interval(records) == {}
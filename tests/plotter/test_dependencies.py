@@ -1,9 +1,23 @@
 import pytest
 from unittest.mock import patch, MagicMock
+import os
+import subprocess
 import sys
 from src.libs.plotter.dependencies import check_required_dependencies, exit_if_dependencies_missing
 
 
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'src')
+
+# Importing the plotting script (everything before rendering) must stay well under matplotlib's import time
+IMPORT_BUDGET_SECONDS = 0.5
+
+
+def run_python(code):
+    """Run code in a fresh interpreter from the src directory; returns its stdout."""
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True, cwd=SRC_DIR)
+    return result.stdout.strip()
+
+
 class TestCheckRequiredDependencies:
     """Test cases for check_required_dependencies function."""
     
@@ -22,6 +36,51 @@ class TestCheckRequiredDependencies:
         
         # This should be True since matplotlib should be available in the test environment
         assert result is True
+    
+    @patch('builtins.print')
+    @patch('src.libs.plotter.dependencies.importlib.util.find_spec')
+    def test_check_required_dependencies_missing(self, mock_find_spec, mock_print):
+        mock_find_spec.side_effect = lambda name: None if name == 'matplotlib' else MagicMock()
+        
+        assert check_required_dependencies() is False
+        mock_print.assert_any_call("Error: Required packages not installed. Please install: matplotlib")
+        mock_print.assert_any_call("Try: pip install matplotlib")
+
+    @patch('builtins.print')
+    @patch('src.libs.plotter.dependencies.importlib.util.find_spec')
+    def test_check_only_given_packages(self, mock_find_spec, mock_print):
+        mock_find_spec.side_effect = lambda name: None if name == 'matplotlib' else MagicMock()
+
+        # Batch mode of SVG charts only needs NumPy
+        assert check_required_dependencies(('numpy',)) is True
+        mock_find_spec.side_effect = lambda name: None
+        assert check_required_dependencies(('numpy',)) is False
+        mock_print.assert_any_call("Error: Required packages not installed. Please install: numpy")
+
+    def test_check_does_not_import_matplotlib(self):
+        output = run_python("import sys; from libs.plotter.dependencies import check_required_dependencies; "
+                            "print(check_required_dependencies(), 'matplotlib' in sys.modules)")
+        
+        assert output == 'True False'
+
+
+class TestDeferredImports:
+    """Test cases for the import cost of the plotting script."""
+    
+    def test_script_import_skips_heavy_packages(self):
+        output = run_python("import sys, time; start = time.perf_counter(); import plot_outage_graph; "
+                            "print(time.perf_counter() - start); "
+                            "print(' '.join(m for m in ('matplotlib', 'numpy', 'multiprocessing') if m in sys.modules))")
+        seconds, _, heavy_modules = output.partition('\n')
+        
+        assert heavy_modules == ''
+        assert float(seconds) < IMPORT_BUDGET_SECONDS
+    
+    def test_use_headless_backend(self):
+        output = run_python("from libs.plotter.dependencies import use_headless_backend; use_headless_backend(); "
+                            "import matplotlib.pyplot as plt; print(plt.get_backend().lower())")
+        
+        assert output == 'agg'
 
 
 class TestExitIfDependenciesMissing:
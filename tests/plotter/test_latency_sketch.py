@@ -0,0 +1,49 @@
+import pytest
+import random
+from src.libs.plotter.latency_sketch import LatencyHistogram, RELATIVE_ACCURACY, bucket_index, bucket_value
+
+
+def exact_quantile(values, q):
+    values = sorted(values)
+    return values[int(q * (len(values) - 1))]
+
+
+class TestBuckets:
+    """Test cases for bucket_index and bucket_value functions."""
+    
+    @pytest.mark.parametrize('seconds', [0.001, 0.01, 0.24, 1.0, 3.7, 30.0])
+    def test_bucket_value_within_relative_accuracy(self, seconds):
+        assert bucket_value(bucket_index(seconds)) == pytest.approx(seconds, rel=RELATIVE_ACCURACY)
+    
+    def test_zero_is_counted_as_minimum_duration(self):
+        assert bucket_index(0.0) == bucket_index(0.0001)
+
+
+class TestLatencyHistogram:
+    """Test cases for LatencyHistogram class."""
+    
+    def test_percentiles_within_relative_accuracy(self):
+        rng = random.Random(7)
+        durations = [rng.lognormvariate(-1.5, 0.8) for _ in range(5000)]
+        
+        histogram = LatencyHistogram.from_durations(durations)
+        
+        assert histogram.count == 5000
+        for percentile, seconds in histogram.percentiles().items():
+            assert seconds == pytest.approx(exact_quantile(durations, percentile / 100), rel=RELATIVE_ACCURACY)
+    
+    def test_merge_equals_histogram_of_all_durations(self):
+        first = [0.1, 0.2, 0.25, 3.0]
+        second = [0.12, 0.9, 5.0]
+        
+        merged = LatencyHistogram.from_durations(first).merge(LatencyHistogram.from_durations(second))
+        
+        assert merged == LatencyHistogram.from_durations(first + second)
+        assert merged.percentiles((50,)) == {50: pytest.approx(0.25, rel=RELATIVE_ACCURACY)}
+    
+    def test_empty(self):
+        histogram = LatencyHistogram()
+        
+        assert histogram.count == 0
+        assert histogram.quantile(0.5) is None
+        assert histogram.percentiles() == {}
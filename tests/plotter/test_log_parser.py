@@ -1,9 +1,16 @@
 import pytest
 from unittest.mock import patch, mock_open, MagicMock
 import datetime
+from array import array
 import tempfile
 import os
-from src.libs.plotter.log_parser import parse_log_files
+from src.libs.plotter.log_parser import (
+    parse_log_files, parse_phase_log_files, parse_phase_timings, get_log_file_date, log_file_may_overlap,
+    SUMMARY_PATTERN, scan_summary_buffer, _parse_summary_file, parse_file_chunk, COLUMN_EPOCH,
+    iter_log_records, find_latest_timestamp, get_window_start, stream_log_files,
+    SiteRecord, classify_status, scan_entries_buffer, parse_log_entries
+)
+from src.libs.plotter.parse_cache import LogParseCache, get_parse_cache_path
 
 
 class TestParseLogFiles:
@@ -292,4 +299,435 @@ Yet another invalid format"""
             result = parse_log_files('/logs', 'test-host')
         
         assert len(result) == 1
-        assert result[0] == (datetime.datetime(2025, 7, 10, 12, 0, 0), 0.999)
\ No newline at end of file
+        assert result[0] == (datetime.datetime(2025, 7, 10, 12, 0, 0), 0.999)
+
+class TestParsePhaseTimings:
+    """Test cases for per-phase timing parsing."""
+    
+    def test_parse_phase_timings(self):
+        assert parse_phase_timings('dns=0.012 connect=0.020 tls=0.045 ttfb=0.110') == {
+            'dns': 0.012, 'connect': 0.02, 'tls': 0.045, 'ttfb': 0.11
+        }
+    
+    def test_parse_phase_timings_empty(self):
+        assert parse_phase_timings(None) == {}
+        assert parse_phase_timings('') == {}
+    
+    @patch('builtins.print')
+    def test_parse_phase_log_files(self, mock_print, tmp_path):
+        host_dir = tmp_path / 'test-host'
+        host_dir.mkdir()
+        (host_dir / 'connectivity_log_20250710.txt').write_text(
+            "2025-07-10 12:00:00 - WiFi: GoTitansFC - Internet: 1/2 sites accessible\n"
+            "  (0.24s) - https://github.com: SUCCESS [dns=0.010 connect=0.020 tls=0.050 ttfb=0.150]\n"
+            "  (5.00s) - https://google.com: FAILED: <urlopen error [Errno 8] nodename nor servname provided, or not known> [dns=5.000]\n"
+            "Hostname: test-host\n\n"
+            "2025-07-10 12:01:00 - WiFi: OtherNetwork - Internet: 1/1 sites accessible\n"
+            "  (0.20s) - https://github.com: SUCCESS [dns=0.011 connect=0.021 tls=0.051 ttfb=0.151]\n"
+            "Hostname: test-host\n\n"
+            "2025-07-10 12:02:00 - WiFi: GoTitansFC - Internet: 1/1 sites accessible\n"
+            "  (0.30s) - https://github.com: SUCCESS\n"
+            "Hostname: test-host\n\n"
+        )
+        
+        result = parse_phase_log_files(str(tmp_path), 'test-host')
+        
+        assert result == [
+            (datetime.datetime(2025, 7, 10, 12, 0), 'https://github.com',
+             {'dns': 0.01, 'connect': 0.02, 'tls': 0.05, 'ttfb': 0.15}),
+            (datetime.datetime(2025, 7, 10, 12, 0), 'https://google.com', {'dns': 5.0})
+        ]
+        mock_print.assert_any_call("Found 2 phase timings for WiFi network 'GoTitansFC'")
+
+
+def write_log(logs_dir, date, lines):
+    host_dir = logs_dir / 'test-host'
+    host_dir.mkdir(exist_ok=True)
+    path = host_dir / f'connectivity_log_{date}.txt'
+    path.write_text(''.join(f"{line} - WiFi: GoTitansFC - Internet: 1/2 sites accessible\n" for line in lines))
+    return str(path)
+
+
+class TestLogFilePruning:
+    """Test cases for skipping log files outside the time window by file name."""
+    
+    def test_get_log_file_date(self):
+        assert get_log_file_date('/logs/h/connectivity_log_20250710.txt') == datetime.datetime(2025, 7, 10)
+        assert get_log_file_date('/logs/h/connectivity_log_latest.txt') is None
+        assert get_log_file_date('/logs/h/connectivity_log_20251399.txt') is None
+    
+    def test_log_file_may_overlap(self):
+        log_file = '/logs/h/connectivity_log_20250710.txt'
+        
+        assert log_file_may_overlap(log_file, None, None) is True
+        assert log_file_may_overlap(log_file, datetime.datetime(2025, 7, 10, 23, 0), None) is True
+        assert log_file_may_overlap(log_file, datetime.datetime(2025, 7, 11, 0, 0), None) is False
+        # A round started just before midnight lands in the next day's file
+        assert log_file_may_overlap(log_file, None, datetime.datetime(2025, 7, 9, 23, 58)) is True
+        assert log_file_may_overlap(log_file, None, datetime.datetime(2025, 7, 9, 12, 0)) is False
+        assert log_file_may_overlap('/logs/h/connectivity_log_latest.txt', datetime.datetime(2030, 1, 1), None) is True
+    
+    @patch('builtins.print')
+    def test_relative_range_skips_old_files(self, mock_print, tmp_path):
+        old_file = write_log(tmp_path, '20250701', ['2025-07-01 12:00:00'])
+        write_log(tmp_path, '20250709', ['2025-07-09 12:00:00'])
+        write_log(tmp_path, '20250710', ['2025-07-10 11:00:00', '2025-07-10 12:00:00'])
+        
+        real_open = open
+        opened = []
+        def tracking_open(path, *args, **kwargs):
+            opened.append(path)
+            return real_open(path, *args, **kwargs)
+        
+        with patch('builtins.open', side_effect=tracking_open):
+            result = parse_log_files(str(tmp_path), 'test-host', time_range_hours=24)
+        
+        assert result == [
+            (datetime.datetime(2025, 7, 9, 12, 0), 0.5),
+            (datetime.datetime(2025, 7, 10, 11, 0), 0.5),
+            (datetime.datetime(2025, 7, 10, 12, 0), 0.5)
+        ]
+        assert old_file not in opened
+        mock_print.assert_any_call("Skipped 1 log files outside the time range")
+    
+    @patch('builtins.print')
+    def test_since_and_until_bounds(self, mock_print, tmp_path):
+        write_log(tmp_path, '20250701', ['2025-07-01 12:00:00'])
+        write_log(tmp_path, '20250709', ['2025-07-09 06:00:00', '2025-07-09 18:00:00'])
+        write_log(tmp_path, '20250710', ['2025-07-09 23:59:30', '2025-07-10 12:00:00'])
+        write_log(tmp_path, '20250712', ['2025-07-12 12:00:00'])
+        
+        result = parse_log_files(str(tmp_path), 'test-host',
+                                 since=datetime.datetime(2025, 7, 9, 12, 0),
+                                 until=datetime.datetime(2025, 7, 10, 0, 0))
+        
+        assert [ts for ts, _ in result] == [datetime.datetime(2025, 7, 9, 18, 0), datetime.datetime(2025, 7, 9, 23, 59, 30)]
+        mock_print.assert_any_call("Parsing 2 log files...")
+        mock_print.assert_any_call("Skipped 2 log files outside the time range")
+    
+    @patch('builtins.print')
+    def test_until_uses_time_range_before_it(self, mock_print, tmp_path):
+        write_log(tmp_path, '20250708', ['2025-07-08 12:00:00'])
+        write_log(tmp_path, '20250709', ['2025-07-09 12:00:00'])
+        write_log(tmp_path, '20250710', ['2025-07-10 12:00:00'])
+        
+        result = parse_log_files(str(tmp_path), 'test-host', time_range_hours=12,
+                                 until=datetime.datetime(2025, 7, 9, 20, 0))
+        
+        assert [ts for ts, _ in result] == [datetime.datetime(2025, 7, 9, 12, 0)]
+    
+    @patch('builtins.print')
+    def test_since_only(self, mock_print, tmp_path):
+        write_log(tmp_path, '20250708', ['2025-07-08 12:00:00'])
+        write_log(tmp_path, '20250710', ['2025-07-10 12:00:00'])
+        
+        result = parse_log_files(str(tmp_path), 'test-host', time_range_hours=1,
+                                 since=datetime.datetime(2025, 7, 8, 0, 0))
+        
+        # An explicit since overrides the relative time range
+        assert len(result) == 2
+
+
+class TestMemoryMappedFastPath:
+    """Test cases for the memory-mapped summary scan."""
+    
+    LOG_CONTENT = (
+        "2025-07-10 12:00:00 - WiFi: GoTitansFC - Internet: 8/10 sites accessible\n"
+        "  (0.25s) - https://google.com: SUCCESS [dns=0.012 connect=0.020]\n"
+        "  (5.00s) - https://github.com: FAILED: <urlopen error timed out>\n"
+        "Hostname: test-host\n"
+        "\n"
+        "  2025-07-10 12:01:00 - WiFi:  GoTitansFC  - Internet: 0/0 sites accessible\r\n"
+        "2025-07-10 12:02:00 - WiFi: Other Network - Internet: 5/10 sites accessible\n"
+        "note 2025-07-10 12:03:00 - WiFi: GoTitansFC - Internet: 1/10 sites accessible\n"
+        "2025-07-10 12:04 - WiFi: GoTitansFC - Internet: 1/10 sites accessible\n"
+        "2025-07-10 12:05:00 - WiFi: Go-Titans - Internet: 1/10 sites accessible\n"
+        "2025-07-10 12:06:00 - WiFi: GoTitansFC - Internet: 10/10 sites accessible"
+    )
+    
+    @pytest.mark.parametrize('wifi_filter', ['GoTitansFC', 'Other Network', 'Go-Titans'])
+    def test_matches_line_by_line_parser(self, tmp_path, wifi_filter):
+        log_file = tmp_path / 'connectivity_log_20250710.txt'
+        log_file.write_bytes(self.LOG_CONTENT.encode('utf-8'))
+        
+        expected = []
+        for line in self.LOG_CONTENT.splitlines():
+            match = SUMMARY_PATTERN.match(line.strip())
+            if match and match.group(2).strip() == wifi_filter:
+                total_sites = int(match.group(4))
+                expected.append((datetime.datetime.strptime(match.group(1), '%Y-%m-%d %H:%M:%S'),
+                                 int(match.group(3)) / total_sites if total_sites > 0 else 0))
+        data = []
+        _parse_summary_file(str(log_file), wifi_filter, data)
+        
+        assert data == expected
+    
+    @patch('src.libs.plotter.log_parser._map_log_file', return_value=None)
+    def test_unmappable_file_uses_same_scanner(self, mock_map, tmp_path):
+        log_file = tmp_path / 'connectivity_log_20250710.txt'
+        log_file.write_bytes(self.LOG_CONTENT.encode('utf-8'))
+        expected = []
+        scan_summary_buffer(self.LOG_CONTENT.encode('utf-8'), 'GoTitansFC', expected)
+        
+        data = []
+        _parse_summary_file(str(log_file), 'GoTitansFC', data)
+        
+        assert data == expected
+        mock_map.assert_called_once()
+    
+    def test_scan_summary_buffer(self):
+        data = []
+        
+        scan_summary_buffer(self.LOG_CONTENT.encode('utf-8'), 'GoTitansFC', data)
+        
+        assert data == [
+            (datetime.datetime(2025, 7, 10, 12, 0, 0), 0.8),
+            (datetime.datetime(2025, 7, 10, 12, 1, 0), 0),
+            (datetime.datetime(2025, 7, 10, 12, 6, 0), 1.0)
+        ]
+    
+    def test_empty_file_falls_back(self, tmp_path):
+        log_file = tmp_path / 'connectivity_log_20250710.txt'
+        log_file.write_bytes(b'')
+        data = []
+        
+        _parse_summary_file(str(log_file), 'GoTitansFC', data)
+        
+        assert data == []
+
+
+class TestProcessPoolParsing:
+    """Test cases for parsing log files on a process pool (--jobs)."""
+    
+    def test_parse_file_chunk(self, tmp_path):
+        log_file = write_log(tmp_path, '20250710', ['2025-07-10 12:00:00', '2025-07-10 11:00:00'])
+        
+        timestamps, rates, error = parse_file_chunk(log_file, 'GoTitansFC')
+        
+        assert isinstance(rates, array)
+        assert timestamps == '2025-07-10 11:00:00\n2025-07-10 12:00:00'
+        assert list(rates) == [0.5, 0.5]
+        assert error is None
+    
+    def test_parse_file_chunk_reports_errors(self, tmp_path):
+        timestamps, rates, error = parse_file_chunk(str(tmp_path / 'missing.txt'), 'GoTitansFC')
+        
+        assert len(timestamps) == 0 and len(rates) == 0
+        assert 'missing.txt' in error
+    
+    @pytest.mark.parametrize('since', [None, datetime.datetime(2025, 7, 1)])
+    @patch('src.libs.plotter.log_parser.POOL_MIN_BYTES', 0)
+    @patch('builtins.print')
+    def test_jobs_match_serial_parsing(self, mock_print, tmp_path, since):
+        for day in range(1, 11):
+            write_log(tmp_path, f'202507{day:02d}', [f'2025-07-{day:02d} {hour:02d}:00:00' for hour in (0, 12, 23)])
+        
+        serial = parse_log_files(str(tmp_path), 'test-host', time_range_hours=72, since=since)
+        pooled = parse_log_files(str(tmp_path), 'test-host', time_range_hours=72, since=since, jobs=2)
+        
+        assert pooled == serial
+        assert len(serial) == (30 if since else 10)
+    
+    @patch('src.libs.plotter.log_parser.POOL_MIN_BYTES', 0)
+    @patch('builtins.print')
+    def test_jobs_with_cache(self, mock_print, tmp_path):
+        for day in range(1, 4):
+            write_log(tmp_path, f'202507{day:02d}', [f'2025-07-{day:02d} 12:00:00'])
+        cache_path = get_parse_cache_path(str(tmp_path), 'test-host')
+        
+        result = parse_log_files(str(tmp_path), 'test-host', time_range_hours=240,
+                                 cache=LogParseCache(cache_path), jobs=2)
+        
+        assert [ts.day for ts, _ in result] == [1, 2, 3]
+        assert len(LogParseCache(cache_path).files) == 3
+    
+    @patch('builtins.print')
+    def test_small_archives_skip_the_pool(self, mock_print, tmp_path):
+        for day in range(1, 4):
+            write_log(tmp_path, f'202507{day:02d}', [f'2025-07-{day:02d} 12:00:00'])
+        
+        with patch('src.libs.plotter.log_parser._parse_files_in_pool') as mock_pool:
+            result = parse_log_files(str(tmp_path), 'test-host', since=datetime.datetime(2025, 7, 1), jobs=4)
+        
+        mock_pool.assert_not_called()
+        assert len(result) == 3
+
+
+class TestStreamingReader:
+    """Test cases for the generator-based log reader."""
+    
+    @patch('builtins.print')
+    def test_iter_log_records_is_lazy_and_in_file_order(self, mock_print, tmp_path):
+        write_log(tmp_path, '20250709', ['2025-07-09 12:00:00', '2025-07-09 06:00:00'])
+        write_log(tmp_path, '20250710', ['2025-07-10 12:00:00'])
+        
+        with patch('src.libs.plotter.log_parser._parse_summary_file',
+                   wraps=_parse_summary_file) as mock_parse:
+            records = iter_log_records(str(tmp_path), 'test-host')
+            mock_parse.assert_not_called()
+            
+            assert next(records) == (datetime.datetime(2025, 7, 9, 12, 0), 0.5)
+            assert mock_parse.call_count == 1
+            assert [ts.hour for ts, _ in records] == [6, 12]
+            assert mock_parse.call_count == 2
+    
+    @patch('builtins.print')
+    def test_iter_log_records_pushes_down_time_filters(self, mock_print, tmp_path):
+        old_file = write_log(tmp_path, '20250701', ['2025-07-01 12:00:00'])
+        write_log(tmp_path, '20250709', ['2025-07-09 06:00:00', '2025-07-09 18:00:00'])
+        newer_file = write_log(tmp_path, '20250712', ['2025-07-12 12:00:00'])
+        
+        with patch('src.libs.plotter.log_parser._parse_summary_file',
+                   wraps=_parse_summary_file) as mock_parse:
+            records = list(iter_log_records(str(tmp_path), 'test-host',
+                                            since=datetime.datetime(2025, 7, 9, 12, 0),
+                                            until=datetime.datetime(2025, 7, 10, 0, 0)))
+        
+        assert records == [(datetime.datetime(2025, 7, 9, 18, 0), 0.5)]
+        parsed_files = [c[0][0] for c in mock_parse.call_args_list]
+        assert old_file not in parsed_files and newer_file not in parsed_files
+    
+    @patch('builtins.print')
+    def test_find_latest_timestamp(self, mock_print, tmp_path):
+        write_log(tmp_path, '20250709', ['2025-07-09 06:00:00', '2025-07-09 18:00:00'])
+        write_log(tmp_path, '20250710', [])
+        
+        assert find_latest_timestamp(str(tmp_path), 'test-host') == datetime.datetime(2025, 7, 9, 18, 0)
+        assert find_latest_timestamp(str(tmp_path), 'test-host',
+                                     until=datetime.datetime(2025, 7, 9, 12, 0)) == datetime.datetime(2025, 7, 9, 6, 0)
+        assert find_latest_timestamp(str(tmp_path), 'test-host', wifi_filter='Nope') is None
+    
+    @pytest.mark.parametrize('bounds', [
+        {},
+        {'until': datetime.datetime(2025, 7, 8, 12, 0)},
+        {'since': datetime.datetime(2025, 7, 8, 0, 0), 'until': datetime.datetime(2025, 7, 9, 0, 0)}
+    ])
+    @patch('builtins.print')
+    def test_stream_matches_parse_log_files(self, mock_print, tmp_path, bounds):
+        for day in range(1, 11):
+            write_log(tmp_path, f'202507{day:02d}', [f'2025-07-{day:02d} {hour:02d}:00:00' for hour in (0, 12, 23)])
+        
+        expected = parse_log_files(str(tmp_path), 'test-host', time_range_hours=36, **bounds)
+        streamed = stream_log_files(str(tmp_path), 'test-host', time_range_hours=36, **bounds)
+        
+        assert not isinstance(streamed, list)
+        assert list(streamed) == expected
+    
+    @patch('builtins.print')
+    def test_get_window_start(self, mock_print, tmp_path):
+        write_log(tmp_path, '20250710', ['2025-07-10 12:00:00'])
+        since = datetime.datetime(2025, 7, 9)
+        
+        assert get_window_start(str(tmp_path), 'test-host', time_range_hours=6) == datetime.datetime(2025, 7, 10, 6, 0)
+        assert get_window_start(str(tmp_path), 'test-host', time_range_hours=6,
+                                until=datetime.datetime(2025, 7, 9, 12, 0)) == datetime.datetime(2025, 7, 9, 6, 0)
+        assert get_window_start(str(tmp_path), 'test-host', since=since) == since
+        assert get_window_start(str(tmp_path), 'test-host', 'Nope') is None
+    
+    @patch('builtins.print')
+    def test_stream_without_data(self, mock_print, tmp_path):
+        write_log(tmp_path, '20250710', [])
+        
+        assert list(stream_log_files(str(tmp_path), 'test-host')) == []
+    
+    @patch('builtins.print')
+    def test_stream_saves_cache_when_exhausted(self, mock_print, tmp_path):
+        write_log(tmp_path, '20250710', ['2025-07-10 12:00:00'])
+        cache_path = get_parse_cache_path(str(tmp_path), 'test-host')
+        
+        records = stream_log_files(str(tmp_path), 'test-host', cache=LogParseCache(cache_path))
+        assert len(list(records)) == 1
+        
+        assert os.path.exists(cache_path)
+
+
+class TestSiteRecords:
+    """Test cases for parsing per-site detail lines into structured records."""
+    
+    LOG_CONTENT = (
+        "2025-07-10 12:00:00 - WiFi: GoTitansFC - Internet: 2/4 sites accessible\n"
+        "  (0.24s) - https://github.com: SUCCESS [dns=0.012 connect=0.020 tls=0.045 ttfb=0.110]\n"
+        "  (5.01s) - https://google.com: FAILED: <urlopen error timed out>\n"
+        "  (0.05s) - https://apple.com: FAILED: <urlopen error [Errno 8] nodename nor servname provided, or not known>\n"
+        "  (0.31s) - https://reddit.com: HTTP_301\n"
+        "Hostname: test-host\n"
+        "\n"
+        "2025-07-10 12:01:00 - WiFi: OtherNetwork - Internet: 1/1 sites accessible\n"
+        "  (0.20s) - https://github.com: SUCCESS\n"
+        "Hostname: test-host\n"
+        "\n"
+        "2025-07-10 12:02:00 - WiFi: GoTitansFC - Internet: 0/1 sites accessible\n"
+        "  (0.40s) - https://github.com: FAILED: HTTP Error 503: Service Unavailable\n"
+    )
+    
+    @pytest.mark.parametrize('status, expected', [
+        ('SUCCESS', ('success', None)),
+        ('HTTP_302', ('redirect', None)),
+        ('HTTP_204', ('non_200', None)),
+        ('HTTP_206', ('non_200', None)),
+        ('FAILED: <urlopen error timed out>', ('timeout', '<urlopen error timed out>')),
+        ('FAILED: The read operation timed out', ('timeout', 'The read operation timed out')),
+        ('FAILED: HTTP Error 500: Internal Server Error', ('http_error', 'HTTP Error 500: Internal Server Error')),
+        ('FAILED: <urlopen error [Errno 61] Connection refused>', ('connection', '<urlopen error [Errno 61] Connection refused>')),
+        ('FAILED: <urlopen error [Errno 51] Network is unreachable>', ('connection', '<urlopen error [Errno 51] Network is unreachable>')),
+        ('FAILED: <urlopen error [SSL: CERTIFICATE_VERIFY_FAILED] certificate verify failed>',
+         ('ssl', '<urlopen error [SSL: CERTIFICATE_VERIFY_FAILED] certificate verify failed>')),
+        ('FAILED: Too many redirects', ('other', 'Too many redirects')),
+        ('FAILED', ('other', 'FAILED')),
+    ])
+    def test_classify_status(self, status, expected):
+        assert classify_status(status) == expected
+    
+    def test_scan_entries_buffer(self):
+        data = []
+        site_records = []
+        
+        scan_entries_buffer(self.LOG_CONTENT.encode('utf-8'), 'GoTitansFC', data, site_records)
+        
+        first_round = datetime.datetime(2025, 7, 10, 12, 0)
+        assert data == [(first_round, 0.5), (datetime.datetime(2025, 7, 10, 12, 2), 0.0)]
+        assert site_records[:4] == [
+            SiteRecord(first_round, 'https://github.com', 0.24, 'success', None,
+                       {'dns': 0.012, 'connect': 0.02, 'tls': 0.045, 'ttfb': 0.11}),
+            SiteRecord(first_round, 'https://google.com', 5.01, 'timeout', '<urlopen error timed out>', {}),
+            SiteRecord(first_round, 'https://apple.com', 0.05, 'dns',
+                       '<urlopen error [Errno 8] nodename nor servname provided, or not known>', {}),
+            SiteRecord(first_round, 'https://reddit.com', 0.31, 'redirect', None, {})
+        ]
+        # The OtherNetwork round's detail line is not attributed to either GoTitansFC round
+        assert len(site_records) == 5
+        assert site_records[4].status_class == 'http_error'
+    
+    @patch('builtins.print')
+    def test_parse_log_entries_matches_parse_log_files(self, mock_print, tmp_path):
+        host_dir = tmp_path / 'test-host'
+        host_dir.mkdir()
+        (host_dir / 'connectivity_log_20250710.txt').write_text(self.LOG_CONTENT)
+        (host_dir / 'connectivity_log_20250701.txt').write_text(
+            "2025-07-01 12:00:00 - WiFi: GoTitansFC - Internet: 1/1 sites accessible\n"
+            "  (0.20s) - https://github.com: SUCCESS\n"
+        )
+        
+        data, site_records = parse_log_entries(str(tmp_path), 'test-host', time_range_hours=24)
+        
+        assert data == parse_log_files(str(tmp_path), 'test-host', time_range_hours=24)
+        assert len(site_records) == 5
+        assert all(record.timestamp >= datetime.datetime(2025, 7, 9, 12, 2) for record in site_records)
+        mock_print.assert_any_call("Found 2 data points and 5 site checks for WiFi network 'GoTitansFC'")
+    
+    @patch('builtins.print')
+    def test_parse_log_entries_with_bounds(self, mock_print, tmp_path):
+        host_dir = tmp_path / 'test-host'
+        host_dir.mkdir()
+        (host_dir / 'connectivity_log_20250710.txt').write_text(self.LOG_CONTENT)
+        
+        data, site_records = parse_log_entries(str(tmp_path), 'test-host',
+                                               since=datetime.datetime(2025, 7, 10, 12, 1),
+                                               until=datetime.datetime(2025, 7, 10, 13, 0))
+        
+        assert data == [(datetime.datetime(2025, 7, 10, 12, 2), 0.0)]
+        assert [record.url for record in site_records] == ['https://github.com']
+    
+    @patch('builtins.print')
+    def test_parse_log_entries_missing_host(self, mock_print, tmp_path):
+        assert parse_log_entries(str(tmp_path), 'missing-host') == ([], [])
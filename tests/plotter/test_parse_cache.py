@@ -0,0 +1,175 @@
+import pytest
+import datetime
+import json
+import os
+from unittest.mock import patch
+from src.libs.plotter.log_parser import parse_log_files
+from src.libs.plotter.parse_cache import LogParseCache, get_parse_cache_path, parse_summary_records, CACHE_VERSION
+
+
+ROUND_1 = (
+    "2025-07-10 10:00:00 - WiFi: GoTitansFC - Internet: 4/4 sites accessible\n"
+    "  (0.25s) - https://google.com: SUCCESS\n"
+    "Hostname: test-host\n\n"
+)
+ROUND_2 = (
+    "2025-07-10 10:01:00 - WiFi: GoTitansFC - Internet: 2/4 sites accessible\n"
+    "Hostname: test-host\n\n"
+)
+ROUND_3 = "2025-07-10 10:02:00 - WiFi: OtherNetwork - Internet: 1/4 sites accessible\n"
+
+
+@pytest.fixture
+def logs_dir(tmp_path):
+    host_dir = tmp_path / 'test-host'
+    host_dir.mkdir()
+    (host_dir / 'connectivity_log_20250710.txt').write_text(ROUND_1 + ROUND_2)
+    return tmp_path
+
+
+def log_path(logs_dir, date='20250710'):
+    return str(logs_dir / 'test-host' / f'connectivity_log_{date}.txt')
+
+
+class TestParseSummaryRecords:
+    """Test cases for parse_summary_records function."""
+    
+    def test_parses_summaries_and_returns_offset(self):
+        data = (ROUND_1 + ROUND_2).encode('utf-8')
+        
+        records, offset = parse_summary_records(data)
+        
+        assert records == [('2025-07-10 10:00:00', 'GoTitansFC', 4, 4), ('2025-07-10 10:01:00', 'GoTitansFC', 2, 4)]
+        assert offset == len(data)
+    
+    def test_stops_before_incomplete_line(self):
+        complete = ROUND_1.encode('utf-8')
+        data = complete + b"2025-07-10 10:01:00 - WiFi: GoTitansFC - Inter"
+        
+        records, offset = parse_summary_records(data)
+        
+        assert len(records) == 1
+        assert offset == len(complete)
+    
+    def test_starts_at_offset(self):
+        first = ROUND_1.encode('utf-8')
+        
+        records, offset = parse_summary_records(first + ROUND_2.encode('utf-8'), len(first))
+        
+        assert records == [('2025-07-10 10:01:00', 'GoTitansFC', 2, 4)]
+
+
+class TestLogParseCache:
+    """Test cases for LogParseCache class."""
+    
+    def test_unchanged_file_is_not_reopened(self, logs_dir):
+        cache = LogParseCache(get_parse_cache_path(str(logs_dir), 'test-host'))
+        first = cache.get_records(log_path(logs_dir))
+        
+        with patch('builtins.open') as mock_open:
+            assert cache.get_records(log_path(logs_dir)) == first
+            mock_open.assert_not_called()
+    
+    def test_only_appended_bytes_are_parsed(self, logs_dir):
+        cache = LogParseCache(get_parse_cache_path(str(logs_dir), 'test-host'))
+        cache.get_records(log_path(logs_dir))
+        offset = cache.files['connectivity_log_20250710.txt']['offset']
+        
+        with open(log_path(logs_dir), 'a') as f:
+            f.write(ROUND_3)
+        with patch('src.libs.plotter.parse_cache.parse_summary_records', wraps=parse_summary_records) as mock_parse:
+            records = cache.get_records(log_path(logs_dir))
+        
+        assert mock_parse.call_args[0][1] == offset
+        assert [record[0] for record in records] == ['2025-07-10 10:00:00', '2025-07-10 10:01:00', '2025-07-10 10:02:00']
+    
+    def test_truncated_file_is_reparsed(self, logs_dir):
+        cache = LogParseCache(get_parse_cache_path(str(logs_dir), 'test-host'))
+        cache.get_records(log_path(logs_dir))
+        
+        with open(log_path(logs_dir), 'w') as f:
+            f.write(ROUND_3)
+        
+        assert cache.get_records(log_path(logs_dir)) == [['2025-07-10 10:02:00', 'OtherNetwork', 1, 4]]
+    
+    def test_same_size_rewrite_is_reparsed(self, logs_dir):
+        cache = LogParseCache(get_parse_cache_path(str(logs_dir), 'test-host'))
+        cache.get_records(log_path(logs_dir))
+        
+        # e.g. git checkout of a corrected log: same size, different counts
+        with open(log_path(logs_dir), 'w') as f:
+            f.write(ROUND_1.replace('4/4', '1/4') + ROUND_2)
+        
+        assert [record[2] for record in cache.get_records(log_path(logs_dir))] == [1, 2]
+    
+    def test_larger_rewrite_is_reparsed(self, logs_dir):
+        cache = LogParseCache(get_parse_cache_path(str(logs_dir), 'test-host'))
+        cache.get_records(log_path(logs_dir))
+        
+        with open(log_path(logs_dir), 'w') as f:
+            f.write(ROUND_2 + ROUND_1 + ROUND_3)
+        
+        records = cache.get_records(log_path(logs_dir))
+        assert [record[0] for record in records] == ['2025-07-10 10:01:00', '2025-07-10 10:00:00', '2025-07-10 10:02:00']
+    
+    def test_save_and_reload(self, logs_dir):
+        cache_path = get_parse_cache_path(str(logs_dir), 'test-host')
+        cache = LogParseCache(cache_path)
+        records = cache.get_records(log_path(logs_dir))
+        
+        assert cache.save() is True
+        
+        reloaded = LogParseCache(cache_path)
+        assert reloaded.files == cache.files
+        with patch('builtins.open') as mock_open:
+            assert reloaded.get_records(log_path(logs_dir)) == records
+            mock_open.assert_not_called()
+    
+    def test_save_skips_write_when_unchanged(self, logs_dir):
+        cache_path = get_parse_cache_path(str(logs_dir), 'test-host')
+        cache = LogParseCache(cache_path)
+        
+        assert cache.save() is True
+        assert not os.path.exists(cache_path)
+    
+    def test_outdated_or_corrupt_cache_is_ignored(self, logs_dir):
+        cache_path = get_parse_cache_path(str(logs_dir), 'test-host')
+        os.makedirs(os.path.dirname(cache_path))
+        
+        with open(cache_path, 'w') as f:
+            json.dump({'version': CACHE_VERSION + 1, 'files': {'x': {}}}, f)
+        assert LogParseCache(cache_path).files == {}
+        
+        with open(cache_path, 'w') as f:
+            f.write('{not json')
+        assert LogParseCache(cache_path).files == {}
+    
+    def test_prune_forgets_deleted_files(self, logs_dir):
+        cache = LogParseCache(get_parse_cache_path(str(logs_dir), 'test-host'))
+        cache.get_records(log_path(logs_dir))
+        
+        cache.prune([])
+        
+        assert cache.files == {}
+
+
+class TestParseLogFilesWithCache:
+    """Test cases for parse_log_files with a LogParseCache."""
+    
+    @patch('builtins.print')
+    def test_cached_results_match_uncached(self, mock_print, logs_dir):
+        (logs_dir / 'test-host' / 'connectivity_log_20250709.txt').write_text(
+            "2025-07-09 23:59:00 - WiFi: GoTitansFC - Internet: 0/4 sites accessible\n" + ROUND_3
+        )
+        cache_path = get_parse_cache_path(str(logs_dir), 'test-host')
+        
+        expected = parse_log_files(str(logs_dir), 'test-host')
+        first = parse_log_files(str(logs_dir), 'test-host', cache=LogParseCache(cache_path))
+        second = parse_log_files(str(logs_dir), 'test-host', cache=LogParseCache(cache_path))
+        
+        assert expected == first == second == [
+            (datetime.datetime(2025, 7, 9, 23, 59, 0), 0.0),
+            (datetime.datetime(2025, 7, 10, 10, 0, 0), 1.0),
+            (datetime.datetime(2025, 7, 10, 10, 1, 0), 0.5)
+        ]
+        assert os.path.exists(cache_path)
@@ -3,7 +3,10 @@ from unittest.mock import patch, MagicMock
 import datetime
 import os
 import tempfile
-from src.libs.plotter.path_utils import setup_logs_directory, generate_output_filename, resolve_output_path
+from src.libs.plotter.path_utils import (
+    check_output_format, setup_logs_directory, generate_output_filename, get_output_format, resolve_output_format,
+    resolve_output_path
+)
 
 
 class TestSetupLogsDirectory:
@@ -189,6 +192,7 @@ class TestResolveOutputPath:
         args.time_range = 48
         args.interval = 20
         args.output_dir = '/auto/output'
+        args.format = None
         
         with patch('src.libs.plotter.path_utils.generate_output_filename') as mock_generate:
             mock_generate.return_value = '/auto/output/generated_file.png'
@@ -201,7 +205,8 @@ class TestResolveOutputPath:
                 'TestWiFi', 
                 48, 
                 20, 
-                '/auto/output'
+                '/auto/output',
+                'png'
             )
     
     def test_resolve_output_path_empty_output(self):
@@ -232,6 +237,7 @@ class TestResolveOutputPath:
         args.time_range = 72
         args.interval = 30
         args.output_dir = '/generated/output'
+        args.format = None
         
         with patch('src.libs.plotter.path_utils.generate_output_filename') as mock_generate:
             mock_generate.return_value = '/generated/output/false_file.png'
@@ -244,7 +250,8 @@ class TestResolveOutputPath:
                 'MyNetwork', 
                 72, 
                 30, 
-                '/generated/output'
+                '/generated/output',
+                'png'
             )
     
     def test_resolve_output_path_integration_with_real_args(self):
@@ -272,7 +279,8 @@ class TestResolveOutputPath:
                 'IntegrationWiFi',
                 36,
                 10,
-                '/integration/test'
+                '/integration/test',
+                'png'
             )
     
     def test_resolve_output_path_with_complex_output_path(self):
@@ -282,4 +290,51 @@ class TestResolveOutputPath:
         
         result = resolve_output_path(args)
         
-        assert result == '/very/long/path/to/output/directory/complex_filename_with_timestamp.png'
\ No newline at end of file
+        assert result == '/very/long/path/to/output/directory/complex_filename_with_timestamp.png'
+
+
+class TestOutputFormat:
+    """Test cases for get_output_format and resolve_output_format functions."""
+    
+    @pytest.mark.parametrize('output_format, output_file, expected', [
+        (None, None, 'png'),
+        (None, 'plot.png', 'png'),
+        (None, 'plot.SVG', 'svg'),
+        (None, 'plot.htm', 'html'),
+        ('svg', 'plot.png', 'svg'),
+        ('html', None, 'html')
+    ])
+    def test_get_output_format(self, output_format, output_file, expected):
+        assert get_output_format(output_format, output_file) == expected
+    
+    @pytest.mark.parametrize('output_format, output_file', [
+        (None, 'plot.svg'),
+        ('svg', 'plot.SVG'),
+        ('html', 'plot.htm'),
+        ('svg', 'plot'),
+        ('png', None)
+    ])
+    def test_check_output_format_matches(self, output_format, output_file):
+        check_output_format(output_format, output_file)
+    
+    @pytest.mark.parametrize('output_format, output_file', [
+        ('svg', 'plot.png'),
+        ('html', 'plot.svg'),
+        ('png', 'plot.html')
+    ])
+    def test_check_output_format_mismatch(self, output_format, output_file):
+        with pytest.raises(ValueError, match=f"is not a {output_format} file"):
+            check_output_format(output_format, output_file)
+    
+    def test_generated_filename_extension(self, tmp_path):
+        args = MagicMock()
+        args.output = None
+        args.hostname = 'test-host'
+        args.wifi_network = 'TestWiFi'
+        args.time_range = 24
+        args.interval = 15
+        args.output_dir = str(tmp_path)
+        args.format = 'svg'
+        
+        assert resolve_output_format(args) == 'svg'
+        assert resolve_output_path(args).endswith('.svg')
@@ -0,0 +1,91 @@
+import pytest
+import datetime
+import os
+from unittest.mock import patch
+from src.libs.plotter.render_cache import RenderCache, copy_cached_render, get_render_cache_dir, render_cache_key
+
+
+DATA = [
+    (datetime.datetime(2025, 7, 10, 12, 15), 1.0, "measured"),
+    (datetime.datetime(2025, 7, 10, 12, 30), 0.0, "missing"),
+    (datetime.datetime(2025, 7, 10, 12, 45), 0.75, "measured")
+]
+
+
+def write_png(path, size=10):
+    with open(path, 'wb') as f:
+        f.write(b'\x89PNG' + b'\0' * (size - 4))
+    return str(path)
+
+
+class TestRenderCacheKey:
+    """Test cases for render_cache_key function."""
+    
+    def test_same_chart_same_key(self):
+        assert render_cache_key(DATA, 'host', 'wifi', 15) == render_cache_key(list(DATA), 'host', 'wifi', 15)
+    
+    @pytest.mark.parametrize('changes', [
+        {'aggregated_data': DATA[:2]},
+        {'aggregated_data': DATA[:2] + [(DATA[2][0], 0.5, "measured")]},
+        {'hostname': 'other-host'},
+        {'wifi_network': 'OtherNetwork'},
+        {'interval_minutes': 30},
+        {'style': 0}
+    ])
+    def test_key_covers_data_and_parameters(self, changes):
+        arguments = dict(aggregated_data=DATA, hostname='host', wifi_network='wifi', interval_minutes=15)
+        
+        assert render_cache_key(**{**arguments, **changes}) != render_cache_key(**arguments)
+    
+    def test_cache_dir(self):
+        assert get_render_cache_dir('/logs') == os.path.join('/logs', '.cache', 'renders')
+
+
+class TestRenderCache:
+    """Test cases for RenderCache class."""
+    
+    def test_put_and_get(self, tmp_path):
+        cache = RenderCache(str(tmp_path / 'renders'))
+        png_file = write_png(tmp_path / 'plot.png')
+        
+        assert cache.get('abc') is None
+        cached = cache.put('abc', png_file)
+        
+        assert cache.get('abc') == cached
+        with open(cached, 'rb') as f:
+            assert f.read().startswith(b'\x89PNG')
+    
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = RenderCache(str(tmp_path / 'renders'), max_bytes=25)
+        png_file = write_png(tmp_path / 'plot.png')
+        
+        cache.put('first', png_file)
+        cache.put('second', png_file)
+        os.utime(cache.get('first'), ns=(1, 1))
+        os.utime(cache.get('second'), ns=(2, 2))
+        cache.get('first')  # Now the most recently used
+        cache.put('third', png_file)
+        
+        assert cache.get('second') is None
+        assert cache.get('first') is not None
+        assert cache.get('third') is not None
+    
+    @patch('builtins.print')
+    def test_put_failure_is_reported(self, mock_print, tmp_path):
+        cache = RenderCache(str(tmp_path / 'renders'))
+        
+        assert cache.put('abc', str(tmp_path / 'missing.png')) is None
+        assert mock_print.call_args[0][0].startswith("Could not cache plot")
+
+
+class TestCopyCachedRender:
+    """Test cases for copy_cached_render function."""
+    
+    @patch('builtins.print')
+    def test_copies_to_output(self, mock_print, tmp_path):
+        cached = write_png(tmp_path / 'cached.png')
+        output_file = str(tmp_path / 'out.png')
+        
+        assert copy_cached_render(cached, output_file) == output_file
+        assert os.path.getsize(output_file) == 10
+        mock_print.assert_called_with(f"Plot saved to: {output_file}")
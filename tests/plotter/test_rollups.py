@@ -0,0 +1,204 @@
+import pytest
+import datetime
+import os
+import threading
+from unittest.mock import patch
+from src.libs.plotter.data_aggregator import aggregate_by_interval, aggregate_latency_by_interval
+from src.libs.plotter.log_parser import parse_log_entries, parse_log_files
+from src.libs.plotter.rollups import RollupStore, RollupWindow, get_rollup_path, get_rollup_resolution, open_rollups
+
+
+def write_rounds(logs_dir, date, rounds, mode='w'):
+    """Write (timestamp, wifi network, accessible sites) rounds to a host's log file."""
+    host_dir = logs_dir / 'test-host'
+    host_dir.mkdir(exist_ok=True)
+    path = host_dir / f'connectivity_log_{date}.txt'
+    with open(path, mode) as f:
+        for timestamp, wifi_network, success_count in rounds:
+            f.write(f"{timestamp:%Y-%m-%d %H:%M:%S} - WiFi: {wifi_network} - Internet: {success_count}/4 sites accessible\n"
+                    f"  ({0.1 + timestamp.minute / 100:.2f}s) - https://google.com: SUCCESS\n"
+                    f"  ({0.5 + timestamp.hour / 10:.2f}s) - https://github.com: HTTP_301\n"
+                    "  (5.00s) - https://apple.com: FAILED: <urlopen error timed out>\n"
+                    "Hostname: test-host\n\n")
+    return str(path)
+
+
+def make_rounds(start, count, step_minutes=7, wifi_network='GoTitansFC'):
+    return [(start + datetime.timedelta(minutes=step_minutes * i), wifi_network, i % 5) for i in range(count)]
+
+
+def assert_same_aggregation(actual, expected):
+    assert [(end, status) for end, _, status in actual] == [(end, status) for end, _, status in expected]
+    assert [rate for _, rate, _ in actual] == pytest.approx([rate for _, rate, _ in expected])
+
+
+@pytest.fixture
+def logs_dir(tmp_path):
+    write_rounds(tmp_path, '20250710', make_rounds(datetime.datetime(2025, 7, 10, 0, 3), 200))
+    write_rounds(tmp_path, '20250711', make_rounds(datetime.datetime(2025, 7, 11, 0, 1), 150)
+                 + make_rounds(datetime.datetime(2025, 7, 11, 0, 2), 20, wifi_network='OtherNetwork'))
+    return tmp_path
+
+
+class TestGetRollupResolution:
+    """Test cases for get_rollup_resolution function."""
+
+    @pytest.mark.parametrize('interval_minutes, resolution', [
+        (1, 1), (7, 1), (15, 15), (45, 15), (60, 60), (120, 60), (90, 15), (1440, 1440), (10080, 1440)
+    ])
+    def test_coarsest_dividing_resolution(self, interval_minutes, resolution):
+        assert get_rollup_resolution(interval_minutes) == resolution
+
+
+class TestRollupStore:
+    """Test cases for RollupStore class."""
+
+    @patch('builtins.print')
+    def test_path_is_in_cache_directory(self, mock_print):
+        assert get_rollup_path('/logs', 'host') == os.path.join('/logs', '.cache', 'rollups_host.db')
+
+    @pytest.mark.parametrize('interval_minutes', [1, 7, 15, 45, 60, 120, 1440])
+    @patch('builtins.print')
+    def test_matches_raw_aggregation(self, mock_print, logs_dir, interval_minutes):
+        since = datetime.datetime(2025, 7, 10, 6, 10)
+        until = datetime.datetime(2025, 7, 11, 13, 59)
+        raw = parse_log_files(str(logs_dir), 'test-host', 'GoTitansFC', since=since, until=until)
+
+        window = open_rollups(str(logs_dir), 'test-host').window('GoTitansFC', since=since, until=until)
+
+        assert isinstance(window, RollupWindow)
+        assert_same_aggregation(aggregate_by_interval(window, interval_minutes),
+                                aggregate_by_interval(raw, interval_minutes))
+
+    @patch('builtins.print')
+    def test_time_range_ends_at_latest_round(self, mock_print, logs_dir):
+        raw = parse_log_files(str(logs_dir), 'test-host', 'GoTitansFC', time_range_hours=6)
+
+        window = open_rollups(str(logs_dir), 'test-host').window('GoTitansFC', time_range_hours=6)
+
+        assert_same_aggregation(aggregate_by_interval(window, 15), aggregate_by_interval(raw, 15))
+
+    @pytest.mark.parametrize('interval_minutes', [1, 15, 60])
+    @patch('builtins.print')
+    def test_cuts_window_edges_to_the_second(self, mock_print, tmp_path, interval_minutes):
+        # Rounds 20 seconds apart, so the window starts partway through a minute
+        write_rounds(tmp_path, '20250710', [(datetime.datetime(2025, 7, 10, 23, 0, 40) + datetime.timedelta(seconds=20 * i),
+                                             'GoTitansFC', i % 5) for i in range(400)])
+        raw = parse_log_files(str(tmp_path), 'test-host', 'GoTitansFC', time_range_hours=1)
+
+        window = open_rollups(str(tmp_path), 'test-host').window('GoTitansFC', time_range_hours=1)
+
+        assert raw[0][0].second == 40
+        assert_same_aggregation(aggregate_by_interval(window, interval_minutes),
+                                aggregate_by_interval(raw, interval_minutes))
+
+    @patch('builtins.print')
+    def test_update_only_adds_appended_rounds(self, mock_print, logs_dir):
+        store = RollupStore(get_rollup_path(str(logs_dir), 'test-host'))
+        log_files = sorted(str(path) for path in (logs_dir / 'test-host').iterdir())
+
+        assert store.update(log_files) == 370
+        assert store.update(log_files) == 0
+
+        write_rounds(logs_dir, '20250711', make_rounds(datetime.datetime(2025, 7, 11, 20), 3), mode='a')
+        assert store.update(log_files) == 3
+        store.close()
+
+        # A fresh store built from scratch holds the same rollups
+        since = datetime.datetime(2025, 7, 10)
+        rebuilt = RollupStore(str(logs_dir / 'rebuilt.db'))
+        rebuilt.update(log_files)
+        assert_same_aggregation(aggregate_by_interval(open_rollups(str(logs_dir), 'test-host').window('GoTitansFC', since=since), 60),
+                                aggregate_by_interval(rebuilt.window('GoTitansFC', since=since), 60))
+
+    @patch('builtins.print')
+    def test_truncated_file_rebuilds_store(self, mock_print, logs_dir):
+        store = open_rollups(str(logs_dir), 'test-host')
+        log_file = write_rounds(logs_dir, '20250711', make_rounds(datetime.datetime(2025, 7, 11, 0, 1), 2))
+
+        assert store.update(sorted(str(path) for path in (logs_dir / 'test-host').iterdir())) == 202
+
+        result = aggregate_by_interval(store.window('GoTitansFC', since=datetime.datetime(2025, 7, 11)), 1440)
+        assert result == [(datetime.datetime(2025, 7, 12), pytest.approx(0.125), "measured")]
+        assert os.path.exists(log_file)
+
+    @patch('builtins.print')
+    def test_same_size_rewrite_rebuilds_store(self, mock_print, logs_dir):
+        store = open_rollups(str(logs_dir), 'test-host')
+        log_file = str(logs_dir / 'test-host' / 'connectivity_log_20250711.txt')
+        with open(log_file) as f:
+            content = f.read()
+        size = os.path.getsize(log_file)
+
+        # e.g. git checkout of a corrected log: same size, different counts
+        with open(log_file, 'w') as f:
+            f.write(content.replace('Internet: 0/4', 'Internet: 4/4'))
+        assert os.path.getsize(log_file) == size
+
+        log_files = sorted(str(path) for path in (logs_dir / 'test-host').iterdir())
+        assert store.update(log_files) == 370
+        rebuilt = RollupStore(str(logs_dir / 'rebuilt.db'))
+        rebuilt.update(log_files)
+        since = datetime.datetime(2025, 7, 10)
+        assert_same_aggregation(aggregate_by_interval(store.window('GoTitansFC', since=since), 60),
+                                aggregate_by_interval(rebuilt.window('GoTitansFC', since=since), 60))
+
+    @patch('builtins.print')
+    def test_concurrent_updates_add_rounds_once(self, mock_print, logs_dir):
+        path = get_rollup_path(str(logs_dir), 'test-host')
+        log_files = sorted(str(path) for path in (logs_dir / 'test-host').iterdir())
+        first = RollupStore(path)
+        threads = []
+        results = []
+
+        def update_in_other_process():
+            other = RollupStore(path)
+            results.append(other.update(log_files))
+            other.close()
+
+        fold_appended = first._fold_appended
+
+        def fold_while_other_updates(files):
+            # The other run starts while this one holds the write lock, so it waits and then finds nothing new
+            thread = threading.Thread(target=update_in_other_process)
+            threads.append(thread)
+            thread.start()
+            thread.join(0.2)
+            assert thread.is_alive()
+            return fold_appended(files)
+
+        with patch.object(first, '_fold_appended', side_effect=fold_while_other_updates):
+            assert first.update(log_files) == 370
+        threads[0].join()
+
+        assert results == [0]
+        assert first.connection.execute("SELECT SUM(count) FROM rollups WHERE resolution = 1440").fetchone()[0] == 370
+
+    @patch('builtins.print')
+    def test_unknown_network(self, mock_print, logs_dir):
+        window = open_rollups(str(logs_dir), 'test-host').window('NoSuchNetwork')
+
+        assert aggregate_by_interval(window, 15) == []
+
+
+class TestLatencyRollups:
+    """Test cases for latency histograms kept in the rollups."""
+
+    @pytest.mark.parametrize('interval_minutes', [15, 45, 60, 120, 1440])
+    @patch('builtins.print')
+    def test_matches_raw_site_records(self, mock_print, logs_dir, interval_minutes):
+        since = datetime.datetime(2025, 7, 10)
+        _, site_records = parse_log_entries(str(logs_dir), 'test-host', 'GoTitansFC', since=since)
+
+        window = open_rollups(str(logs_dir), 'test-host').window('GoTitansFC', since=since)
+        latencies = aggregate_latency_by_interval(window, interval_minutes)
+
+        assert latencies == aggregate_latency_by_interval(site_records, interval_minutes)
+        assert sorted(latencies) == ['https://github.com', 'https://google.com']
+
+    @patch('builtins.print')
+    def test_interval_must_be_multiple_of_fifteen_minutes(self, mock_print, logs_dir):
+        window = open_rollups(str(logs_dir), 'test-host').window('GoTitansFC')
+
+        with pytest.raises(ValueError):
+            aggregate_latency_by_interval(window, 7)
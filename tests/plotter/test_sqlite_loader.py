@@ -0,0 +1,119 @@
+import pytest
+import datetime
+import sqlite3
+from unittest.mock import patch
+from src.libs.checker.sqlite_sink import open_results_database, write_round
+from src.libs.plotter.sqlite_loader import load_success_rates, load_phase_timings
+
+
+def make_round(local, utc, wifi, statuses):
+    return {
+        'timestamp': local,
+        'timestamp_utc': utc,
+        'timezone_local': 'EDT GMT-0400',
+        'wifi_network': wifi,
+        'checks': [
+            {'url': f'https://site{i}.com', 'status': status, 'duration': 0.1,
+             'phases': {'dns': 0.01, 'connect': 0.02, 'tls': None, 'ttfb': 0.03} if status == 'SUCCESS' else {}}
+            for i, status in enumerate(statuses)
+        ]
+    }
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / 'connectivity.db')
+    connection = open_results_database(path)
+    write_round(connection, make_round('2025-07-08 08:00:00', '2025-07-08 12:00:00', 'GoTitansFC',
+                                       ['SUCCESS', 'SUCCESS']), hostname='test-host')
+    write_round(connection, make_round('2025-07-10 10:00:00', '2025-07-10 14:00:00', 'GoTitansFC',
+                                       ['SUCCESS', 'FAILED: timed out']), hostname='test-host')
+    write_round(connection, make_round('2025-07-10 10:01:00', '2025-07-10 14:01:00', 'OtherNetwork',
+                                       ['SUCCESS', 'SUCCESS']), hostname='test-host')
+    write_round(connection, make_round('2025-07-10 10:02:00', '2025-07-10 14:02:00', 'GoTitansFC',
+                                       ['SUCCESS', 'SUCCESS']), hostname='other-host')
+    write_round(connection, make_round('2025-07-10 10:05:00', '2025-07-10 14:05:00', 'GoTitansFC',
+                                       ['FAILED: timed out', 'FAILED: timed out']), hostname='test-host')
+    connection.close()
+    return path
+
+
+class TestLoadSuccessRates:
+    """Test cases for load_success_rates function."""
+    
+    @patch('builtins.print')
+    def test_filters_by_hostname_wifi_and_time_range(self, mock_print, db_path):
+        result = load_success_rates(db_path, 'test-host', 'GoTitansFC', time_range_hours=24)
+        
+        # The 2025-07-08 round is more than 24 hours before the newest one
+        assert result == [
+            (datetime.datetime(2025, 7, 10, 10, 0, 0), 0.5),
+            (datetime.datetime(2025, 7, 10, 10, 5, 0), 0.0)
+        ]
+        mock_print.assert_called_once_with("Found 2 data points for WiFi network 'GoTitansFC'")
+    
+    @patch('builtins.print')
+    def test_default_time_range(self, mock_print, db_path):
+        result = load_success_rates(db_path, 'test-host')
+        
+        assert [rate for _, rate in result] == [1.0, 0.5, 0.0]
+    
+    @patch('builtins.print')
+    def test_unknown_network(self, mock_print, db_path):
+        assert load_success_rates(db_path, 'test-host', 'NoSuchNetwork') == []
+        mock_print.assert_called_once_with("Found 0 data points for WiFi network 'NoSuchNetwork'")
+    
+    @patch('builtins.print')
+    def test_missing_database(self, mock_print, tmp_path):
+        missing = str(tmp_path / 'missing.db')
+        
+        assert load_success_rates(missing, 'test-host') == []
+        mock_print.assert_called_once_with(f"Error: SQLite database not found: {missing}")
+    
+    @patch('builtins.print')
+    def test_database_without_tables(self, mock_print, tmp_path):
+        path = str(tmp_path / 'empty.db')
+        sqlite3.connect(path).close()
+        
+        assert load_success_rates(path, 'test-host') == []
+        assert mock_print.call_args_list[0][0][0].startswith(f"Error reading {path}: ")
+
+
+class TestLoadPhaseTimings:
+    """Test cases for load_phase_timings function."""
+    
+    @patch('builtins.print')
+    def test_returns_phases_of_matching_checks(self, mock_print, db_path):
+        result = load_phase_timings(db_path, 'test-host', 'GoTitansFC', time_range_hours=24)
+        
+        # Failed checks recorded no phases and are left out
+        assert result == [
+            (datetime.datetime(2025, 7, 10, 10, 0, 0), 'https://site0.com', {'dns': 0.01, 'connect': 0.02, 'ttfb': 0.03})
+        ]
+        mock_print.assert_called_once_with("Found 1 phase timings for WiFi network 'GoTitansFC'")
+    
+    @patch('builtins.print')
+    def test_since_until_window(self, mock_print, db_path):
+        result = load_phase_timings(db_path, 'test-host', 'GoTitansFC',
+                                    since=datetime.datetime(2025, 7, 8, 0, 0), until=datetime.datetime(2025, 7, 9, 0, 0))
+        
+        assert [(ts, url) for ts, url, _ in result] == [
+            (datetime.datetime(2025, 7, 8, 8, 0, 0), 'https://site0.com'),
+            (datetime.datetime(2025, 7, 8, 8, 0, 0), 'https://site1.com')
+        ]
+
+
+class TestLoadWindow:
+    """Test cases for since/until bounds in load_success_rates."""
+    
+    @patch('builtins.print')
+    def test_since_only(self, mock_print, db_path):
+        result = load_success_rates(db_path, 'test-host', time_range_hours=1, since=datetime.datetime(2025, 7, 8, 0, 0))
+        
+        assert [rate for _, rate in result] == [1.0, 0.5, 0.0]
+    
+    @patch('builtins.print')
+    def test_until_uses_time_range_before_it(self, mock_print, db_path):
+        result = load_success_rates(db_path, 'test-host', time_range_hours=1, until=datetime.datetime(2025, 7, 10, 10, 3, 0))
+        
+        assert result == [(datetime.datetime(2025, 7, 10, 10, 0, 0), 0.5)]
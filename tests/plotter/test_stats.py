@@ -0,0 +1,98 @@
+import pytest
+import datetime
+import json
+from src.libs.plotter.log_parser import SiteRecord
+from src.libs.plotter.stats import compute_stats, format_duration, format_stats, site_failure_shares
+
+
+START = datetime.datetime(2025, 7, 10, 12, 0)
+
+# One round per minute: up for 10 minutes, down for 5, up for 5
+RATES = [1.0] * 10 + [0.0] * 5 + [1.0] * 5
+DATA = [(START + datetime.timedelta(minutes=minute), rate) for minute, rate in enumerate(RATES)]
+AGGREGATED = [
+    (datetime.datetime(2025, 7, 10, 12, 15), 10 / 15, "measured"),
+    (datetime.datetime(2025, 7, 10, 12, 30), 1.0, "measured"),
+    (datetime.datetime(2025, 7, 10, 12, 45), 0.0, "missing")
+]
+
+
+def site_record(url, status_class):
+    return SiteRecord(START, url, 0.1, status_class, None, {})
+
+
+class TestSiteFailureShares:
+    """Test cases for site_failure_shares function."""
+
+    def test_counts_checks_other_than_success_as_failed(self):
+        records = [
+            site_record('https://github.com', 'success'),
+            site_record('https://github.com', 'timeout'),
+            site_record('https://google.com', 'redirect'),
+            site_record('https://google.com', 'non_200'),
+            site_record('https://google.com', 'success')
+        ]
+
+        shares = site_failure_shares(records)
+
+        # Most failing first
+        assert list(shares) == ['https://google.com', 'https://github.com']
+        assert shares['https://github.com'] == {'checks': 2, 'failed': 1, 'failure_share': 0.5}
+        assert shares['https://google.com'] == {'checks': 3, 'failed': 2, 'failure_share': pytest.approx(2 / 3)}
+
+    def test_empty(self):
+        assert site_failure_shares([]) == {}
+
+
+class TestComputeStats:
+    """Test cases for compute_stats function."""
+
+    def test_availability_and_outages(self):
+        stats = compute_stats(DATA, AGGREGATED, 15)
+
+        assert stats['rounds'] == 20
+        assert stats['start'] == '2025-07-10T12:00:00'
+        assert stats['outages'] == 1
+        assert stats['longest_outage'] == {
+            'start': '2025-07-10T12:10:00', 'end': '2025-07-10T12:15:00', 'duration': 300.0, 'ongoing': False
+        }
+        assert stats['downtime'] == 300.0
+        assert stats['availability'] == pytest.approx(14 / 19)
+        assert stats['mean_success_rate'] == 0.75
+        assert stats['intervals'] == 3
+        assert stats['missing_intervals'] == 1
+        assert stats['worst_interval_success_rate'] == pytest.approx(10 / 15)
+
+    def test_json_ready(self):
+        stats = compute_stats(DATA, AGGREGATED, 15, [site_record('https://github.com', 'dns')])
+
+        assert json.loads(json.dumps(stats))['sites']['https://github.com']['failed'] == 1
+
+    def test_no_outages(self):
+        stats = compute_stats(DATA[:10], AGGREGATED[:1], 15)
+
+        assert stats['outages'] == 0
+        assert stats['longest_outage'] is None
+        assert stats['availability'] == 1.0
+
+
+class TestFormatStats:
+    """Test cases for format_stats and format_duration functions."""
+
+    @pytest.mark.parametrize('seconds, expected', [
+        (None, 'n/a'),
+        (45, '45s'),
+        (300, '5m'),
+        (3 * 86400 + 3600 + 60 * 15, '3d 1h 15m'),
+        (7200, '2h')
+    ])
+    def test_format_duration(self, seconds, expected):
+        assert format_duration(seconds) == expected
+
+    def test_report(self):
+        report = format_stats(compute_stats(DATA, AGGREGATED, 15, [site_record('https://github.com', 'timeout')]))
+
+        assert "Availability: 73.68% (14m up, 5m down)" in report
+        assert "Outages: 1, longest 5m from 2025-07-10T12:10:00, MTTR 5m, MTBF 14m" in report
+        assert "Intervals: 3 15-minute intervals, 1 without data, worst 66.67% successful" in report
+        assert "  https://github.com: 100.00% of 1 checks" in report
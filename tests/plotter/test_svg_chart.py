@@ -0,0 +1,126 @@
+import pytest
+import datetime
+import os
+import subprocess
+import sys
+import xml.etree.ElementTree as ET
+from unittest.mock import patch
+from src.libs.plotter.svg_chart import (
+    FAILURE_COLOR, SUCCESS_COLOR, bar_path, format_tick_labels, get_time_ticks, plot_success_rates_svg, render_svg
+)
+
+
+SVG_NS = '{http://www.w3.org/2000/svg}'
+
+DATA = [
+    (datetime.datetime(2025, 7, 10, 12, 15), 1.0, "measured"),
+    (datetime.datetime(2025, 7, 10, 12, 30), 0.0, "missing"),
+    (datetime.datetime(2025, 7, 10, 12, 45), 0.75, "measured")
+]
+
+
+def paths_by_fill(svg):
+    root = ET.fromstring(svg)
+    return {path.get('fill'): path for path in root.iter(f'{SVG_NS}path')}
+
+
+class TestRenderSvg:
+    """Test cases for render_svg function."""
+
+    def test_one_path_per_series(self):
+        paths = paths_by_fill(render_svg(DATA, 'test-host', 'TestWiFi', 15))
+
+        assert set(paths) == {FAILURE_COLOR, SUCCESS_COLOR, 'none'}
+        # Two measured intervals, one missing interval
+        assert paths[FAILURE_COLOR].get('d').count('M') == 2
+        assert paths[SUCCESS_COLOR].get('d').count('M') == 2
+        assert paths['none'].get('d').count('M') == 1
+        assert paths['none'].get('stroke-dasharray')
+
+    def test_stacked_heights(self):
+        paths = paths_by_fill(render_svg(DATA[2:], 'test-host', 'TestWiFi', 15))
+
+        def height(path):
+            _, bottom, top = path.get('d').replace('M', ' ').replace('V', ' ').replace('h', ' ').split()[:3]
+            return float(bottom) - float(top)
+
+        # 25% failed, stacked under 75% succeeded
+        assert height(paths[SUCCESS_COLOR]) == pytest.approx(3 * height(paths[FAILURE_COLOR]), abs=0.02)
+
+    def test_title_legend_and_escaping(self):
+        svg = render_svg(DATA, 'test-host', 'Tom & Jerry <5G>', 30)
+        texts = [text.text for text in ET.fromstring(svg).iter(f'{SVG_NS}text')]
+
+        assert 'Internet Connectivity Success/Failure Rate - test-host (Tom & Jerry <5G>)' in texts
+        assert '30-minute intervals' in texts
+        for label in ('Connection Failed', 'Connection Success', 'No Data Recorded', 'Time', 'Rate (%)'):
+            assert label in texts
+
+    def test_only_missing_data(self):
+        paths = paths_by_fill(render_svg([DATA[1]], 'test-host', 'TestWiFi', 15))
+
+        assert set(paths) == {'none'}
+
+
+class TestTimeTicks:
+    """Test cases for get_time_ticks and format_tick_labels functions."""
+
+    def test_every_three_hours(self):
+        ticks = get_time_ticks(datetime.datetime(2025, 7, 9, 22, 10), datetime.datetime(2025, 7, 10, 7, 50))
+
+        assert format_tick_labels(ticks) == ['07/10 00:00', '03:00', '07/10 06:00']
+
+    def test_coarser_for_long_ranges(self):
+        ticks = get_time_ticks(datetime.datetime(2025, 1, 1), datetime.datetime(2025, 12, 31))
+
+        assert len(ticks) <= 32
+        assert all(tick.hour == 0 for tick in ticks)
+
+    def test_bar_path(self):
+        assert bar_path([(10, 100, 40)], 5) == 'M10.00 100.00V40.00h5.00V100.00Z'
+
+
+class TestPlotSuccessRatesSvg:
+    """Test cases for plot_success_rates_svg function."""
+
+    @patch('builtins.print')
+    def test_writes_svg(self, mock_print, tmp_path):
+        output_file = str(tmp_path / 'plot.svg')
+
+        assert plot_success_rates_svg(DATA, 'test-host', 'TestWiFi', 15, output_file) == output_file
+        with open(output_file, encoding='utf-8') as f:
+            assert f.read().startswith('<svg ')
+        mock_print.assert_called_with(f"Plot saved to: {output_file}")
+
+    @patch('builtins.print')
+    def test_writes_html_page(self, mock_print, tmp_path):
+        output_file = str(tmp_path / 'plot.html')
+
+        plot_success_rates_svg(DATA, 'test-host', 'TestWiFi', 15, output_file)
+
+        with open(output_file, encoding='utf-8') as f:
+            content = f.read()
+        assert content.startswith('<!DOCTYPE html>')
+        assert '<svg ' in content
+
+    @patch('builtins.print')
+    def test_format_overrides_extension(self, mock_print, tmp_path):
+        output_file = str(tmp_path / 'plot')
+
+        plot_success_rates_svg(DATA, 'test-host', 'TestWiFi', 15, output_file, 'html')
+
+        with open(output_file, encoding='utf-8') as f:
+            assert f.read().startswith('<!DOCTYPE html>')
+
+    @patch('builtins.print')
+    def test_no_data(self, mock_print, tmp_path):
+        assert plot_success_rates_svg([], 'test-host', 'TestWiFi', 15, str(tmp_path / 'plot.svg')) is None
+        mock_print.assert_called_once_with("No data to plot")
+
+    def test_no_third_party_imports(self):
+        code = ("import sys; import src.libs.plotter.svg_chart; "
+                "print(' '.join(m for m in ('matplotlib', 'numpy') if m in sys.modules))")
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True,
+                                cwd=os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+        assert result.stdout.strip() == ''